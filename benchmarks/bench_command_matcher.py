@@ -0,0 +1,83 @@
+"""
+Бенчмарк зіставлення голосових команд.
+
+Порівнює лінійний пошук підрядка (попередня реалізація CommandHandler)
+з автоматом PhraseMatcher при 10, 1 000 та 10 000 зареєстрованих фраз.
+
+Запуск: python benchmarks/bench_command_matcher.py
+"""
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from alpha_mini_pkg.core.command_matcher import PhraseMatcher  # noqa: E402
+
+PHRASE_COUNTS = (10, 1_000, 10_000)
+UTTERANCES = 2_000
+SEED = 42
+
+
+def random_word(rng: random.Random) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9)))
+
+
+def build_phrases(rng: random.Random, count: int) -> list:
+    phrases = set()
+    while len(phrases) < count:
+        phrases.add(" ".join(random_word(rng) for _ in range(rng.randint(1, 3))))
+    return sorted(phrases)
+
+
+def build_utterances(rng: random.Random, phrases: list) -> list:
+    utterances = []
+    for i in range(UTTERANCES):
+        words = [random_word(rng) for _ in range(rng.randint(3, 8))]
+        if i % 2 == 0:
+            words.insert(rng.randint(0, len(words)), rng.choice(phrases))
+        utterances.append(" ".join(words))
+    return utterances
+
+
+def linear_scan(command_map: dict, text: str):
+    for key_phrase, handler in command_map.items():
+        if key_phrase in text:
+            return handler
+    return None
+
+
+def measure(func, utterances: list) -> float:
+    start = time.perf_counter()
+    for text in utterances:
+        func(text)
+    return (time.perf_counter() - start) / len(utterances) * 1e6
+
+
+def main():
+    rng = random.Random(SEED)
+    print(f"{'фраз':>8} | {'лінійний, мкс':>14} | {'автомат, мкс':>13} | {'побудова, мс':>12}")
+    print("-" * 58)
+
+    for count in PHRASE_COUNTS:
+        phrases = build_phrases(rng, count)
+        utterances = build_utterances(rng, phrases)
+        command_map = {phrase: phrase for phrase in phrases}
+
+        matcher = PhraseMatcher()
+        build_start = time.perf_counter()
+        for phrase in phrases:
+            matcher.add(phrase, phrase)
+        matcher.search("")
+        matcher.search("warmup")
+        build_ms = (time.perf_counter() - build_start) * 1e3
+
+        linear_us = measure(lambda t: linear_scan(command_map, t), utterances)
+        matcher_us = measure(matcher.search, utterances)
+        print(f"{count:>8} | {linear_us:>14.2f} | {matcher_us:>13.2f} | {build_ms:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
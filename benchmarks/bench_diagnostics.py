@@ -0,0 +1,77 @@
+"""
+Бенчмарк вартості діагностики циклу подій.
+
+Прокручує цикл подій ``--count`` разів (``await asyncio.sleep(0)`` у кількох
+задачах) без діагностики, з діагностикою та з увімкненим профілювальником
+і друкує, на скільки відсотків кожен режим сповільнює цикл. Наприкінці
+блокує цикл на ``--block`` секунд і перевіряє, що сторожовий потік
+помітив блокування.
+
+Запуск: python benchmarks/bench_diagnostics.py [--count 200000] [--tasks 8]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from alpha_mini_pkg.config import settings  # noqa: E402
+from alpha_mini_pkg.utils.diagnostics import LoopDiagnostics  # noqa: E402
+
+
+async def spin(count: int):
+    for _ in range(count):
+        await asyncio.sleep(0)
+
+
+async def spin_all(count: int, tasks: int) -> float:
+    started = time.perf_counter()
+    await asyncio.gather(*(spin(count // tasks) for _ in range(tasks)))
+    return time.perf_counter() - started
+
+
+async def run(args) -> int:
+    await spin_all(args.count, args.tasks)
+    results = {"вимкнено": await spin_all(args.count, args.tasks)}
+
+    diagnostics = LoopDiagnostics()
+    diagnostics.start("bench")
+    results["увімкнено"] = await spin_all(args.count, args.tasks)
+    diagnostics.toggle_profiler()
+    results["профілювання"] = await spin_all(args.count, args.tasks)
+    diagnostics.toggle_profiler()
+
+    await asyncio.sleep(settings.DIAG_LAG_INTERVAL * 2)
+    time.sleep(args.block)
+    await asyncio.sleep(settings.DIAG_LAG_INTERVAL * 2)
+    diagnostics.stop()
+
+    baseline = results["вимкнено"]
+    print(f"{'діагностика':>14} | {'с':>7} | {'мкс/крок':>8} | {'сповільнення':>12}")
+    print("-" * 52)
+    for name, elapsed in results.items():
+        print(f"{name:>14} | {elapsed:>7.3f} | {elapsed / args.count * 1e6:>8.2f} | "
+              f"{(elapsed / baseline - 1) * 100:>11.1f}%")
+    print(f"блокування на {args.block * 1e3:.0f} мс помічено: {diagnostics.stalls}, "
+          f"макс. затримка циклу {diagnostics.max_lag * 1e3:.0f} мс")
+    return 0 if diagnostics.stalls else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--tasks", type=int, default=8)
+    parser.add_argument("--block", type=float, default=0.3, help="на скільки секунд заблокувати цикл")
+    args = parser.parse_args()
+
+    settings.DIAG_PROFILE_DIR = tempfile.mkdtemp()
+    logging.basicConfig(level=logging.ERROR)
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""
+Перевірка режиму флоту на імітованих роботах.
+
+Запускає N імітованих Alpha Mini на локальних портах, паралельно підключає
+до них флот робочих процесів, вимірює час підключення, широкомовну та
+адресну передачу команди "hello" і перевіряє, що кожен робот отримав TTS.
+
+Запуск: python benchmarks/bench_fleet.py [--robots N]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from mini.apis.cmdid import _PCProgramCmdId  # noqa: E402
+
+from alpha_mini_pkg.services.fleet import FleetRobot, RobotFleet  # noqa: E402
+from alpha_mini_pkg.simulator import start_fake_fleet  # noqa: E402
+
+
+async def run(count: int):
+    robots = await start_fake_fleet(count)
+    fleet = RobotFleet(FleetRobot(robot.name, robot.host, robot.port) for robot in robots)
+
+    started = time.perf_counter()
+    status = await fleet.connect_all()
+    connect_s = time.perf_counter() - started
+    print(f"підключено {sum(status.values())}/{count} за {connect_s:.2f} с")
+
+    try:
+        started = time.perf_counter()
+        results = await fleet.broadcast("hello")
+        print(f"broadcast: {sum(results.values())}/{len(results)} успішно за {time.perf_counter() - started:.3f} с")
+
+        target = robots[0].name
+        started = time.perf_counter()
+        ok = await fleet.dispatch(target, "hello")
+        print(f"dispatch({target}): {ok} за {time.perf_counter() - started:.3f} с")
+
+        for robot in robots:
+            spoken = [r.text for r in robot.commands(_PCProgramCmdId.PLAY_TTS_REQUEST)]
+            print(f"  {robot.name}: TTS {spoken}")
+    finally:
+        await fleet.shutdown()
+        await asyncio.gather(*(robot.stop() for robot in robots))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--robots", type=int, default=4, help="кількість імітованих роботів")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args.robots))
+
+
+if __name__ == "__main__":
+    main()
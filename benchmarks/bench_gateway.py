@@ -0,0 +1,140 @@
+"""
+Навантажувальний тест websocket-шлюзу керування.
+
+Запускає імітованого Alpha Mini, піднімає платформу (start_platform) і шлюз
+на вільному порту, після чого ``--clients`` локальних клієнтів одночасно
+надсилають по ``--count`` команд. Режими:
+
+    single   — кожна команда окремим запитом, наступна після відповіді;
+    pipeline — усі команди клієнта одним кадром-масивом запитів;
+    batch    — команди групами по ``--batch`` в одному запиті "batch".
+
+Наприкінці друкуються пропускна здатність, p50/p99 часу від надсилання
+запиту до відповіді, кількість помилок, кількість запитів до робота та
+скільки подій шлюз відкинув для повільних клієнтів.
+
+Типово клієнти надсилають "ping" — команду без запитів до робота, тож
+вимірюється накладна вартість шляху шлюз -> CommandHandler. З ``--robot``
+надсилаються справжні команди ("hello", "stop"), і результат визначають
+мовлення та черги планувальника.
+
+Запуск:
+    python benchmarks/bench_gateway.py --clients 32 --count 20 --mode single
+    python benchmarks/bench_gateway.py --clients 32 --count 20 --mode batch --batch 10
+    python benchmarks/bench_gateway.py --clients 16 --count 10 --mode pipeline --robot
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import websockets  # noqa: E402
+
+from alpha_mini_pkg.config import settings  # noqa: E402
+from alpha_mini_pkg.core import get_command_handler  # noqa: E402
+from alpha_mini_pkg.services.gateway import start_gateway, stop_gateway  # noqa: E402
+from alpha_mini_pkg.simulator import FakeAlphaMini  # noqa: E402
+from alpha_mini_pkg.startup import start_platform  # noqa: E402
+
+ROBOT_COMMANDS = ["hello", "hello there", "stop"]
+
+
+async def ping(text: str):
+    return None
+
+
+def percentile(values: list, q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def client(url: str, index: int, args, latencies: list, errors: list):
+    commands = ROBOT_COMMANDS if args.robot else ["ping"]
+    texts = [commands[(index + i) % len(commands)] for i in range(args.count)]
+    async with websockets.connect(url, max_queue=None) as ws:
+        await ws.send(json.dumps({"id": 0, "op": "subscribe", "topics": []}))
+        if args.mode == "single":
+            requests = [[{"id": i + 1, "op": "command", "text": text}] for i, text in enumerate(texts)]
+        elif args.mode == "pipeline":
+            requests = [[{"id": i + 1, "op": "command", "text": text} for i, text in enumerate(texts)]]
+        else:
+            requests = [[{"id": i + 1, "op": "batch", "commands": texts[start:start + args.batch]}]
+                        for i, start in enumerate(range(0, len(texts), args.batch))]
+
+        for frame in requests:
+            sent = time.perf_counter()
+            waiting = {request["id"]: len(request.get("commands", [None])) for request in frame}
+            await ws.send(json.dumps(frame))
+            while waiting:
+                reply = json.loads(await ws.recv())
+                if reply.get("id") not in waiting:
+                    continue
+                commands = waiting.pop(reply["id"])
+                latencies.extend([time.perf_counter() - sent] * commands)
+                if not reply["ok"]:
+                    errors.append(reply.get("error") or reply)
+
+
+async def run(args):
+    robot = await FakeAlphaMini(port=0, latency=args.latency, jitter=args.jitter, seed=args.seed).start()
+    # start_platform налаштовує SDK з settings.LOG_LEVEL: приглушуємо його журнал до підключення.
+    settings.LOG_LEVEL = logging.ERROR
+    startup = await start_platform("127.0.0.1", robot.port, "GatewayLoadTest")
+    if not startup:
+        print("не вдалося підключитися до імітованого робота")
+        await robot.stop()
+        return 1
+    settings.GATEWAY_MAX_CLIENTS = max(settings.GATEWAY_MAX_CLIENTS, args.clients)
+    settings.GATEWAY_MAX_BATCH = max(settings.GATEWAY_MAX_BATCH, args.batch)
+    settings.GATEWAY_MAX_INFLIGHT = max(settings.GATEWAY_MAX_INFLIGHT, args.count)
+    get_command_handler().register_handler("ping", ping)
+    gateway = await start_gateway("127.0.0.1", 0)
+    url = f"ws://127.0.0.1:{gateway.port}/"
+    requests_before = len(robot.received)
+
+    latencies, errors = [], []
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(client(url, i, args, latencies, errors) for i in range(args.clients)))
+        elapsed = time.perf_counter() - started
+        metrics = gateway.collect()
+    finally:
+        await stop_gateway()
+        await startup.shutdown()
+        await robot.stop()
+
+    total = args.clients * args.count
+    print(f"режим: {args.mode}, клієнтів {args.clients}, команд {total} за {elapsed:.2f} с")
+    print(f"пропускна здатність: {total / elapsed:.1f} команд/с, запитів до робота: "
+          f"{len(robot.received) - requests_before}")
+    print(f"затримка: p50 {percentile(latencies, 0.5) * 1000:.1f} мс, "
+          f"p99 {percentile(latencies, 0.99) * 1000:.1f} мс")
+    print(f"помилок: {len(errors)}, відкинуто подій: {metrics['alpha_gateway_events_dropped']}")
+    return 1 if errors else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--count", type=int, default=20, help="команд на клієнта")
+    parser.add_argument("--mode", choices=("single", "pipeline", "batch"), default="single")
+    parser.add_argument("--batch", type=int, default=10)
+    parser.add_argument("--robot", action="store_true", help="справжні команди замість ping")
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--jitter", type=float, default=0.005)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
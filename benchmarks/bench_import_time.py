@@ -0,0 +1,101 @@
+"""
+Бенчмарк часу імпорту пакета.
+
+Для кожного модуля запускає окремий процес ``python -X importtime -c "import ..."``
+кілька разів, бере медіану сукупного часу імпорту модуля і порівнює її з
+бюджетом. Легкі модулі (налаштування, граматика команд, лаунчер) також не
+мають завантажувати SDK робота, protobuf чи websockets — інакше бенчмарк
+називає модуль, який їх потягнув.
+
+Модулі без бюджету друкуються для порівняння.
+
+Запуск: python benchmarks/bench_import_time.py [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# Модуль -> бюджет сукупного часу імпорту в мс (None — лише для порівняння).
+BUDGETS = {
+    "alpha_mini_pkg": 40,
+    "alpha_mini_pkg.config.settings": 60,
+    "alpha_mini_pkg.algorithms.intent_grammar": 90,
+    "alpha_mini_pkg.launcher": 150,
+    "alpha_mini_pkg.services.api_client": None,
+    "alpha_mini_pkg.startup": None,
+}
+
+# Модулі з бюджетом не повинні завантажувати ці пакети.
+HEAVY_PACKAGES = ("mini", "google.protobuf", "websockets")
+
+
+def import_profile(module: str) -> tuple[float, list]:
+    """Повертає сукупний час імпорту ``module`` в мс і список завантажених модулів."""
+    env = dict(os.environ, PYTHONPATH=SRC)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env, check=True,
+    )
+
+    cumulative_us, loaded = None, []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        if not cumulative.strip().isdigit():
+            continue
+        loaded.append(name)
+        if name == module:
+            cumulative_us = int(cumulative)
+    return (cumulative_us or 0) / 1000, loaded
+
+
+def heavy_imports(loaded: list) -> list:
+    return sorted({name for name in loaded
+                   if any(name == pkg or name.startswith(pkg + ".") for pkg in HEAVY_PACKAGES)})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    # Перший запуск компілює .pyc і не враховується.
+    for module in BUDGETS:
+        import_profile(module)
+
+    print(f"{'модуль':<44} | {'мс':>7} | {'бюджет':>6} | результат")
+    print("-" * 78)
+    failures = 0
+    for module, budget in BUDGETS.items():
+        samples, loaded = [], []
+        for _ in range(args.runs):
+            elapsed, loaded = import_profile(module)
+            samples.append(elapsed)
+        median = statistics.median(samples)
+
+        if budget is None:
+            verdict = "довідково"
+        else:
+            heavy = heavy_imports(loaded)
+            problems = []
+            if median > budget:
+                problems.append("понад бюджет")
+            if heavy:
+                problems.append("завантажує " + ", ".join(heavy[:3]) + ("…" if len(heavy) > 3 else ""))
+            failures += bool(problems)
+            verdict = "; ".join(problems) or "OK"
+
+        budget_text = "—" if budget is None else str(budget)
+        print(f"{module:<44} | {median:>7.1f} | {budget_text:>6} | {verdict}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Бенчмарк граматики голосових команд.
+
+Перевіряє точність IntentGrammar на розміченому корпусі
+(benchmarks/data/intent_corpus.jsonl) і вимірює пропускну здатність
+розбору в фразах за секунду порівняно з попереднім регулярним виразом,
+який компілювався під час кожного виклику.
+
+Запуск: python benchmarks/bench_intent_grammar.py [--repeat 2000]
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from alpha_mini_pkg.algorithms.intent_grammar import (  # noqa: E402
+    ActionIntent, IntentGrammar, TurnIntent, WalkIntent,
+)
+
+CORPUS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "intent_corpus.jsonl")
+# Мінімальна пропускна здатність розбору, фраз/с.
+TARGET_UTTERANCES_PER_SECOND = 50_000
+
+LEGACY_DIRECTIONS = ("forward", "backward", "leftward", "rightward")
+
+
+def legacy_parse(text: str):
+    pattern = r"\bwalk\s+(\d+)\s*(?:steps?)?\s+(" + "|".join(LEGACY_DIRECTIONS) + r")\b"
+    return re.search(pattern, text.strip().lower())
+
+
+def describe(intent) -> str:
+    if isinstance(intent, WalkIntent):
+        return f"walk {intent.steps} {intent.direction_name.lower()}"
+    if isinstance(intent, TurnIntent):
+        return f"turn {intent.direction_name.lower()}"
+    if isinstance(intent, ActionIntent):
+        return f"action {intent.action_id}"
+    return repr(intent)
+
+
+def load_corpus(path: str) -> list:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def check_accuracy(grammar: IntentGrammar, corpus: list) -> int:
+    failures = 0
+    for sample in corpus:
+        got = [describe(intent) for intent in grammar.parse(sample["text"]).intents]
+        if got != sample["intents"]:
+            failures += 1
+            print(f"  ПОМИЛКА: '{sample['text']}': очікувалось {sample['intents']}, отримано {got}")
+    return failures
+
+
+def throughput(func, texts: list, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            func(text)
+    return repeat * len(texts) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", default=CORPUS_FILE)
+    parser.add_argument("--repeat", type=int, default=2_000)
+    parser.add_argument("--target", type=float, default=TARGET_UTTERANCES_PER_SECOND)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    grammar = IntentGrammar()
+    grammar.parse("warmup")
+
+    failures = check_accuracy(grammar, corpus)
+    print(f"Точність: {len(corpus) - failures}/{len(corpus)} фраз")
+
+    texts = [sample["text"] for sample in corpus]
+    grammar_rate = throughput(grammar.parse, texts, args.repeat)
+    legacy_rate = throughput(legacy_parse, texts, args.repeat)
+    print(f"{'розбір':>18} | {'фраз/с':>10}")
+    print("-" * 32)
+    print(f"{'IntentGrammar':>18} | {grammar_rate:>10,.0f}")
+    print(f"{'регулярний вираз':>18} | {legacy_rate:>10,.0f}")
+
+    ok = failures == 0 and grammar_rate >= args.target
+    print(f"Ціль {args.target:,.0f} фраз/с: {'досягнуто' if ok else 'НЕ досягнуто'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
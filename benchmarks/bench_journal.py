@@ -0,0 +1,78 @@
+"""
+Бенчмарк вартості журналу сесії для гарячого шляху.
+
+Вимірює, скільки мікросекунд у середньому та в найгіршому випадку займає
+запис однієї події (фраза, рішення диспетчера, спроба запиту та її
+результат) з вимкненим і ввімкненим журналом, а також скільки сегментів
+створила ротація і чи всі записи прочиталися назад.
+
+Запуск: python benchmarks/bench_journal.py [--count 50000] [--segment-kb 256]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from alpha_mini_pkg.utils.journal import SessionJournal, read_segment  # noqa: E402
+
+
+class _Response:
+    isSuccess = True
+
+
+class _ResultType:
+    name = "Success"
+
+
+def write_events(journal: SessionJournal, i: int):
+    journal.speech("walk 2 steps forward", True, 0)
+    journal.dispatch(f"command-{i}", "walk 2 steps forward", "start")
+    call_id = journal.api_call(f"command-{i}", "MoveRobot", ("FORWARD", 2))
+    journal.api_result(call_id, "MoveRobot", _ResultType, _Response, None)
+
+
+def per_event_us(journal: SessionJournal, count: int) -> tuple:
+    samples = []
+    clock = time.perf_counter
+    for i in range(count):
+        started = clock()
+        write_events(journal, i)
+        samples.append(clock() - started)
+    samples.sort()
+    return (sum(samples) / count / 4 * 1e6, samples[int(count * 0.99)] / 4 * 1e6, samples[-1] / 4 * 1e6)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=50_000)
+    parser.add_argument("--segment-kb", type=int, default=256)
+    args = parser.parse_args()
+    directory = tempfile.mkdtemp()
+
+    results = {"вимкнено": per_event_us(SessionJournal(), args.count)}
+
+    journal = SessionJournal()
+    journal.enable(directory, segment_bytes=args.segment_kb * 1024, max_segments=1_000)
+    results["увімкнено"] = per_event_us(journal, args.count)
+    journal.close()
+
+    segments = sorted(os.listdir(directory))
+    size = sum(os.path.getsize(os.path.join(directory, name)) for name in segments)
+    read = sum(1 for name in segments for _ in read_segment(os.path.join(directory, name)))
+    shutil.rmtree(directory)
+
+    print(f"{'журнал':>10} | {'середнє, мкс':>12} | {'p99, мкс':>9} | {'макс, мкс':>9}")
+    print("-" * 50)
+    for name, (mean, p99, worst) in results.items():
+        print(f"{name:>10} | {mean:>12.2f} | {p99:>9.2f} | {worst:>9.0f}")
+    print(f"записів: {journal.records}, прочитано: {read}, сегментів: {len(segments)} "
+          f"(ротацій: {journal.rotations}), {size / journal.records:.1f} байт на запис")
+    return 0 if read == journal.records else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
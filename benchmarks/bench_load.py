@@ -0,0 +1,170 @@
+"""
+Навантажувальний тест обробника команд і динамічного алгоритму ходьби.
+
+Запускає імітованого Alpha Mini з заданими затримками та частками збоїв,
+піднімає платформу (start_platform) і відтворює транскрипт розпізнаних фраз
+із заданою частотою. Для кожної фрази телеметрія відстежує час від появи
+фрази у слухачі до завершення її обробки. Наприкінці друкуються пропускна
+здатність, p50/p99 затримки та кількість втрачених команд.
+
+Транскрипт — файл JSONL (поле "text", інакше "title") або звичайний текст,
+одна фраза на рядок. Без транскрипту використовується вбудований набір.
+
+Запуск:
+    python benchmarks/bench_load.py --mode handler --rate 5 --count 50
+    python benchmarks/bench_load.py --mode walk --rate 0.5 --count 10 --step-time 0.05
+    python benchmarks/bench_load.py --transcript requests.jsonl --failure-rate 0.1
+"""
+import argparse
+import asyncio
+import collections
+import itertools
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from mini.apis.cmdid import _PCProgramCmdId  # noqa: E402
+
+from alpha_mini_pkg.config import settings  # noqa: E402
+from alpha_mini_pkg.core import get_command_handler  # noqa: E402
+from alpha_mini_pkg.simulator import FakeAlphaMini  # noqa: E402
+from alpha_mini_pkg.startup import start_platform  # noqa: E402
+from alpha_mini_pkg.utils.telemetry import get_telemetry  # noqa: E402
+
+DEFAULT_TRANSCRIPTS = {
+    "handler": ["hello", "stop", "what is the weather", "hello there", "please stop now"],
+    "walk": ["walk 2 steps forward", "walk 3 steps leftward", "walk 1 step backward", "jump around"],
+}
+
+
+def load_transcript(path: str) -> list:
+    phrases = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                phrases.append(line)
+                continue
+            text = record.get("text") or record.get("title") if isinstance(record, dict) else None
+            if text:
+                phrases.append(text)
+    return phrases
+
+
+def percentile(values: list, q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def wait_for(predicate, timeout: float) -> bool:
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            return False
+        await asyncio.sleep(0.01)
+    return True
+
+
+async def run(args):
+    robot = await FakeAlphaMini(
+        port=0, latency=args.latency, jitter=args.jitter, step_time=args.step_time,
+        failure_rate=args.failure_rate, drop_rate=args.drop_rate, seed=args.seed,
+    ).start()
+    # start_platform налаштовує SDK з settings.LOG_LEVEL: приглушуємо його журнал до підключення.
+    settings.LOG_LEVEL = logging.ERROR
+    startup = await start_platform("127.0.0.1", robot.port, "LoadTest")
+    if not startup:
+        print("не вдалося підключитися до імітованого робота")
+        await robot.stop()
+        return
+    await wait_for(lambda: robot.commands(_PCProgramCmdId.SPEECH_RECOGNISE), 5)
+
+    telemetry = get_telemetry()
+    telemetry.enable()
+    source = "dynamic" if args.mode == "walk" else "command"
+    finished = []
+    telemetry.add_trace_listener(lambda trace: trace.source == source and finished.append(trace))
+
+    phrases = load_transcript(args.transcript) if args.transcript else DEFAULT_TRANSCRIPTS[args.mode]
+    sent_at = collections.defaultdict(collections.deque)
+
+    try:
+        if args.mode == "walk":
+            await robot.recognise("start")
+            if not await wait_for(lambda: get_command_handler().is_dynamic_mode_active, 10):
+                print("динамічний режим не запустився")
+                return
+            await asyncio.sleep(0.2)
+
+        started = time.perf_counter()
+        interval = 1.0 / args.rate
+        sent = 0
+        for i, text in enumerate(itertools.islice(itertools.cycle(phrases), args.count)):
+            delay = started + i * interval - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            sent_at[text].append(time.perf_counter())
+            sent += await robot.recognise(text) > 0
+
+        await wait_for(lambda: len(finished) >= sent, args.drain)
+        elapsed = time.perf_counter() - started
+
+        if args.mode == "walk":
+            await robot.recognise("stop")
+            await wait_for(lambda: not get_command_handler().is_dynamic_mode_active, 30)
+    finally:
+        await startup.shutdown()
+        await robot.stop()
+
+    latencies = []
+    dropped = sent - len(finished)
+    for trace in finished:
+        queue = sent_at.get(trace.text)
+        sent_time = queue.popleft() if queue else trace.started
+        if trace.dropped or trace.failed:
+            dropped += 1
+        else:
+            latencies.append(trace.finished - sent_time)
+
+    print(f"режим: {args.mode}, надіслано {sent} фраз за {elapsed:.2f} с (ціль {args.rate}/с)")
+    print(f"оброблено: {len(latencies)}, пропускна здатність {len(latencies) / elapsed:.2f} фраз/с")
+    print(f"затримка: p50 {percentile(latencies, 0.5) * 1000:.1f} мс, p99 {percentile(latencies, 0.99) * 1000:.1f} мс")
+    print(f"втрачено команд: {dropped}, збої симулятора: {robot.faults}")
+
+    histograms = telemetry.snapshot()["histograms"].get("alpha_stage_seconds", [])
+    for entry in sorted(histograms, key=lambda e: sorted(e["labels"].items())):
+        labels = ", ".join(f"{k}={v}" for k, v in sorted(entry["labels"].items()))
+        print(f"  {labels:<32} n={entry['count']:<5} p50≤{entry['p50']}s p99≤{entry['p99']}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=("handler", "walk"), default="handler")
+    parser.add_argument("--transcript")
+    parser.add_argument("--rate", type=float, default=5.0, help="фраз на секунду")
+    parser.add_argument("--count", type=int, default=50)
+    parser.add_argument("--drain", type=float, default=60.0, help="скільки чекати на обробку після відтворення")
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--step-time", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Бенчмарк вартості журналювання для потоку циклу подій.
+
+Вимірює, скільки мікросекунд виклик логера забирає в потоку, що його
+зробив (середнє, p99 і найгірший виклик):
+
+- вимкнений DEBUG з f-рядком та з відкладеним форматуванням (``%s``);
+- INFO у звичайному текстовому режимі (синхронний запис у файл);
+- INFO у структурованому режимі (черга й фоновий запис JSON-рядків).
+
+Запуск: python benchmarks/bench_logging.py [--count 20000]
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from alpha_mini_pkg.utils.log_pipeline import configure_logging  # noqa: E402
+
+logger = logging.getLogger("alpha_mini_pkg.services.api_client")
+
+
+def reset_root():
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+
+
+def per_call_us(func, count: int) -> tuple:
+    """Середня, p99 та максимальна тривалість одного виклику в мкс."""
+    samples = []
+    clock = time.perf_counter
+    for i in range(count):
+        started = clock()
+        func(i)
+        samples.append(clock() - started)
+    samples.sort()
+    return (sum(samples) / count * 1e6, samples[int(count * 0.99)] * 1e6, samples[-1] * 1e6)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=20_000)
+    args = parser.parse_args()
+    directory = tempfile.mkdtemp()
+    direction, payload = "FORWARD", {"steps": 3, "speed": "normal"}
+
+    results = {}
+    configure_logging(level=logging.INFO, structured=False)
+    results["DEBUG вимкнено, f-рядок"] = per_call_us(
+        lambda i: logger.debug(f"API: Виконання руху: {direction}, кроків: {i}, {payload}"), args.count)
+    results["DEBUG вимкнено, %s"] = per_call_us(
+        lambda i: logger.debug("API: Виконання руху: %s, кроків: %s, %s", direction, i, payload), args.count)
+    reset_root()
+
+    logging.basicConfig(level=logging.INFO, filename=os.path.join(directory, "text.log"), force=True)
+    results["INFO, текстовий режим"] = per_call_us(
+        lambda i: logger.info("API: Виконання руху: %s, кроків: %s, %s", direction, i, payload), args.count)
+    reset_root()
+
+    listener = configure_logging(level=logging.INFO, structured=True, path=os.path.join(directory, "log.jsonl"))
+    results["INFO, структурований режим"] = per_call_us(
+        lambda i: logger.info("API: Виконання руху: %s, кроків: %s, %s", direction, i, payload), args.count)
+    drain_started = time.perf_counter()
+    listener.stop()
+    drain_ms = (time.perf_counter() - drain_started) * 1e3
+    reset_root()
+
+    print(f"{'виклик':>28} | {'середнє, мкс':>12} | {'p99, мкс':>9} | {'макс, мкс':>9}")
+    print("-" * 68)
+    for name, (mean, p99, worst) in results.items():
+        print(f"{name:>28} | {mean:>12.2f} | {p99:>9.1f} | {worst:>9.0f}")
+    print(f"фоновий запис дописав чергу за {drain_ms:.1f} мс")
+
+
+if __name__ == "__main__":
+    main()
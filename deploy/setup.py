@@ -20,19 +20,22 @@ setup(
     packages=find_packages(where=os.path.join(PROJECT_ROOT, 'src')),
     
     package_dir={'': os.path.join(PROJECT_ROOT, 'src')},
+
+    package_data={'alpha_mini_pkg': ['actions.json']},
     
     install_requires=read_requirements(),
 
     entry_points={
         'console_scripts': [
             'run_alpha_platform = alpha_mini_pkg.launcher:run', 
+            'run_alpha_fleet = alpha_mini_pkg.launcher:run_fleet',
         ],
     },
 
-    python_requires='>=3.9',
+    python_requires='>=3.10',
     classifiers=[
         'Development Status :: 4 - Beta',
-        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
         'Operating System :: OS Independent',
     ],
 )
\ No newline at end of file
@@ -1,8 +1,19 @@
-from .services.connection_manager import connect_robot, shutdown
-from .core.command_handler import robot_command_handler
+# Публічні імена завантажуються під час першого звернення (PEP 562),
+# тож "import alpha_mini_pkg.config.settings" не тягне за собою SDK робота.
+from alpha_mini_pkg.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    'connect_robot': '.services.connection_manager',
+    'shutdown': '.services.connection_manager',
+    'robot_command_handler': '.core.command_handler',
+    'get_command_handler': '.core.command_handler',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     'connect_robot',
     'shutdown',
     'robot_command_handler',
-]
\ No newline at end of file
+    'get_command_handler',
+]
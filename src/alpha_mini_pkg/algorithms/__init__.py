@@ -1,5 +1,23 @@
-from .main_algorithm import execute_main_algorithm
+from alpha_mini_pkg.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    'execute_main_algorithm': '.main_algorithm',
+    'IntentGrammar': '.intent_grammar',
+    'WalkIntent': '.intent_grammar',
+    'TurnIntent': '.intent_grammar',
+    'ActionIntent': '.intent_grammar',
+    'ParseResult': '.intent_grammar',
+    'parse_intents': '.intent_grammar',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     'execute_main_algorithm',
-]
\ No newline at end of file
+    'IntentGrammar',
+    'WalkIntent',
+    'TurnIntent',
+    'ActionIntent',
+    'ParseResult',
+    'parse_intents',
+]
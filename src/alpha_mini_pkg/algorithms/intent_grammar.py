@@ -0,0 +1,307 @@
+import logging
+import re
+from typing import Optional
+
+from alpha_mini_pkg.config import settings
+from alpha_mini_pkg.services.action_catalog import get_action_catalog
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"[a-z]+|\d+")
+
+# Категорії словника граматики.
+_WALK, _TURN, _ACT, _DIR, _SEP, _FILL, _NUM, _SCALE = range(8)
+
+_UNITS = {
+    "zero": 0, "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12,
+    "thirteen": 13, "fourteen": 14, "fifteen": 15, "sixteen": 16, "seventeen": 17,
+    "eighteen": 18, "nineteen": 19, "couple": 2, "pair": 2, "few": 3,
+}
+_TENS = {
+    "twenty": 20, "thirty": 30, "forty": 40, "fifty": 50,
+    "sixty": 60, "seventy": 70, "eighty": 80, "ninety": 90,
+}
+
+_SYNONYMS = {
+    _WALK: ("walk", "go", "move", "step", "march"),
+    _TURN: ("turn", "rotate", "spin"),
+    _ACT: ("play", "do", "perform", "show"),
+    _SEP: ("then", "and", "after", "next", "afterwards", "finally"),
+    _FILL: ("steps", "the", "please", "that", "of", "to", "robot", "now", "times", "me", "you", "can", "could"),
+}
+
+# Напрямки задано іменами членів MoveRobotDirection: граматика не імпортує SDK,
+# enum завантажується лише тоді, коли намір справді виконується.
+_DIRECTIONS = {
+    "FORWARD": ("forward", "forwards", "ahead", "front", "straight"),
+    "BACKWARD": ("backward", "backwards", "back"),
+    "LEFTWARD": ("left", "leftward", "leftwards"),
+    "RIGHTWARD": ("right", "rightward", "rightwards"),
+}
+
+# Дії-пози для повороту на місці з actions.json.
+_TURN_ACTIONS = {
+    "LEFTWARD": "turn_left_avatar",
+    "RIGHTWARD": "turn_right_avatar",
+}
+
+# Дієслівні форми, якими дії зазвичай називають уголос, -> ID з actions.json.
+_ACTION_ALIASES = {
+    "nod": "011",
+    "laugh": "010",
+    "pushups": "012",
+    "sit": "027",
+    "hug": "random_short2",
+    "kiss": "Surveillance_004",
+    "bend": "021",
+}
+
+
+def _build_vocabulary() -> dict:
+    vocabulary = {}
+    for category, words in _SYNONYMS.items():
+        for word in words:
+            vocabulary[word] = (category, word)
+    for direction, words in _DIRECTIONS.items():
+        for word in words:
+            vocabulary[word] = (_DIR, direction)
+    for word, value in _UNITS.items():
+        vocabulary[word] = (_NUM, value)
+    for word, value in _TENS.items():
+        vocabulary[word] = (_NUM, value)
+    vocabulary["hundred"] = (_SCALE, 100)
+    return vocabulary
+
+
+def _compounds(pending: int, value: int) -> bool:
+    """Чи продовжує ``value`` складене число: "twenty one", "one hundred five"."""
+    if not pending:
+        return False
+    return (pending % 100 == 0 and value < 100) or (pending % 10 == 0 and value < 10)
+
+
+def _move_direction(name: str):
+    from mini.apis.api_action import MoveRobotDirection
+    return MoveRobotDirection[name]
+
+
+class WalkIntent:
+    __slots__ = ("steps", "direction_name", "clamped", "defaulted")
+
+    def __init__(self, steps: int, direction, clamped: bool = False, defaulted: bool = False):
+        self.steps = steps
+        self.direction_name = getattr(direction, "name", direction)
+        self.clamped = clamped
+        # Кількість кроків не названо: взято DEFAULT_STEPS.
+        self.defaulted = defaulted
+
+    @property
+    def direction(self):
+        """MoveRobotDirection цього наміру."""
+        return _move_direction(self.direction_name)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, WalkIntent) and (self.steps, self.direction_name) == (other.steps, other.direction_name)
+
+    def __repr__(self) -> str:
+        return f"WalkIntent({self.steps}, {self.direction_name})"
+
+
+class TurnIntent:
+    __slots__ = ("direction_name", "action_id")
+
+    def __init__(self, direction, action_id: str):
+        self.direction_name = getattr(direction, "name", direction)
+        self.action_id = action_id
+
+    @property
+    def direction(self):
+        return _move_direction(self.direction_name)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, TurnIntent) and self.direction_name == other.direction_name
+
+    def __repr__(self) -> str:
+        return f"TurnIntent({self.direction_name})"
+
+
+class ActionIntent:
+    __slots__ = ("action_id", "phrase")
+
+    def __init__(self, action_id: str, phrase: str = ""):
+        self.action_id = action_id
+        self.phrase = phrase
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ActionIntent) and self.action_id == other.action_id
+
+    def __repr__(self) -> str:
+        return f"ActionIntent({self.action_id!r})"
+
+
+class ParseResult:
+    __slots__ = ("intents", "unmatched")
+
+    def __init__(self, intents: list, unmatched: list):
+        self.intents = intents
+        self.unmatched = unmatched
+
+    def __bool__(self) -> bool:
+        return bool(self.intents)
+
+    def __repr__(self) -> str:
+        return f"ParseResult({self.intents}, unmatched={self.unmatched})"
+
+
+class IntentGrammar:
+    """
+    Попередньо скомпільована граматика голосових команд руху.
+
+    Фраза токенізується одним регулярним виразом, кожен токен одразу
+    класифікується за словником (дієслова та їхні синоніми, напрямки, числа
+    словами й цифрами, сполучники, слова-заповнювачі), а сполучники ділять
+    фразу на окремі команди::
+
+        "walk three forward then turn left and wave"
+        -> [WalkIntent(3, FORWARD), TurnIntent(LEFTWARD), ActionIntent('Surveillance_001')]
+
+    Команда без дієслова ходьби, але з числом і напрямком ("5 steps back")
+    теж вважається ходьбою. Дієслово ходьби саме по собі ходьбою не є: потрібне
+    число або напрямок ("go home", "move your head" — не команди), а якщо у
+    фразі є незнайомі слова — і число, і напрямок. Команда з кількома числами
+    чи різними напрямками ("walk 3 forward 2 left") неоднозначна й
+    відкидається.
+
+    Решта фраз зіставляється з назвами дій каталогу: без дієслова дії
+    (play/do/perform/show) — лише точна назва ("hug", "sit down"), з ним —
+    назва всередині фрази цілими словами ("show me the big laugh").
+    """
+
+    def __init__(self, max_steps: Optional[int] = None, default_steps: Optional[int] = None, catalog=None):
+        self._max_steps = max_steps
+        self._default_steps = default_steps
+        self._catalog = catalog
+        self._vocabulary = _build_vocabulary()
+
+    @property
+    def max_steps(self) -> int:
+        return settings.MAX_WALK_STEPS if self._max_steps is None else self._max_steps
+
+    @property
+    def default_steps(self) -> int:
+        return settings.DEFAULT_STEPS if self._default_steps is None else self._default_steps
+
+    @property
+    def catalog(self):
+        if self._catalog is None:
+            self._catalog = get_action_catalog()
+        return self._catalog
+
+    def parse(self, text: str) -> ParseResult:
+        intents, unmatched = [], []
+        for clause in self._clauses(text.lower()):
+            intent = self._parse_clause(clause)
+            if intent is not None:
+                intents.append(intent)
+            else:
+                unmatched.append(" ".join(word for word, _, _ in clause))
+        return ParseResult(intents, unmatched)
+
+    def _clauses(self, text: str) -> list:
+        vocabulary = self._vocabulary
+        clauses, current = [], []
+        for word in _TOKEN.findall(text):
+            if word.isdigit():
+                entry = (_NUM, int(word))
+            else:
+                entry = vocabulary.get(word)
+            if entry is None:
+                current.append((word, None, None))
+            elif entry[0] == _SEP:
+                if current:
+                    clauses.append(current)
+                    current = []
+            else:
+                current.append((word, entry[0], entry[1]))
+        if current:
+            clauses.append(current)
+        return clauses
+
+    def _parse_clause(self, clause: list) -> Optional[object]:
+        verb = None
+        direction = None
+        number = None
+        numbers = 0
+        pending = 0
+        has_unknown = False
+        ambiguous = False
+
+        for word, category, value in clause:
+            if category == _NUM:
+                if not pending:
+                    numbers += 1
+                pending = pending + value if _compounds(pending, value) else value
+                number = pending
+                continue
+            if category == _SCALE and pending:
+                pending *= value
+                number = pending
+                continue
+            pending = 0
+            if category in (_WALK, _TURN, _ACT) and verb is None:
+                verb = category
+            elif category == _DIR:
+                ambiguous = ambiguous or (direction is not None and direction != value)
+                direction = direction or value
+            elif category is None:
+                has_unknown = True
+
+        if verb == _TURN and direction in _TURN_ACTIONS:
+            return TurnIntent(direction, _TURN_ACTIONS[direction])
+
+        if verb == _WALK or (verb is None and direction is not None and number is not None):
+            if numbers > 1 or ambiguous:
+                logger.debug("GRAMMAR: Неоднозначна команда ходьби відкинута: %s", [w for w, _, _ in clause])
+                return None
+            if number is None and direction is None:
+                return None
+            if has_unknown and (number is None or direction is None):
+                return None
+            steps = self.default_steps if number is None else number
+            if steps <= 0:
+                return None
+            clamped = steps > self.max_steps
+            return WalkIntent(min(steps, self.max_steps), direction or "FORWARD", clamped, defaulted=number is None)
+
+        return self._parse_action(clause, explicit=verb == _ACT)
+
+    def _parse_action(self, clause: list, explicit: bool) -> Optional[ActionIntent]:
+        words = [word for word, category, _ in clause if category not in (_ACT, _FILL)]
+        if not words:
+            return None
+        phrase = " ".join(words)
+        if len(words) == 1 and words[0] in _ACTION_ALIASES:
+            return ActionIntent(_ACTION_ALIASES[words[0]], phrase)
+        catalog = self.catalog
+        if explicit:
+            entry = catalog.resolve(phrase, fuzzy=False)
+        else:
+            entry = catalog.get(phrase) or catalog.by_name(phrase)
+        if entry is None:
+            return None
+        return ActionIntent(entry.id, phrase)
+
+
+_grammar: Optional[IntentGrammar] = None
+
+
+def get_intent_grammar() -> IntentGrammar:
+    global _grammar
+    if _grammar is None:
+        _grammar = IntentGrammar()
+    return _grammar
+
+
+def parse_intents(text: str) -> ParseResult:
+    return get_intent_grammar().parse(text)
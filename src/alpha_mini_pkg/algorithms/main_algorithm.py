@@ -1,70 +1,100 @@
 import asyncio
 import logging
-import re
-from alpha_mini_pkg.core import action_walk, action_speak, create_dynamic_listener, MoveRobotDirection
+from typing import Optional
+from alpha_mini_pkg.core import action_speak, action_stop, get_motion_planner
+from alpha_mini_pkg.core.dynamic_listener import open_speech_stream
+from alpha_mini_pkg.algorithms.intent_grammar import ActionIntent, TurnIntent, WalkIntent, parse_intents
+from alpha_mini_pkg.config import settings
+from alpha_mini_pkg.services.speech_bus import DROP_OLDEST
 from alpha_mini_pkg.utils.helpers import safe_delay
+from alpha_mini_pkg.utils.telemetry import get_telemetry
 
 logger = logging.getLogger(__name__)
 
-DIRECTION_MAP = {
-    "forward": MoveRobotDirection.FORWARD,
-    "backward": MoveRobotDirection.BACKWARD,
-    "leftward": MoveRobotDirection.LEFTWARD,
-    "rightward": MoveRobotDirection.RIGHTWARD,
-}
+# Скільки фраз динамічний режим буферизує, поки виконується попередня команда.
+DYNAMIC_BUFFER_SIZE: int = 4
+# Повтор тієї ж фрази протягом цього часу вважається дублем розпізнавання.
+DEDUPE_WINDOW: float = 2.0
+
+async def _execute_intent(intent) -> bool:
+    """
+    Передає намір планувальнику руху; рух виконується у фоні. Про ходьбу
+    робот коротко говорить, лише коли кількість кроків він обрав сам
+    (не названа, обмежена MAX_WALK_STEPS або лімітом маршруту).
+    """
+    planner = get_motion_planner()
+    if isinstance(intent, WalkIntent):
+        direction = intent.direction_name.lower()
+        logger.info("ALGORITHM: Парсинг успішний: %s кроків, %s.", intent.steps, direction)
+        accepted = planner.plan_walk(intent.steps, intent.direction_name)
+        if not accepted:
+            await action_speak(f"I already have {settings.MAX_WALK_STEPS} steps planned. Wait for me to finish.")
+        elif accepted < intent.steps or intent.clamped:
+            await action_speak(f"I limited the steps to {accepted} for safety.")
+        elif intent.defaulted:
+            await action_speak(f"Walking {accepted} steps {direction}.")
+        return True
+
+    if isinstance(intent, (TurnIntent, ActionIntent)):
+        logger.info("ALGORITHM: Дія '%s' додана до маршруту.", intent.action_id)
+        planner.plan_action(intent.action_id)
+        return True
+
+    return False
 
 async def parse_and_execute_walk_command(text: str) -> bool:
-    normalized_text = text.strip().lower()
-
-    pattern = r"\bwalk\s+(\d+)\s*(?:steps?)?\s+(" + "|".join(DIRECTION_MAP.keys()) + r")\b"
-    
-    match = re.search(pattern, normalized_text)
-
-    if match:
-        steps_str = match.group(1)
-        direction_name = match.group(2)
-        
-        try:
-            steps = int(steps_str)
-            direction = DIRECTION_MAP[direction_name]
-            
-            if steps > 20:
-                steps = 20
-                await action_speak("I limited the steps to 20 for safety.")
-
-            logger.info(f"ALGORITHM: Парсинг успішний: {steps} кроків, {direction_name}.")
-            await action_speak(f"Executing walk of {steps} steps {direction_name}.")
-
-            await action_walk(steps=steps, direction=direction)
-            
-            await action_speak("Walk command finished.")
-            return True
-            
-        except ValueError:
-            await action_speak("I couldn't process the numbers in your command.")
-            return False
-    else:
-        logger.debug(f"ALGORITHM: Не вдалося розпізнати команду. Шукали патерн: {pattern}")
+    result = parse_intents(text)
+
+    if not result:
+        logger.debug("ALGORITHM: Не вдалося розпізнати команду '%s'.", text)
         return False
 
+    if result.unmatched:
+        logger.debug("ALGORITHM: Нерозпізнані частини команди: %s", result.unmatched)
+
+    for intent in result.intents:
+        await _execute_intent(intent)
+    return True
+
+async def _handle_dynamic_utterance(text: str):
+    logger.debug("ALGORITHM: Динамічний режим отримав: %s", text)
+
+    executed = await parse_and_execute_walk_command(text)
+    if not executed:
+        await action_speak(f"I heard {text}. Please specify a walk command or say stop.")
+
 async def execute_main_algorithm(text: str):
     logger.info("ALGORITHM: Запуск Main Algorithm. Вхід у динамічний режим прослуховування.")
-    
+
     loop = asyncio.get_running_loop()
+    telemetry = get_telemetry()
+    planner = get_motion_planner()
+    planner.reset()
+    current: Optional[asyncio.Task] = None
+
+    def on_stop(phrase: str):
+        if current is not None and not current.done():
+            current.cancel()
+        planner.cancel()
+        return action_stop()
+
+    stream = (
+        open_speech_stream(maxsize=DYNAMIC_BUFFER_SIZE, overflow=DROP_OLDEST)
+        .dedupe(DEDUPE_WINDOW)
+        .take_until("stop", on_match=on_stop)
+    )
 
-    listener = create_dynamic_listener(loop)
-    
-    async def dynamic_callback(speech_text: str):
-        logger.debug(f"ALGORITHM: Динамічний callback отримав: {speech_text}")
+    async with stream:
+        await action_speak("Entering dynamic command mode. Say 'walk [number] steps [direction]' or say 'stop' to exit.")
 
-        executed = await parse_and_execute_walk_command(speech_text)
-        
-        if not executed:
-            await action_speak(f"I heard {speech_text}. Please specify a walk command or say stop.")
+        async for utterance in stream:
+            current = telemetry.spawn(
+                loop, _handle_dynamic_utterance(utterance.text),
+                "dynamic", utterance.text, utterance.received_at,
+            )
+            await asyncio.wait({current})
 
-    listener.on_speaking(dynamic_callback).stop_when("stop") 
-    listener_task = loop.create_task(listener.start()) 
-    await action_speak("Entering dynamic command mode. Say 'walk [number] steps [direction]' or say 'stop' to exit.")
-    stop_text = await listener_task
+    await planner.wait_idle()
+    stop_text = stream.stopped_by or ""
     await action_speak(f"Exiting dynamic command mode. You said: {stop_text}")
-    logger.info("ALGORITHM: Main Algorithm завершено.")
\ No newline at end of file
+    logger.info("ALGORITHM: Main Algorithm завершено.")
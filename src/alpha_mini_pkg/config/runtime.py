@@ -0,0 +1,400 @@
+import asyncio
+import json
+import logging
+import math
+import os
+import types
+import typing
+from typing import Callable, Iterable, Optional, Union
+
+from alpha_mini_pkg.config import settings
+
+logger = logging.getLogger(__name__)
+
+ENV_PREFIX = "ALPHA_MINI_"
+CONFIG_ENV = "ALPHA_MINI_CONFIG"
+PROFILE_ENV = "ALPHA_MINI_PROFILE"
+
+# Ці значення читаються під час підключення або запуску: після гарячого
+# перезавантаження вони застосуються лише з наступним перепідключенням чи перезапуском.
+RESTART_KEYS = frozenset({
+    "ROBOT_IP", "ROBOT_PORT", "ROBOT_TYPE_NAME", "ACTIONS_FILE", "FLEET_DEVICES",
+    "TTS_CALIBRATION_FILE", "TTS_PHRASE_CACHE_FILE", "TTS_PHRASE_CACHE_SIZE",
+    "LOG_STRUCTURED", "LOG_FILE", "LOG_DEBUG_SAMPLE_RATE", "LOG_SAMPLED_LOGGERS",
+    "GATEWAY_ENABLED", "GATEWAY_HOST", "GATEWAY_PORT", "GATEWAY_TOKEN",
+    "DIAG_ENABLED",
+})
+RESTART_PREFIXES = ("TELEMETRY_", "JOURNAL_")
+
+ConfigCallback = Callable[[dict], object]
+
+_PORT = (0, 65535)
+_POSITIVE = (0.0, None, True)
+
+# Допустимі межі значень: (мінімум, максимум[, мінімум не включно]); None — без межі.
+# Тип перевіряє _coerce, межі — _check_range; будь-яке порушення відкидає всю конфігурацію.
+RANGES = {
+    "ROBOT_PORT": (1, 65535),
+    "LOG_DEBUG_SAMPLE_RATE": (0.0, 1.0),
+    "DEFAULT_STEPS": (1, None),
+    "MAX_WALK_STEPS": (1, None),
+    "MOTION_COALESCE_WINDOW": (0.0, None),
+    "MOTION_CHUNK_STEPS": (1, None),
+    "PROGRAM_MODE_WAIT_TIME": (0, None),
+    "READINESS_POLL_INITIAL": _POSITIVE,
+    "READINESS_POLL_MAX": _POSITIVE,
+    "READINESS_PROBE_TIMEOUT": _POSITIVE,
+    "HEARTBEAT_INTERVAL": _POSITIVE,
+    "HEARTBEAT_PROBE_EVERY": (1, None),
+    "HEARTBEAT_MAX_FAILURES": (1, None),
+    "RECONNECT_BACKOFF_INITIAL": _POSITIVE,
+    "RECONNECT_BACKOFF_MAX": _POSITIVE,
+    "COMMAND_RECONNECT_WAIT": (0.0, None),
+    "API_DEADLINE_DEFAULT": _POSITIVE,
+    "API_MOVE_STEP_SECONDS": (0.0, None),
+    "API_RETRY_ATTEMPTS": (1, None),
+    "API_RETRY_BACKOFF_INITIAL": (0.0, None),
+    "API_RETRY_BACKOFF_MAX": (0.0, None),
+    "CIRCUIT_FAILURE_THRESHOLD": (1, None),
+    "CIRCUIT_RESET_TIMEOUT": _POSITIVE,
+    "TTS_PHRASE_CACHE_SIZE": (1, None),
+    "TTS_WARMUP_PHRASES": (0, None),
+    "TELEMETRY_PROMETHEUS_PORT": _PORT,
+    "GATEWAY_PORT": _PORT,
+    "GATEWAY_MAX_CLIENTS": (1, None),
+    "GATEWAY_MAX_INFLIGHT": (1, None),
+    "GATEWAY_MAX_BATCH": (1, None),
+    "GATEWAY_CLIENT_QUEUE": (1, None),
+    "GATEWAY_STATUS_INTERVAL": _POSITIVE,
+    "DIAG_LAG_INTERVAL": _POSITIVE,
+    "DIAG_SLOW_CALLBACK": _POSITIVE,
+    "DIAG_TASK_LEAK_SECONDS": _POSITIVE,
+    "DIAG_PROFILE_INTERVAL": _POSITIVE,
+    "JOURNAL_SEGMENT_BYTES": (4096, None),
+    "JOURNAL_MAX_SEGMENTS": (1, None),
+}
+
+
+class ConfigError(ValueError):
+    """Конфігурація не пройшла перевірку; ``problems`` містить усі знайдені помилки."""
+
+    def __init__(self, problems: list):
+        super().__init__("Invalid configuration:\n  " + "\n  ".join(problems))
+        self.problems = problems
+
+
+def _schema() -> dict:
+    """Типи налаштувань з анотацій config.settings (без службових CONFIG_*)."""
+    hints = typing.get_type_hints(settings)
+    return {name: hint for name, hint in hints.items() if name.isupper() and not name.startswith("CONFIG_")}
+
+
+_original_defaults: Optional[dict] = None
+
+
+def _defaults(schema: dict) -> dict:
+    """Значення з settings.py до першого застосування конфігурації."""
+    global _original_defaults
+    if _original_defaults is None:
+        _original_defaults = {name: getattr(settings, name) for name in schema}
+    return _original_defaults
+
+
+def _type_name(hint) -> str:
+    return getattr(hint, "__name__", str(hint))
+
+
+def _coerce(hint, value, from_env: bool):
+    """Приводить ``value`` до типу ``hint``; рядки зі змінних оточення розбираються."""
+    origin = typing.get_origin(hint)
+    if origin in (Union, types.UnionType):
+        options = [option for option in typing.get_args(hint) if option is not type(None)]
+        if value is None or (from_env and value.strip().lower() in ("", "none", "null")):
+            if len(options) < len(typing.get_args(hint)):
+                return None
+            raise ValueError("value is required")
+        return _coerce(options[0], value, from_env)
+
+    if hint is bool:
+        if from_env:
+            lowered = value.strip().lower()
+            if lowered in ("1", "true", "yes", "on"):
+                return True
+            if lowered in ("0", "false", "no", "off"):
+                return False
+        elif isinstance(value, bool):
+            return value
+        raise ValueError(f"expected bool, got {value!r}")
+
+    if hint in (int, float):
+        if isinstance(value, bool) or (not from_env and not isinstance(value, (int, float))):
+            raise ValueError(f"expected {hint.__name__}, got {value!r}")
+        if hint is int and isinstance(value, float) and not value.is_integer():
+            raise ValueError(f"expected int, got {value!r}")
+        value = hint(value)
+        # NaN не проходить жодного порівняння, тож межі з RANGES його не відсіють.
+        if not math.isfinite(value):
+            raise ValueError(f"expected a finite {hint.__name__}, got {value!r}")
+        return value
+
+    if hint is str:
+        if not isinstance(value, str):
+            raise ValueError(f"expected str, got {value!r}")
+        return value
+
+    container = origin or hint
+    if container in (dict, list, tuple):
+        if from_env:
+            value = json.loads(value)
+        if container is tuple and isinstance(value, list):
+            value = tuple(value)
+        if not isinstance(value, container):
+            raise ValueError(f"expected {container.__name__}, got {value!r}")
+        return value
+
+    raise ValueError(f"unsupported setting type {_type_name(hint)}")
+
+
+def _check_range(name: str, value, limits: tuple) -> Optional[str]:
+    low, high, *exclusive = limits
+    if value is None:
+        return None
+    if low is not None and (value <= low if exclusive else value < low):
+        return f"{name}: must be {'>' if exclusive else '>='} {low}, got {value!r}"
+    if high is not None and value > high:
+        return f"{name}: must be <= {high}, got {value!r}"
+    return None
+
+
+def _validate(values: dict) -> list:
+    """Перевіряє межі значень, уже приведених до своїх типів."""
+    problems = []
+    for name, limits in RANGES.items():
+        problem = _check_range(name, values.get(name), limits)
+        if problem:
+            problems.append(problem)
+
+    for api_name, deadline in values.get("API_DEADLINES", {}).items():
+        if (isinstance(deadline, bool) or not isinstance(deadline, (int, float))
+                or not math.isfinite(deadline) or deadline <= 0):
+            problems.append(f"API_DEADLINES[{api_name!r}]: must be a number > 0, got {deadline!r}")
+
+    for index, device in enumerate(values.get("FLEET_DEVICES", [])):
+        port = device.get("port") if isinstance(device, dict) else None
+        if port is not None and (isinstance(port, bool) or not isinstance(port, int) or not 1 <= port <= 65535):
+            problems.append(f"FLEET_DEVICES[{index}].port: must be 1..65535, got {port!r}")
+    return problems
+
+
+def _load_toml(path: str, f):
+    try:
+        import tomllib
+    except ImportError:
+        # Python < 3.11: той самий розбірник як окремий пакет tomli.
+        try:
+            import tomli as tomllib
+        except ImportError as e:
+            raise ConfigError([f"{path}: TOML config on Python < 3.11 requires tomli ({e})"]) from e
+    return tomllib.load(f)
+
+
+def _read_file(path: str) -> dict:
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".toml":
+        with open(path, "rb") as f:
+            return _load_toml(path, f)
+
+    with open(path, "r", encoding="utf-8") as f:
+        if extension in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError as e:
+                raise ConfigError([f"{path}: YAML config requires PyYAML ({e})"]) from e
+            try:
+                data = yaml.safe_load(f)
+            except yaml.YAMLError as e:
+                raise ConfigError([f"{path}: {e}"]) from e
+        else:
+            data = json.load(f)
+    return data or {}
+
+
+class RuntimeConfig:
+    """
+    Типізована конфігурація, яку можна перезавантажити без перезапуску.
+
+    Значення беруться в такому порядку (наступне перекриває попереднє):
+    константи config.settings, загальна частина файлу конфігурації, розділ
+    ``[profiles.<ім'я>]`` обраного профілю (наприклад, окремого робота) і
+    змінні оточення ``ALPHA_MINI_<НАЗВА>``. Кожне значення перевіряється за
+    анотацією типу в settings і за межами з RANGES (кроки, тайм-аути, кількість
+    повторів, порти, інтервали); будь-яка помилка відкидає всю нову конфігурацію.
+
+    Застосовані значення записуються назад у модуль settings, тож код, що
+    читає ``settings.НАЗВА`` під час виклику, одразу бачить нове значення.
+    Підписники отримують словник змінених значень.
+    """
+
+    def __init__(self, path: Optional[str] = None, profile: Optional[str] = None,
+                 environ: Optional[dict] = None):
+        self._environ = os.environ if environ is None else environ
+        self.path = path or self._environ.get(CONFIG_ENV) or settings.CONFIG_FILE
+        self.profile = profile or self._environ.get(PROFILE_ENV) or settings.CONFIG_PROFILE
+        self._schema = _schema()
+        self._defaults = _defaults(self._schema)
+        self.values = dict(self._defaults)
+        self.reloads = 0
+        self._subscribers: list = []
+        self._mtime: Optional[float] = None
+        self._watch_task: Optional[asyncio.Task] = None
+
+    def get(self, name: str):
+        return self.values[name]
+
+    def subscribe(self, callback: ConfigCallback, keys: Optional[Iterable[str]] = None) -> ConfigCallback:
+        """Викликає ``callback(changes)``, коли змінюється будь-яке з ``keys`` (або будь-що)."""
+        self._subscribers.append((callback, None if keys is None else frozenset(keys)))
+        return callback
+
+    def unsubscribe(self, callback: ConfigCallback):
+        self._subscribers = [(cb, keys) for cb, keys in self._subscribers if cb is not callback]
+
+    def _file_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.path).st_mtime
+        except OSError:
+            return None
+
+    def resolve(self) -> dict:
+        """Збирає й перевіряє значення з усіх джерел, нічого не застосовуючи."""
+        problems = []
+        raw: dict = {}
+
+        if self.path and os.path.exists(self.path):
+            try:
+                data = _read_file(self.path)
+            except ConfigError:
+                raise
+            except (OSError, ValueError) as e:
+                raise ConfigError([f"{self.path}: {e}"]) from e
+            if not isinstance(data, dict):
+                raise ConfigError([f"{self.path}: top level must be a mapping"])
+
+            profiles = data.get("profiles", {})
+            raw.update({key.upper(): value for key, value in data.items() if key != "profiles"})
+            if self.profile:
+                if self.profile not in profiles:
+                    problems.append(f"profile '{self.profile}' is not defined in {self.path}")
+                else:
+                    raw.update({key.upper(): value for key, value in profiles[self.profile].items()})
+        elif self.profile and self.path:
+            problems.append(f"profile '{self.profile}' requested but {self.path} does not exist")
+
+        values = dict(self._defaults)
+        for name, value in raw.items():
+            if name not in self._schema:
+                problems.append(f"{name}: unknown setting")
+                continue
+            try:
+                values[name] = _coerce(self._schema[name], value, from_env=False)
+            except ValueError as e:
+                problems.append(f"{name}: {e}")
+
+        for name, hint in self._schema.items():
+            value = self._environ.get(ENV_PREFIX + name)
+            if value is None:
+                continue
+            try:
+                values[name] = _coerce(hint, value, from_env=True)
+            except ValueError as e:
+                problems.append(f"{ENV_PREFIX}{name}: {e}")
+
+        if not problems:
+            problems = _validate(values)
+        if problems:
+            raise ConfigError(problems)
+        return values
+
+    def load(self) -> dict:
+        """Перечитує конфігурацію й застосовує її. Повертає змінені значення."""
+        self._mtime = self._file_mtime()
+        return self.apply(self.resolve())
+
+    def apply(self, values: dict) -> dict:
+        changes = {name: value for name, value in values.items() if self.values.get(name) != value}
+        if not changes:
+            return changes
+
+        self.values = dict(values)
+        for name, value in changes.items():
+            setattr(settings, name, value)
+        self.reloads += 1
+
+        deferred = sorted(name for name in changes if name in RESTART_KEYS or name.startswith(RESTART_PREFIXES))
+        logger.info("CONFIG: Застосовано зміни: %s", ", ".join(sorted(changes)))
+        if deferred:
+            logger.warning("CONFIG: %s набудуть чинності після перепідключення або перезапуску.", ", ".join(deferred))
+
+        for callback, keys in list(self._subscribers):
+            if keys is not None and keys.isdisjoint(changes):
+                continue
+            try:
+                callback(changes)
+            except Exception as e:
+                logger.error("CONFIG: Помилка підписника %s: %s", callback, e)
+        return changes
+
+    async def _watch(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            mtime = self._file_mtime()
+            if mtime == self._mtime:
+                continue
+            self._mtime = mtime
+            try:
+                self.apply(self.resolve())
+            except ConfigError as e:
+                logger.error("CONFIG: Нова конфігурація відхилена, діють попередні значення. %s", e)
+
+    def start_watching(self, interval: Optional[float] = None):
+        """Стежить за файлом конфігурації й перезавантажує його після кожної зміни.
+
+        Файлу може ще не бути: щойно його створять, він буде прочитаний.
+        """
+        if self._watch_task is None or self._watch_task.done():
+            self._mtime = self._file_mtime()
+            self._watch_task = asyncio.get_running_loop().create_task(
+                self._watch(settings.CONFIG_WATCH_INTERVAL if interval is None else interval)
+            )
+            logger.info("CONFIG: Стежу за '%s' (профіль: %s).", self.path, self.profile or "—")
+
+    async def stop_watching(self):
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
+
+
+_config: Optional[RuntimeConfig] = None
+
+
+def get_config() -> RuntimeConfig:
+    global _config
+    if _config is None:
+        _config = RuntimeConfig()
+    return _config
+
+
+def load_config(path: Optional[str] = None, profile: Optional[str] = None) -> RuntimeConfig:
+    """Створює конфігурацію з файлу, профілю та оточення і застосовує її."""
+    global _config
+    config = RuntimeConfig(path, profile)
+    if _config is not None:
+        config._subscribers = _config._subscribers
+        config.values = _config.values
+    _config = config
+    config.load()
+    return config
@@ -1,13 +1,147 @@
+import os
 import logging
-from mini.mini_sdk import RobotType
 
 ROBOT_IP: str = "192.168.137.6"
 ROBOT_PORT: int = 8800
-ROBOT_TYPE: RobotType = RobotType.EDU
+# Файл конфігурації (TOML, JSON або YAML) з розділами [profiles.<ім'я>]; значення
+# з нього та зі змінних оточення ALPHA_MINI_<НАЗВА> перекривають константи нижче.
+# Шлях і профіль також задаються змінними ALPHA_MINI_CONFIG та ALPHA_MINI_PROFILE.
+CONFIG_FILE: str = os.path.join(os.path.expanduser("~"), ".alpha_mini", "config.toml")
+CONFIG_PROFILE: str | None = None
+# Як часто перевіряти, чи змінився файл конфігурації, с.
+CONFIG_WATCH_INTERVAL: float = 1.0
+
+# Ім'я члена mini.mini_sdk.RobotType. Сам ROBOT_TYPE створюється під час першого
+# звернення, щоб читання налаштувань не завантажувало SDK робота.
+ROBOT_TYPE_NAME: str = "EDU"
 LOG_LEVEL: int = logging.INFO
+# Структурований журнал: JSON-рядки з correlation_id, запис у фоновому потоці.
+LOG_STRUCTURED: bool = False
+# Файл для JSON-рядків (None — stderr).
+LOG_FILE: str | None = None
+# Частка DEBUG-записів балакучих логерів, що потрапляє в структурований журнал.
+LOG_DEBUG_SAMPLE_RATE: float = 0.1
+LOG_SAMPLED_LOGGERS: tuple = (
+    "alpha_mini_pkg.services.api_client",
+    "alpha_mini_pkg.services.speech_bus",
+    "alpha_mini_pkg.services.tts_tracker",
+    "alpha_mini_pkg.services.tts_cache",
+    "alpha_mini_pkg.core.command_scheduler",
+    "alpha_mini_pkg.core.speech_stream",
+    "listeners",
+)
 
 TARGET_COMMAND: str = "good boy"
 
 DEFAULT_STEPS: int = 5
+# Максимальна кількість кроків в одній команді ходьби.
+MAX_WALK_STEPS: int = 20
+
+# Планувальник руху в динамічному режимі: команди, що надійшли протягом
+# вікна (і поки робот ще йде), об'єднуються в один маршрут.
+MOTION_COALESCE_WINDOW: float = 0.3
+# Найбільша кількість кроків в одному запиті MoveRobot; довші відрізки маршруту діляться.
+MOTION_CHUNK_STEPS: int = 10
 
+# Максимальний час очікування готовності робота після входу в режим програмування.
 PROGRAM_MODE_WAIT_TIME: int = 6
+
+READINESS_POLL_INITIAL: float = 0.1
+READINESS_POLL_MAX: float = 1.0
+READINESS_PROBE_TIMEOUT: float = 0.5
+
+HEARTBEAT_INTERVAL: float = 1.0
+HEARTBEAT_PROBE_EVERY: int = 5
+HEARTBEAT_MAX_FAILURES: int = 2
+RECONNECT_BACKOFF_INITIAL: float = 0.5
+RECONNECT_BACKOFF_MAX: float = 10.0
+# Скільки команда чекає на відновлення з'єднання, перш ніж завершитися помилкою.
+COMMAND_RECONNECT_WAIT: float = 3.0
+
+# Дедлайни запитів до робота, с. Рух отримує додатково API_MOVE_STEP_SECONDS
+# на кожен крок, TTS — оцінку тривалості фрази.
+API_DEADLINE_DEFAULT: float = 10.0
+API_DEADLINES: dict = {
+    "MoveRobot": 5.0,
+    "StartPlayTTS": 5.0,
+    "PlayAction": 60.0,
+    "StopAllAction": 3.0,
+}
+API_MOVE_STEP_SECONDS: float = 1.5
+# Повтори ідемпотентних запитів (та запитів, що не дійшли до робота).
+API_RETRY_ATTEMPTS: int = 3
+API_RETRY_BACKOFF_INITIAL: float = 0.2
+API_RETRY_BACKOFF_MAX: float = 2.0
+# Запобіжник: скільки збоїв поспіль його розмикає і скільки він лишається розімкненим.
+CIRCUIT_FAILURE_THRESHOLD: int = 3
+CIRCUIT_RESET_TIMEOUT: float = 5.0
+
+# Каталог дій постачається разом із пакетом (package data).
+ACTIONS_FILE: str = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "actions.json"))
+
+TTS_CALIBRATION_FILE: str = os.path.join(os.path.expanduser("~"), ".alpha_mini", "tts_calibration.json")
+# Кеш фраз TTS: частоти й виміряні тривалості повторюваних фраз.
+TTS_PHRASE_CACHE_FILE: str = os.path.join(os.path.expanduser("~"), ".alpha_mini", "tts_phrases.json")
+TTS_PHRASE_CACHE_SIZE: int = 256
+# Скільки найчастіших фраз підтягується в кеш під час запуску.
+TTS_WARMUP_PHRASES: int = 32
+
+# Режим флоту: по одному запису {"name", "address", "port"} на робота;
+# необов'язковий "profile" обирає профіль файлу конфігурації для процесу робота.
+FLEET_DEVICES: list = [
+    {"name": "AlphaMini_1", "address": ROBOT_IP, "port": ROBOT_PORT},
+]
+
+# Телеметрія гарячого шляху (спани, гістограми затримок, лічильники помилок).
+# Вимкнена телеметрія майже нічого не коштує; порт None вимикає HTTP-ендпоінт Prometheus.
+TELEMETRY_ENABLED: bool = False
+TELEMETRY_PROMETHEUS_HOST: str = "127.0.0.1"
+TELEMETRY_PROMETHEUS_PORT: int | None = 9108
+# Шлях до файлу JSONL, куди пишеться кожен завершений спан (None — не писати).
+TELEMETRY_JSONL_FILE: str | None = None
+
+# Локальний шлюз керування (websocket): інші програми надсилають команди
+# через те саме з'єднання з роботом. Вимкнений за замовчуванням.
+GATEWAY_ENABLED: bool = False
+GATEWAY_HOST: str = "127.0.0.1"
+GATEWAY_PORT: int = 8765
+# Якщо задано, клієнт підключається як ws://host:port/?token=<GATEWAY_TOKEN>.
+GATEWAY_TOKEN: str | None = None
+GATEWAY_MAX_CLIENTS: int = 64
+# Скільки команд один клієнт може виконувати одночасно та скільки команд у пакеті.
+GATEWAY_MAX_INFLIGHT: int = 16
+GATEWAY_MAX_BATCH: int = 32
+# Скільки подій чекає на повільного клієнта, перш ніж нові події для нього відкидаються.
+GATEWAY_CLIENT_QUEUE: int = 256
+# Як часто перевіряється стан платформи для подій "status".
+GATEWAY_STATUS_INTERVAL: float = 0.5
+
+# Діагностика циклу подій: затримка циклу, кількість задач і стек коду,
+# що блокує цикл довше за DIAG_SLOW_CALLBACK секунд.
+DIAG_ENABLED: bool = True
+# Як часто вимірюється затримка циклу подій, с.
+DIAG_LAG_INTERVAL: float = 0.25
+DIAG_SLOW_CALLBACK: float = 0.1
+# Задача слухача, що лишилася незавершеною так довго після його зупинки, вважається втраченою.
+DIAG_TASK_LEAK_SECONDS: float = 30.0
+# Профілювальник вибірок вмикається й вимикається сигналом SIGUSR2
+# (python -m alpha_mini_pkg.utils.diagnostics profile <pid>) і пише
+# згорнуті стеки для flamegraph.pl / speedscope у DIAG_PROFILE_DIR.
+DIAG_PROFILE_INTERVAL: float = 0.005
+DIAG_PROFILE_DIR: str = os.path.join(os.path.expanduser("~"), ".alpha_mini", "profiles")
+
+# Журнал сесії: фрази, рішення диспетчера та запити до робота у бінарних
+# сегментах, які можна відтворити (python -m alpha_mini_pkg.simulator.replay).
+# None вимикає журнал.
+JOURNAL_DIR: str | None = None
+# Розмір одного сегмента; заповнений сегмент закривається й починається новий.
+JOURNAL_SEGMENT_BYTES: int = 4 * 1024 * 1024
+# Скільки сегментів зберігати в каталозі; найстаріші видаляються.
+JOURNAL_MAX_SEGMENTS: int = 16
+
+
+def __getattr__(name: str):
+    if name == "ROBOT_TYPE":
+        from mini.mini_sdk import RobotType
+        return RobotType[ROBOT_TYPE_NAME]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
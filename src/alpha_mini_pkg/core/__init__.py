@@ -1,20 +1,62 @@
-from .command_handler import robot_command_handler
-from .dynamic_listener import create_dynamic_listener, DynamicListener
-from .actions_wrapper import (
-    action_walk, 
-    action_speak, 
-    action_play_named, 
-)
-from mini.apis.api_action import MoveRobotDirection
+from alpha_mini_pkg.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    'robot_command_handler': '.command_handler',
+    'get_command_handler': '.command_handler',
+    'CommandHandler': '.command_handler',
+
+    'create_dynamic_listener': '.dynamic_listener',
+    'DynamicListener': '.dynamic_listener',
+    'open_speech_stream': '.dynamic_listener',
+    'SpeechStream': '.speech_stream',
+
+    'action_walk': '.actions_wrapper',
+    'action_speak': '.actions_wrapper',
+    'action_play_named': '.actions_wrapper',
+    'action_stop': '.actions_wrapper',
+
+    'CommandScheduler': '.command_scheduler',
+    'Channel': '.command_scheduler',
+    'get_command_scheduler': '.command_scheduler',
+
+    'MotionPlanner': '.motion_planner',
+    'get_motion_planner': '.motion_planner',
+
+    'ActionSequence': '.choreography',
+    'SequenceError': '.choreography',
+    'load_sequence': '.choreography',
+    'run_sequence': '.choreography',
+
+    'MoveRobotDirection': 'mini.apis.api_action',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     'robot_command_handler',
+    'get_command_handler',
+    'CommandHandler',
     'create_dynamic_listener',
     'DynamicListener',
+    'open_speech_stream',
+    'SpeechStream',
     
     'action_walk',
     'action_speak',
     'action_play_named',
+    'action_stop',
+
+    'CommandScheduler',
+    'Channel',
+    'get_command_scheduler',
+
+    'MotionPlanner',
+    'get_motion_planner',
+
+    'ActionSequence',
+    'SequenceError',
+    'load_sequence',
+    'run_sequence',
     
     'MoveRobotDirection',
-]
\ No newline at end of file
+]
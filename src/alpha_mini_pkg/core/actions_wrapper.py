@@ -1,23 +1,35 @@
 import logging
 from mini.apis.api_action import MoveRobotDirection 
 from alpha_mini_pkg.services import api_client 
-from alpha_mini_pkg.utils.helpers import estimate_tts_duration, safe_delay
+from alpha_mini_pkg.services.action_catalog import get_action_catalog
+from alpha_mini_pkg.services.tts_tracker import get_tts_tracker
+from alpha_mini_pkg.core.command_scheduler import Channel, PRIORITY_HIGH, get_command_scheduler
+from alpha_mini_pkg.utils.telemetry import get_telemetry
 
 logger = logging.getLogger(__name__)
 
 async def action_walk(steps: int, direction: MoveRobotDirection = MoveRobotDirection.FORWARD) -> bool:
-    logger.info(f"WRAPPER: Запуск руху: {direction.name}, {steps} кроків.")
-    return await api_client.move_robot(steps=steps, direction=direction)
+    logger.info("WRAPPER: Запуск руху: %s, %s кроків.", direction.name, steps)
+    with get_telemetry().span("wrapper", action="walk"):
+        return await get_command_scheduler().submit(
+            Channel.MOTION,
+            lambda: api_client.move_robot(steps=steps, direction=direction),
+            label=f"walk {steps} {direction.name}",
+        )
 
 
 async def action_speak(text: str) -> bool:
-    logger.info(f'WRAPPER: Запуск мови: "{text[:30]}..."')
+    logger.info("WRAPPER: Запуск мови: \"%s...\"", text[:30])
     
-    success = await api_client.start_tts(text=text)
+    with get_telemetry().span("wrapper", action="speak"):
+        success = await get_command_scheduler().submit(
+            Channel.SPEECH,
+            lambda: get_tts_tracker().speak(text),
+            label=f"speak '{text[:30]}'",
+            key=("speak", text),
+        )
 
     if success:
-        tts_duration = estimate_tts_duration(text)
-        await safe_delay(tts_duration, f"Очікування завершення TTS ({tts_duration:.2f} с.)")
         logger.info("WRAPPER: Мова (TTS) завершена.")
         return True
     
@@ -26,8 +38,36 @@ async def action_speak(text: str) -> bool:
 
 
 async def action_play_named(action_name: str) -> bool:
-    logger.info(f"WRAPPER: Запуск дії: '{action_name}'.")
-    return await api_client.play_named_action(action_name)
+    catalog = get_action_catalog()
+
+    if catalog.loaded:
+        entry = catalog.resolve(action_name)
+        if entry is None:
+            logger.warning("WRAPPER: Невідома дія '%s'. Запит до робота не надсилається.", action_name)
+            return False
+        action_name = entry.id
+
+    logger.info("WRAPPER: Запуск дії: '%s'.", action_name)
+    with get_telemetry().span("wrapper", action="play"):
+        return await get_command_scheduler().submit(
+            Channel.ACTION,
+            lambda: api_client.play_named_action(action_name),
+            label=f"action {action_name}",
+        )
+
+
+async def action_stop() -> bool:
+    logger.info("WRAPPER: Зупинка руху та дій.")
+    scheduler = get_command_scheduler()
+    scheduler.preempt(Channel.MOTION, Channel.ACTION, reason="команда 'stop'")
+    with get_telemetry().span("wrapper", action="stop"):
+        return await scheduler.submit(
+            Channel.ACTION,
+            api_client.stop_all_actions,
+            label="stop",
+            priority=PRIORITY_HIGH,
+            key="stop",
+        )
 
 
 def get_speech_listener_observer():
@@ -0,0 +1,282 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Iterable, Optional
+
+from mini.apis.api_action import MoveRobotDirection
+from alpha_mini_pkg.config import settings
+from alpha_mini_pkg.core.command_scheduler import Channel, MAX_PENDING_PER_CHANNEL, get_command_scheduler
+from alpha_mini_pkg.services import api_client
+from alpha_mini_pkg.services.action_catalog import get_action_catalog
+from alpha_mini_pkg.services.tts_tracker import get_tts_tracker
+
+logger = logging.getLogger(__name__)
+
+# Скільки кроків одного каналу може одночасно стояти в черзі планувальника,
+# щоб довга послідовність не витісняла інші команди з обмеженої черги.
+PIPELINE_WINDOW: int = max(1, MAX_PENDING_PER_CHANNEL // 2)
+
+_STEP_KINDS = ("action", "walk", "speak", "pause", "wait")
+_STEP_OPTIONS = {"at", "direction"}
+
+
+class SequenceError(ValueError):
+    """Послідовність не пройшла перевірку; ``problems`` містить усі знайдені помилки."""
+
+    def __init__(self, problems: list):
+        self.problems = problems
+        super().__init__("; ".join(problems))
+
+
+class SequenceStep:
+    __slots__ = ("index", "kind", "channel", "value", "direction", "at", "label")
+
+    def __init__(self, index: int, kind: str, value, direction: Optional[MoveRobotDirection] = None,
+                 at: Optional[float] = None):
+        self.index = index
+        self.kind = kind
+        self.value = value
+        self.direction = direction
+        self.at = at
+        self.channel = {
+            "action": Channel.ACTION,
+            "walk": Channel.MOTION,
+            "speak": Channel.SPEECH,
+        }.get(kind)
+        if kind == "walk":
+            self.label = f"#{index} walk {value} {direction.name}"
+        else:
+            self.label = f"#{index} {kind} {str(value)[:30]}"
+
+    def factory(self):
+        if self.kind == "action":
+            return lambda: api_client.play_named_action(self.value)
+        if self.kind == "walk":
+            return lambda: api_client.move_robot(steps=self.value, direction=self.direction)
+        return lambda: get_tts_tracker().speak(self.value)
+
+    def __repr__(self) -> str:
+        return f"SequenceStep({self.label!r})"
+
+
+class ActionSequence:
+    """
+    Декларативна послідовність дій, ходьби та мови.
+
+    Кроки одного каналу виконуються по черзі, а різні канали працюють
+    паралельно: мова звучить під час руху, а рух і дії, як і завжди, ділять
+    тіло робота через планувальник. Усі кроки каналу передаються
+    планувальнику наперед (у межах PIPELINE_WINDOW), тож наступний запит
+    іде до робота одразу після відповіді на попередній, без повернення в цей
+    код. Крок ``{"wait": true}`` чекає завершення всіх попередніх кроків,
+    ``{"pause": секунди}`` — те саме з паузою, а поле ``"at"`` задає
+    найраніший момент старту кроку від початку послідовності.
+
+    Приклад::
+
+        {"name": "greeting", "steps": [
+            {"speak": "Hello everyone!"},
+            {"action": "011"},
+            {"walk": 2, "direction": "forward", "at": 0.5},
+            {"wait": true},
+            {"action": "Big Laugh"}
+        ]}
+    """
+
+    def __init__(self, steps: list, name: str = "sequence"):
+        self.name = name
+        self.steps = steps
+        self._stages = self._split_stages(steps)
+
+    @classmethod
+    def from_spec(cls, spec, name: Optional[str] = None) -> "ActionSequence":
+        if isinstance(spec, dict):
+            name = name or spec.get("name")
+            raw_steps = spec.get("steps")
+        else:
+            raw_steps = spec
+        if not isinstance(raw_steps, list):
+            raise SequenceError(["послідовність має містити список 'steps'"])
+
+        catalog = get_action_catalog()
+        steps, problems = [], []
+        for index, raw in enumerate(raw_steps):
+            step = _parse_step(index, raw, catalog, problems)
+            if step is not None:
+                steps.append(step)
+
+        if problems:
+            raise SequenceError(problems)
+        return cls(steps, name or "sequence")
+
+    @classmethod
+    def from_file(cls, path: str) -> "ActionSequence":
+        with open(path, "r", encoding="utf-8") as f:
+            if os.path.splitext(path)[1].lower() in (".yaml", ".yml"):
+                try:
+                    import yaml
+                except ImportError:
+                    raise SequenceError([f"для '{path}' потрібен пакет PyYAML"])
+                spec = yaml.safe_load(f)
+            else:
+                spec = json.load(f)
+        default_name = os.path.splitext(os.path.basename(path))[0]
+        return cls.from_spec(spec, name=spec.get("name", default_name) if isinstance(spec, dict) else default_name)
+
+    @staticmethod
+    def _split_stages(steps: Iterable[SequenceStep]) -> list:
+        stages, current = [], []
+        for step in steps:
+            if step.kind in ("wait", "pause"):
+                stages.append((current, step))
+                current = []
+            else:
+                current.append(step)
+        stages.append((current, None))
+        return stages
+
+    async def run(self) -> list:
+        """
+        Виконує послідовність і повертає результат кожного кроку (True/False).
+        Після першого невдалого кроку ще не надіслані кроки скасовуються.
+        """
+        results = [None] * len(self.steps)
+        positions = {id(step): i for i, step in enumerate(self.steps)}
+        started = time.perf_counter()
+        aborted = asyncio.Event()
+        logger.info(f"SEQUENCE: Запуск '{self.name}' ({len(self.steps)} кроків).")
+
+        for stage, barrier in self._stages:
+            if stage and not aborted.is_set():
+                lanes = {}
+                for step in stage:
+                    lanes.setdefault(step.channel, []).append(step)
+                stage_results = await asyncio.gather(
+                    *(self._run_lane(steps, started, aborted) for steps in lanes.values())
+                )
+                for lane_results in stage_results:
+                    for step, ok in lane_results:
+                        results[positions[id(step)]] = ok
+
+            if barrier is not None:
+                results[positions[id(barrier)]] = not aborted.is_set()
+                if barrier.kind == "pause" and not aborted.is_set():
+                    await asyncio.sleep(barrier.value)
+
+        elapsed = time.perf_counter() - started
+        done = sum(1 for ok in results if ok)
+        logger.info(f"SEQUENCE: '{self.name}' завершено: {done}/{len(results)} кроків за {elapsed:.2f} с.")
+        return [bool(ok) for ok in results]
+
+    async def _run_lane(self, steps: list, started: float, aborted: asyncio.Event) -> list:
+        loop = asyncio.get_running_loop()
+        scheduler = get_command_scheduler()
+        window = asyncio.Semaphore(PIPELINE_WINDOW)
+        in_flight = []
+
+        async def submit(step: SequenceStep) -> bool:
+            try:
+                ok = await scheduler.submit(step.channel, step.factory(), label=step.label)
+            finally:
+                window.release()
+            if not ok and not aborted.is_set():
+                logger.warning(f"SEQUENCE: Крок '{step.label}' не виконано, решту '{self.name}' скасовано.")
+                aborted.set()
+            return bool(ok)
+
+        for step in steps:
+            await window.acquire()
+            if aborted.is_set():
+                window.release()
+                break
+            if step.at is not None:
+                delay = started + step.at - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            in_flight.append((step, loop.create_task(submit(step))))
+
+        abort_waiter = loop.create_task(aborted.wait())
+        try:
+            pending = {task for _, task in in_flight}
+            while pending and not aborted.is_set():
+                _, pending = await asyncio.wait(pending | {abort_waiter}, return_when=asyncio.FIRST_COMPLETED)
+                pending.discard(abort_waiter)
+        finally:
+            abort_waiter.cancel()
+
+        lane_results = []
+        for step, task in in_flight:
+            if not task.done():
+                task.cancel()
+            try:
+                lane_results.append((step, await task))
+            except asyncio.CancelledError:
+                lane_results.append((step, False))
+        return lane_results
+
+
+def _parse_step(index: int, raw, catalog, problems: list) -> Optional[SequenceStep]:
+    where = f"крок {index}"
+    if not isinstance(raw, dict):
+        problems.append(f"{where}: очікується об'єкт, отримано {type(raw).__name__}")
+        return None
+
+    kinds = [kind for kind in _STEP_KINDS if kind in raw]
+    unknown = set(raw) - set(_STEP_KINDS) - _STEP_OPTIONS
+    if unknown:
+        problems.append(f"{where}: невідомі поля {sorted(unknown)}")
+    if len(kinds) != 1:
+        problems.append(f"{where}: має бути рівно одне з {list(_STEP_KINDS)}")
+        return None
+
+    kind = kinds[0]
+    value = raw[kind]
+    at = raw.get("at")
+    if at is not None and (not isinstance(at, (int, float)) or at < 0):
+        problems.append(f"{where}: 'at' має бути невід'ємним числом секунд")
+        at = None
+
+    if kind == "action":
+        entry = None
+        if isinstance(value, str):
+            entry = catalog.get(value.strip()) or catalog.by_name(value) if catalog.loaded else None
+        if catalog.loaded and entry is None:
+            problems.append(f"{where}: дії {value!r} немає в actions.json")
+            return None
+        return SequenceStep(index, kind, entry.id if entry else value, at=at)
+
+    if kind == "walk":
+        direction_name = str(raw.get("direction", "forward")).upper()
+        direction = MoveRobotDirection.__members__.get(direction_name)
+        if direction is None:
+            problems.append(f"{where}: невідомий напрямок {raw.get('direction')!r}")
+        if not isinstance(value, int) or isinstance(value, bool) or not 1 <= value <= settings.MAX_WALK_STEPS:
+            problems.append(f"{where}: кількість кроків має бути цілим числом від 1 до {settings.MAX_WALK_STEPS}")
+            return None
+        return SequenceStep(index, kind, value, direction=direction, at=at) if direction else None
+
+    if kind == "speak":
+        if not isinstance(value, str) or not value.strip():
+            problems.append(f"{where}: текст для мови порожній")
+            return None
+        return SequenceStep(index, kind, value.strip(), at=at)
+
+    if kind == "pause":
+        if not isinstance(value, (int, float)) or isinstance(value, bool) or value < 0:
+            problems.append(f"{where}: пауза має бути невід'ємним числом секунд")
+            return None
+        return SequenceStep(index, kind, float(value))
+
+    return SequenceStep(index, kind, True)
+
+
+def load_sequence(path: str) -> ActionSequence:
+    return ActionSequence.from_file(path)
+
+
+async def run_sequence(spec) -> list:
+    """Перевіряє й виконує послідовність зі словника, списку кроків або шляху до файлу."""
+    sequence = load_sequence(spec) if isinstance(spec, str) else ActionSequence.from_spec(spec)
+    return await sequence.run()
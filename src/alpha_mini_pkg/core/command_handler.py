@@ -1,6 +1,9 @@
 import logging
-from typing import Callable, Coroutine
+from typing import Callable, Coroutine, Optional
 from alpha_mini_pkg.core import actions_wrapper
+from alpha_mini_pkg.core.command_matcher import PhraseMatcher
+from alpha_mini_pkg.utils.journal import get_journal
+from alpha_mini_pkg.utils.telemetry import correlation_id, get_telemetry
 
 logger = logging.getLogger(__name__)
 
@@ -9,14 +12,15 @@ CommandHandlerBlock = Callable[[str], Coroutine]
 class CommandHandler:
     
     def __init__(self):
-        self._command_map: dict[str, CommandHandlerBlock] = {}
+        self._matcher: PhraseMatcher[CommandHandlerBlock] = PhraseMatcher()
         self.is_dynamic_mode_active: bool = False
         self.register_handler("start", self._handle_main_algorithm_trigger)
         self.register_handler("hello", lambda t: actions_wrapper.action_speak("Hello, I am ready."))
+        self.register_handler("stop", lambda t: actions_wrapper.action_stop(), priority=10)
         
-    def register_handler(self, key_phrase: str, handler_func: CommandHandlerBlock):
+    def register_handler(self, key_phrase: str, handler_func: CommandHandlerBlock, priority: int = 0):
         key = key_phrase.strip().lower()
-        self._command_map[key] = handler_func
+        self._matcher.add(key, handler_func, priority)
     
     async def _handle_main_algorithm_trigger(self, text: str):
         
@@ -32,36 +36,72 @@ class CommandHandler:
         try:
             await execute_main_algorithm(text)
         except Exception as e:
-            logger.error(f"HANDLER: Помилка виконання алгоритму: {e}")
+            logger.error("HANDLER: Помилка виконання алгоритму: %s", e)
             await actions_wrapper.action_speak("An error occurred in the main algorithm.")
         finally:
             self.is_dynamic_mode_active = False
             logger.info("HANDLER: Main Algorithm завершено. Динамічний режим вимкнено.")
         
-    async def handle_speech_command(self, text: str):
+    async def handle_speech_command(self, text: str) -> tuple[Optional[str], bool]:
+        """
+        Виконує команду з фрази.
+
+        Повертає пару (ключова фраза обробника або None, успіх): успіх хибний,
+        якщо команду проігноровано, не розпізнано, обробник упав або повернув False.
+        """
+        telemetry = get_telemetry()
+        telemetry.mark("dispatch")
+
         if self.is_dynamic_mode_active:
-            logger.debug(f"HANDLER: Ігнорую команду '{text}' (Динамічний режим активний).")
-            return
+            logger.debug("HANDLER: Ігнорую команду '%s' (Динамічний режим активний).", text)
+            telemetry.count("alpha_commands_ignored_total")
+            get_journal().dispatch(correlation_id.get(), text, "ignored")
+            return None, False
+
+        with telemetry.span("handle"):
+            return await self._dispatch(text)
 
+    async def _dispatch(self, text: str) -> tuple[Optional[str], bool]:
+        telemetry = get_telemetry()
         normalized_text = text.strip().lower()
-        logger.info(f"HANDLER: Отримано команду: '{normalized_text}'")
+        logger.info("HANDLER: Отримано команду: '%s'", normalized_text)
 
-        matched_handler = None
-        for key_phrase, handler_func in self._command_map.items():
-            if key_phrase in normalized_text:
-                matched_handler = handler_func
-                break
+        with telemetry.span("match"):
+            match = self._matcher.search(normalized_text)
+        matched_handler = match.value if match else None
+        telemetry.count("alpha_commands_total", command=match.phrase if match else "unmatched")
+        get_journal().dispatch(correlation_id.get(), text, match.phrase if match else "unmatched")
 
         if matched_handler:
-            logger.info("HANDLER: Виконання команди...")
+            logger.info("HANDLER: Виконання команди '%s'...", match.phrase)
             try:
-                await matched_handler(text) 
-                logger.info("HANDLER: Виконання завершено.")
+                result = await matched_handler(text)
             except Exception as e:
-                logger.error(f"HANDLER: Помилка виконання: {e}")
+                logger.error("HANDLER: Помилка виконання: %s", e)
                 await actions_wrapper.action_speak("Error during command execution.")
+                return match.phrase, False
+            if result is False:
+                logger.warning("HANDLER: Команда '%s' не виконана.", match.phrase)
+                return match.phrase, False
+            logger.info("HANDLER: Виконання завершено.")
+            return match.phrase, True
         else:
-            logger.debug(f"HANDLER: Не знайдено обробника для '{normalized_text}'.")
-            await actions_wrapper.action_speak(f"I heard {text}, but I'll only respond to 'start' or 'hello'.")
+            logger.debug("HANDLER: Не знайдено обробника для '%s'.", normalized_text)
+            await actions_wrapper.action_speak(f"I heard {text}, but I'll only respond to 'start', 'hello' or 'stop'.")
+            return None, False
+
+_command_handler: Optional[CommandHandler] = None
+
+
+def get_command_handler() -> CommandHandler:
+    global _command_handler
+    if _command_handler is None:
+        _command_handler = CommandHandler()
+    return _command_handler
+
 
-robot_command_handler = CommandHandler()
\ No newline at end of file
+def __getattr__(name: str):
+    # Зворотна сумісність: обробник створюється під час першого звернення, а не імпорту модуля.
+    if name == "robot_command_handler":
+        return get_command_handler()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,152 @@
+import logging
+from collections import deque
+from typing import Any, Generic, Iterator, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PhraseMatch(Generic[T]):
+    __slots__ = ("phrase", "value", "priority", "start", "end")
+
+    def __init__(self, phrase: str, value: T, priority: int, start: int, end: int):
+        self.phrase = phrase
+        self.value = value
+        self.priority = priority
+        self.start = start
+        self.end = end
+
+    def __repr__(self) -> str:
+        return f"PhraseMatch({self.phrase!r}, priority={self.priority}, span=({self.start}, {self.end}))"
+
+
+class _Phrase:
+    __slots__ = ("text", "value", "priority", "rank")
+
+    def __init__(self, text: str, value: Any, priority: int):
+        self.text = text
+        self.value = value
+        self.priority = priority
+        self.rank = (priority, len(text))
+
+
+class _Node:
+    __slots__ = ("children", "fail", "phrase", "best")
+
+    def __init__(self):
+        self.children: dict = {}
+        self.fail: Optional["_Node"] = None
+        self.phrase: Optional[_Phrase] = None
+        self.best: Optional[_Phrase] = None
+
+
+class PhraseMatcher(Generic[T]):
+    """
+    Автомат Ахо-Корасік для пошуку ключових фраз у розпізнаному тексті.
+
+    Фрази додаються в трі інкрементально; суфіксні посилання перебудовуються
+    ліниво перед першим пошуком після змін. Пошук виконується за один прохід
+    по тексту, а серед усіх збігів перемагає фраза з найвищим пріоритетом,
+    потім найдовша, потім та, що почалася раніше.
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self._phrases: dict[str, _Phrase] = {}
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._phrases)
+
+    def __contains__(self, phrase: str) -> bool:
+        return phrase in self._phrases
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._phrases)
+
+    def add(self, phrase: str, value: T, priority: int = 0):
+        if not phrase:
+            raise ValueError("Ключова фраза не може бути порожньою.")
+
+        existing = self._phrases.get(phrase)
+        if existing is not None:
+            existing.value = value
+            if existing.priority != priority:
+                existing.priority = priority
+                existing.rank = (priority, len(phrase))
+                self._dirty = True
+            return
+
+        node = self._root
+        for char in phrase:
+            child = node.children.get(char)
+            if child is None:
+                child = _Node()
+                node.children[char] = child
+            node = child
+
+        entry = _Phrase(phrase, value, priority)
+        node.phrase = entry
+        self._phrases[phrase] = entry
+        self._dirty = True
+
+    def get(self, phrase: str) -> Optional[T]:
+        entry = self._phrases.get(phrase)
+        return entry.value if entry is not None else None
+
+    def _build(self):
+        root = self._root
+        root.fail = root
+        root.best = root.phrase
+        queue = deque()
+
+        for child in root.children.values():
+            child.fail = root
+            child.best = child.phrase
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for char, child in node.children.items():
+                fail = node.fail
+                while fail is not root and char not in fail.children:
+                    fail = fail.fail
+                target = fail.children.get(char)
+                child.fail = target if target is not None and target is not child else root
+
+                inherited = child.fail.best
+                own = child.phrase
+                if own is None or (inherited is not None and inherited.rank > own.rank):
+                    child.best = inherited
+                else:
+                    child.best = own
+                queue.append(child)
+
+        self._dirty = False
+        logger.debug(f"MATCHER: Автомат перебудовано ({len(self._phrases)} фраз).")
+
+    def search(self, text: str) -> Optional[PhraseMatch[T]]:
+        if not self._phrases:
+            return None
+        if self._dirty:
+            self._build()
+
+        root = self._root
+        node = root
+        best: Optional[_Phrase] = None
+        best_end = 0
+
+        for index, char in enumerate(text):
+            while node is not root and char not in node.children:
+                node = node.fail
+            node = node.children.get(char, root)
+
+            candidate = node.best
+            if candidate is not None and (best is None or candidate.rank > best.rank):
+                best = candidate
+                best_end = index + 1
+
+        if best is None:
+            return None
+        return PhraseMatch(best.text, best.value, best.priority, best_end - len(best.text), best_end)
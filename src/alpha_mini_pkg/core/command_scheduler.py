@@ -0,0 +1,279 @@
+import asyncio
+import contextvars
+import enum
+import heapq
+import itertools
+import logging
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from alpha_mini_pkg.utils.telemetry import get_telemetry
+
+logger = logging.getLogger(__name__)
+
+CommandFactory = Callable[[], Awaitable[Any]]
+
+PRIORITY_NORMAL: int = 0
+PRIORITY_HIGH: int = 100
+
+MAX_PENDING_PER_CHANNEL: int = 8
+DEFAULT_MAX_AGE: float = 15.0
+
+
+class Channel(enum.Enum):
+    MOTION = "motion"
+    SPEECH = "speech"
+    ACTION = "action"
+
+
+_BODY_CHANNELS = (Channel.MOTION, Channel.ACTION)
+
+
+class _ScheduledCommand:
+    __slots__ = ("priority", "seq", "key", "factory", "future", "created", "max_age", "waiters", "task", "label",
+                 "dropped", "context")
+
+    def __init__(self, priority: int, seq: int, key: Optional[Hashable], factory: CommandFactory,
+                 future: asyncio.Future, created: float, max_age: float, label: str):
+        self.priority = priority
+        self.seq = seq
+        self.key = key
+        self.factory = factory
+        self.future = future
+        self.created = created
+        self.max_age = max_age
+        self.waiters = 1
+        self.task: Optional[asyncio.Task] = None
+        self.label = label
+        self.dropped = False
+        # Контекст того, хто подав команду: correlation_id і трасування фрази, а не воркера каналу.
+        self.context = contextvars.copy_context()
+
+    def __lt__(self, other: "_ScheduledCommand") -> bool:
+        return (-self.priority, self.seq) < (-other.priority, other.seq)
+
+    def drop(self, reason: str):
+        if not self.future.done():
+            logger.info("SCHEDULER: Команду '%s' скасовано: %s.", self.label, reason)
+            self.dropped = True
+            self.future.set_result(False)
+
+
+class _ChannelQueue:
+    def __init__(self, channel: Channel, max_pending: int, lock: Optional[asyncio.Lock]):
+        self.channel = channel
+        self.max_pending = max_pending
+        self._lock = lock
+        self._heap: list = []
+        self._by_key: dict = {}
+        self._not_empty = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+        self.current: Optional[_ScheduledCommand] = None
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def put(self, command: _ScheduledCommand) -> _ScheduledCommand:
+        if command.key is not None:
+            pending = self._by_key.get(command.key)
+            if pending is not None and not pending.future.done():
+                pending.waiters += 1
+                logger.debug("SCHEDULER[%s]: Об'єднано дублікат '%s'.", self.channel.value, command.label)
+                return pending
+
+        if len(self._heap) >= self.max_pending:
+            lowest = max(self._heap)
+            if command.priority <= lowest.priority:
+                command.drop(f"черга '{self.channel.value}' переповнена")
+                return command
+            self._remove(lowest)
+            lowest.drop(f"витіснено командою з вищим пріоритетом у черзі '{self.channel.value}'")
+
+        heapq.heappush(self._heap, command)
+        if command.key is not None:
+            self._by_key[command.key] = command
+        self._not_empty.set()
+        self._ensure_worker()
+        return command
+
+    def cancel_pending(self, below_priority: Optional[int] = None, reason: str = "скасовано") -> int:
+        dropped = [c for c in self._heap if below_priority is None or c.priority < below_priority]
+        for command in dropped:
+            self._remove(command)
+            command.drop(reason)
+        return len(dropped)
+
+    def cancel_current(self, reason: str = "перервано") -> bool:
+        command = self.current
+        if command is None or command.future.done():
+            return False
+        if command.task is None:
+            command.drop(reason)
+            return True
+        if command.task.done():
+            return False
+        logger.info("SCHEDULER[%s]: Переривання '%s': %s.", self.channel.value, command.label, reason)
+        command.task.cancel()
+        return True
+
+    def _remove(self, command: _ScheduledCommand):
+        self._heap.remove(command)
+        heapq.heapify(self._heap)
+        if command.key is not None and self._by_key.get(command.key) is command:
+            del self._by_key[command.key]
+        if not self._heap:
+            self._not_empty.clear()
+
+    def _pop(self) -> _ScheduledCommand:
+        command = heapq.heappop(self._heap)
+        if command.key is not None and self._by_key.get(command.key) is command:
+            del self._by_key[command.key]
+        if not self._heap:
+            self._not_empty.clear()
+        return command
+
+    def _ensure_worker(self):
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._not_empty.wait()
+            if not self._heap:
+                self._not_empty.clear()
+                continue
+            command = self._pop()
+
+            if command.future.done():
+                continue
+            if loop.time() - command.created > command.max_age:
+                command.drop("застаріла")
+                continue
+
+            self.current = command
+            try:
+                if self._lock is not None:
+                    async with self._lock:
+                        await self._execute(command)
+                else:
+                    await self._execute(command)
+            finally:
+                self.current = None
+
+    async def _execute(self, command: _ScheduledCommand):
+        if command.future.done():
+            return
+
+        # Задача копіює поточний контекст під час створення, тож створюємо її в контексті подавача.
+        command.task = command.context.run(asyncio.get_running_loop().create_task, command.factory())
+        try:
+            await asyncio.wait({command.task})
+        except asyncio.CancelledError:
+            command.task.cancel()
+            command.drop("планувальник зупинено")
+            raise
+
+        if command.future.done():
+            return
+        if command.task.cancelled():
+            command.drop("перервано командою з вищим пріоритетом")
+        elif command.task.exception() is not None:
+            command.future.set_exception(command.task.exception())
+        else:
+            command.future.set_result(command.task.result())
+
+    async def close(self):
+        self.cancel_pending(reason="планувальник зупинено")
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+
+
+class CommandScheduler:
+    """
+    Планувальник команд робота з окремими чергами для руху, мови та дій.
+
+    Канали виконуються паралельно (мова може звучати під час руху), але рух і
+    дії використовують спільне блокування тіла, тож робот ніколи не отримує
+    MoveRobot і PlayAction одночасно. Усередині каналу команди впорядковані
+    за пріоритетом, а черга має обмежену довжину. Ключ ``key`` передають лише
+    ідемпотентні команди (мовлення тієї самої фрази, stop): дублікат із тим
+    самим ключем, поки перша команда в черзі, приєднується до неї. Рух і
+    дії ключа не мають — повторене "walk 2 forward" має пройти двічі.
+    """
+
+    def __init__(self, max_pending: int = MAX_PENDING_PER_CHANNEL, max_age: float = DEFAULT_MAX_AGE):
+        self._max_pending = max_pending
+        self._max_age = max_age
+        self._seq = itertools.count()
+        self._queues: Optional[dict] = None
+
+    def _channels(self) -> dict:
+        if self._queues is None:
+            body_lock = asyncio.Lock()
+            self._queues = {
+                channel: _ChannelQueue(channel, self._max_pending, body_lock if channel in _BODY_CHANNELS else None)
+                for channel in Channel
+            }
+        return self._queues
+
+    def pending(self, channel: Channel) -> int:
+        return len(self._channels()[channel])
+
+    async def submit(self, channel: Channel, factory: CommandFactory, *, label: str = "",
+                     priority: int = PRIORITY_NORMAL, key: Optional[Hashable] = None,
+                     max_age: Optional[float] = None) -> Any:
+        loop = asyncio.get_running_loop()
+        command = _ScheduledCommand(
+            priority=priority,
+            seq=next(self._seq),
+            key=key,
+            factory=factory,
+            future=loop.create_future(),
+            created=loop.time(),
+            max_age=self._max_age if max_age is None else max_age,
+            label=label or channel.value,
+        )
+        command = self._channels()[channel].put(command)
+
+        try:
+            result = await asyncio.shield(command.future)
+        except asyncio.CancelledError:
+            command.waiters -= 1
+            if command.waiters <= 0 and command.task is None:
+                command.drop("очікувач скасований")
+            raise
+
+        if command.dropped:
+            get_telemetry().drop(channel.value)
+        return result
+
+    def preempt(self, *channels: Channel, reason: str = "пріоритетна команда") -> int:
+        queues = self._channels()
+        affected = 0
+        for channel in channels or tuple(Channel):
+            queue = queues[channel]
+            affected += queue.cancel_pending(below_priority=PRIORITY_HIGH, reason=reason)
+            affected += int(queue.cancel_current(reason))
+        return affected
+
+    async def shutdown(self):
+        if self._queues is None:
+            return
+        for queue in self._queues.values():
+            await queue.close()
+        self._queues = None
+
+
+_scheduler: Optional[CommandScheduler] = None
+
+
+def get_command_scheduler() -> CommandScheduler:
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = CommandScheduler()
+    return _scheduler
@@ -1,22 +1,37 @@
 import asyncio
 import logging
 from typing import Callable, Coroutine, Any, Optional
-from mini.apis.api_observe import SpeechRecogniseResponse
-from .actions_wrapper import get_speech_listener_observer, action_speak 
+from alpha_mini_pkg.services.speech_bus import DEFAULT_QUEUE_SIZE, DROP_OLDEST, SpeechSubscription, get_speech_bus
+from alpha_mini_pkg.core.speech_stream import SpeechStream
+from alpha_mini_pkg.utils.diagnostics import get_diagnostics
+from alpha_mini_pkg.utils.telemetry import get_telemetry
 
 logger = logging.getLogger(__name__)
 SpeechCallback = Callable[[str], Coroutine]
 
+# Пріоритет ексклюзивного захоплення мовлення динамічним режимом.
+DYNAMIC_CAPTURE_PRIORITY: int = 10
+
 class DynamicListener:
+    """
+    Тимчасово захоплює всі розпізнані фрази через спільну шину мовлення,
+    не відкриваючи нової підписки на боці робота. Поки слухач активний,
+    звичайний обробник команд фраз не отримує.
+    """
+
     def __init__(self, loop: asyncio.AbstractEventLoop):
         self._loop = loop
-        self._observer = get_speech_listener_observer() 
-        self._is_listening = False
+        self._bus = get_speech_bus()
+        self._subscription: Optional[SpeechSubscription] = None
         self._on_speaking_callback: Optional[SpeechCallback] = None
         self._stop_phrase: Optional[str] = None
-        self._stop_future: Optional[asyncio.Future] = None
+        self._tasks: set = set()
         logger.info("DYNAMIC_LISTENER: Ініціалізовано.")
 
+    @property
+    def _is_listening(self) -> bool:
+        return self._subscription is not None and not self._subscription.closed
+
     def on_speaking(self, callback: SpeechCallback):
         self._on_speaking_callback = callback
         logger.debug("DYNAMIC_LISTENER: Обробник on_speaking зареєстровано.")
@@ -24,55 +39,64 @@ class DynamicListener:
 
     def stop_when(self, key_phrase: str):
         self._stop_phrase = key_phrase.strip().lower()
-        logger.debug(f"DYNAMIC_LISTENER: Умова зупинки встановлена: '{self._stop_phrase}'")
+        logger.debug("DYNAMIC_LISTENER: Умова зупинки встановлена: '%s'", self._stop_phrase)
         return self
 
-    def _internal_handler(self, msg: SpeechRecogniseResponse):
-        if not self._is_listening:
-            return
-
-        if msg.isSuccess and msg.text:
-            text = msg.text
-            normalized_text = text.strip().lower()
-            logger.info(f"DYNAMIC_LISTENER: Розпізнано: '{normalized_text}'")
+    def stream(self, maxsize: int = DEFAULT_QUEUE_SIZE, overflow: str = DROP_OLDEST) -> SpeechStream:
+        """
+        Одразу захоплює мовлення й повертає потік фраз. Захоплення триває,
+        доки потік не вичерпано або не закрито (``aclose``/``stop``).
+        """
+        if self._is_listening:
+            raise RuntimeError("DynamicListener is already listening")
 
-            if self._stop_phrase and self._stop_phrase in normalized_text:
-                logger.info(f"DYNAMIC_LISTENER: Умова зупинки '{self._stop_phrase}' виконана.")
-                self.stop() 
-                if self._stop_future and not self._stop_future.done():
-                    self._loop.call_soon_threadsafe(self._stop_future.set_result, normalized_text)
-                return
+        self._bus.start()
+        self._subscription = self._bus.capture(
+            "dynamic", priority=DYNAMIC_CAPTURE_PRIORITY, maxsize=maxsize, overflow=overflow
+        )
+        logger.info("DYNAMIC_LISTENER: Динамічне прослуховування розпочато.")
+        stream = SpeechStream.from_subscription(self._subscription)
+        if self._stop_phrase:
+            stream = stream.take_until(self._stop_phrase)
+        return stream
 
-            if self._on_speaking_callback:
-                self._loop.create_task(self._on_speaking_callback(text))
-        else:
-            logger.warning(f"DYNAMIC_LISTENER: Помилка розпізнавання: {msg.resultCode}")
+    def _dispatch(self, text: str, received_at: float):
+        task = get_telemetry().spawn(self._loop, self._on_speaking_callback(text), "dynamic", text, received_at)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
     async def start(self) -> str:
         if self._is_listening:
             logger.warning("DYNAMIC_LISTENER: Вже прослуховується.")
             return ""
 
-        self._is_listening = True
-        self._observer.set_handler(self._internal_handler)
-        self._observer.start()
-        logger.info("DYNAMIC_LISTENER: Динамічне прослуховування розпочато.")
-
-        self._stop_future = self._loop.create_future()
+        stream = self.stream()
+        get_diagnostics().watch_tasks("dynamic_listener", self._tasks)
         try:
-            result = await self._stop_future
-            return result
-        except asyncio.CancelledError:
-            self.stop()
-            return ""
+            async for utterance in stream:
+                logger.info("DYNAMIC_LISTENER: Розпізнано: '%s'", utterance.normalized)
+                if self._on_speaking_callback:
+                    self._dispatch(utterance.text, utterance.received_at)
+            return stream.stopped_by or ""
         finally:
-            self.stop() 
+            self.stop()
+            get_diagnostics().release_tasks(self._tasks)
 
     def stop(self):
         if self._is_listening:
-            self._observer.stop()
-            self._is_listening = False
+            self._subscription.close()
             logger.info("DYNAMIC_LISTENER: Динамічне прослуховування зупинено.")
 
 def create_dynamic_listener(loop: asyncio.AbstractEventLoop) -> DynamicListener:
-    return DynamicListener(loop)
\ No newline at end of file
+    return DynamicListener(loop)
+
+
+def open_speech_stream(maxsize: int = DEFAULT_QUEUE_SIZE, overflow: str = DROP_OLDEST,
+                       loop: Optional[asyncio.AbstractEventLoop] = None) -> SpeechStream:
+    """
+    Потік розпізнаних фраз для ``async for``::
+
+        async for utterance in open_speech_stream(maxsize=8).dedupe(2.0).take_until("stop"):
+            ...
+    """
+    return DynamicListener(loop or asyncio.get_running_loop()).stream(maxsize, overflow)
@@ -0,0 +1,267 @@
+import asyncio
+import collections
+import logging
+import math
+from typing import Optional
+
+from alpha_mini_pkg.config import settings
+from alpha_mini_pkg.core.actions_wrapper import action_play_named, action_speak, action_walk
+from alpha_mini_pkg.utils.telemetry import get_telemetry
+
+logger = logging.getLogger(__name__)
+
+# Напрямок MoveRobot -> (вісь, знак): вісь 0 — вперед/назад, 1 — ліворуч/праворуч.
+_AXES = {"FORWARD": (0, 1), "BACKWARD": (0, -1), "LEFTWARD": (1, 1), "RIGHTWARD": (1, -1)}
+_DIRECTIONS = {value: name for name, value in _AXES.items()}
+
+# Дії, що повертають робота на місці: зміна курсу в градусах (проти годинникової стрілки).
+TURN_HEADINGS = {"turn_left_avatar": 90.0, "turn_right_avatar": -90.0}
+
+
+def _move_direction(axis: int, sign: int):
+    from mini.apis.api_action import MoveRobotDirection
+
+    return MoveRobotDirection[_DIRECTIONS[(axis, sign)]]
+
+
+def _steps(count: float, singular: str, plural: str) -> str:
+    count = round(abs(count))
+    return f"{count} {singular if count == 1 else plural}"
+
+
+class Pose:
+    """Положення робота, обчислене з виконаних кроків і поворотів (в кроках від початку)."""
+
+    __slots__ = ("x", "y", "heading")
+
+    def __init__(self):
+        self.x = 0.0
+        self.y = 0.0
+        self.heading = 0.0
+
+    def advance(self, axis: int, steps: int):
+        angle = math.radians(self.heading + (90.0 if axis == 1 else 0.0))
+        self.x += steps * math.cos(angle)
+        self.y += steps * math.sin(angle)
+
+    def turn(self, degrees: float):
+        self.heading = (self.heading + degrees) % 360.0
+
+    def describe(self) -> str:
+        forward, left = round(self.x), round(self.y)
+        if not forward and not left:
+            return "I am back where I started."
+        parts = []
+        if forward:
+            parts.append(_steps(forward, "step", "steps") + (" forward" if forward > 0 else " back"))
+        if left:
+            parts.append(_steps(left, "step", "steps") + (" left" if left > 0 else " right"))
+        return f"I am {' and '.join(parts)} from where I started."
+
+    def __repr__(self) -> str:
+        return f"Pose(x={self.x:.1f}, y={self.y:.1f}, heading={self.heading:.0f})"
+
+
+class _Move:
+    __slots__ = ("axis", "steps")
+
+    def __init__(self, axis: int, steps: int):
+        self.axis = axis
+        self.steps = steps
+
+    def __repr__(self) -> str:
+        return f"_Move({_DIRECTIONS[(self.axis, 1 if self.steps > 0 else -1)]} {abs(self.steps)})"
+
+
+class _Action:
+    __slots__ = ("action_id", "heading")
+
+    def __init__(self, action_id: str):
+        self.action_id = action_id
+        self.heading = TURN_HEADINGS.get(action_id)
+
+    def __repr__(self) -> str:
+        return f"_Action({self.action_id!r})"
+
+
+class MotionPlanner:
+    """
+    Планувальник руху між динамічним алгоритмом і action_walk.
+
+    Команди ходьби й дії не виконуються одразу, а стають у чергу маршруту.
+    Сусідні відрізки вздовж однієї осі об'єднуються ("walk 3 forward" і
+    "walk 2 forward" — один MoveRobot на 5 кроків), протилежні взаємно
+    знищуються, а протилежні повороти поспіль скасовуються. Інші дії
+    лишаються на своєму місці в маршруті й не дають об'єднувати відрізки
+    через себе. Довгий відрізок ділиться на частини по ``chunk_steps``
+    кроків; поки одна частина виконується, решта ще може злитися з
+    новими командами.
+
+    Один маршрут (серія від першої команди до виконання всієї черги)
+    проходить не більше MAX_WALK_STEPS кроків: уже зроблені кроки плюс
+    заплановані відрізки. Злиття не обходить цього обмеження —
+    ``plan_walk`` приймає лише стільки кроків, скільки лишилось у маршруті.
+
+    Черга виконується після ``coalesce_window`` секунд тиші, без
+    оголошень між рухами; наприкінці серії робот один раз повідомляє,
+    де він опинився за оцінкою ``pose``. Після зупинки чи невдалого
+    руху оцінка положення може не відповідати дійсності.
+    """
+
+    def __init__(self, coalesce_window: Optional[float] = None, chunk_steps: Optional[int] = None):
+        self._coalesce_window = coalesce_window
+        self._chunk_steps = chunk_steps
+        self.pose = Pose()
+        self.requested = 0
+        self.merged = 0
+        self.robot_calls = 0
+        self._walked = 0
+        self._pending: collections.deque = collections.deque()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def coalesce_window(self) -> float:
+        return settings.MOTION_COALESCE_WINDOW if self._coalesce_window is None else self._coalesce_window
+
+    @property
+    def chunk_steps(self) -> int:
+        return settings.MOTION_CHUNK_STEPS if self._chunk_steps is None else self._chunk_steps
+
+    @property
+    def pending(self) -> list:
+        return list(self._pending)
+
+    @property
+    def busy(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def metrics(self) -> dict:
+        return {
+            "requested": self.requested,
+            "merged": self.merged,
+            "robot_calls": self.robot_calls,
+            "pending": len(self._pending),
+        }
+
+    @property
+    def route_steps(self) -> int:
+        """Кроки поточного маршруту: уже надіслані роботу плюс ще заплановані."""
+        return self._walked + sum(abs(item.steps) for item in self._pending if isinstance(item, _Move))
+
+    def plan_walk(self, steps: int, direction_name: str) -> int:
+        """Додає відрізок до маршруту; повертає, скільки кроків прийнято з урахуванням MAX_WALK_STEPS."""
+        axis, sign = _AXES[direction_name]
+        self.requested += 1
+        last = self._pending[-1] if self._pending else None
+        if isinstance(last, _Move) and last.axis == axis:
+            budget = settings.MAX_WALK_STEPS - (self.route_steps - abs(last.steps))
+            merged = last.steps + sign * steps
+            if abs(merged) > budget:
+                merged = sign * budget
+            accepted = abs(merged - last.steps)
+            last.steps = merged
+            self.merged += 1
+            if last.steps == 0:
+                self._pending.pop()
+            logger.debug("PLANNER: Відрізок об'єднано: %s.", self._pending[-1] if self._pending else "скасовано")
+        else:
+            accepted = max(0, min(steps, settings.MAX_WALK_STEPS - self.route_steps))
+            if accepted:
+                self._pending.append(_Move(axis, sign * accepted))
+
+        if accepted < steps:
+            logger.warning("PLANNER: Маршрут обмежено %s кроками: прийнято %s з %s.",
+                           settings.MAX_WALK_STEPS, accepted, steps)
+            get_telemetry().count("alpha_motion_capped_total")
+        self._schedule()
+        return accepted
+
+    def plan_action(self, action_id: str):
+        self.requested += 1
+        action = _Action(action_id)
+        last = self._pending[-1] if self._pending else None
+        if (action.heading is not None and isinstance(last, _Action)
+                and last.heading is not None and last.heading + action.heading == 0):
+            self._pending.pop()
+            self.merged += 1
+            logger.debug("PLANNER: Протилежні повороти '%s' і '%s' скасовано.", last.action_id, action_id)
+        else:
+            self._pending.append(action)
+        self._schedule()
+
+    def _schedule(self):
+        if not self.busy:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _step(self, item) -> bool:
+        self.robot_calls += 1
+        if isinstance(item, _Action):
+            ok = await action_play_named(item.action_id)
+            if ok and item.heading is not None:
+                self.pose.turn(item.heading)
+            return ok
+
+        sign = 1 if item.steps > 0 else -1
+        chunk = min(abs(item.steps), self.chunk_steps)
+        if abs(item.steps) > chunk:
+            self._pending.appendleft(_Move(item.axis, item.steps - sign * chunk))
+        self._walked += chunk
+        ok = await action_walk(steps=chunk, direction=_move_direction(item.axis, sign))
+        if ok:
+            self.pose.advance(item.axis, sign * chunk)
+        return ok
+
+    async def _run(self):
+        telemetry = get_telemetry()
+        await asyncio.sleep(self.coalesce_window)
+        calls = 0
+        while self._pending:
+            item = self._pending.popleft()
+            calls += 1
+            if not await self._step(item):
+                dropped = len(self._pending)
+                self._pending.clear()
+                logger.warning("PLANNER: Крок маршруту %s не вдався, решту маршруту (%s) скасовано.", item, dropped)
+                telemetry.count("alpha_motion_aborted_total")
+                self._task = None
+                self._walked = 0
+                await action_speak("I could not finish the walk.")
+                return
+
+        telemetry.count("alpha_motion_bursts_total")
+        logger.info("PLANNER: Маршрут виконано за %s запитів, положення: %s.", calls, self.pose)
+        self._task = None
+        self._walked = 0
+        if calls:
+            await action_speak(f"Walk finished. {self.pose.describe()}")
+
+    async def wait_idle(self):
+        while self.busy:
+            await asyncio.wait({self._task})
+
+    def cancel(self) -> int:
+        """Скасовує маршрут, що ще не виконано; повертає кількість відкинутих кроків маршруту."""
+        dropped = len(self._pending)
+        self._pending.clear()
+        if self.busy:
+            self._task.cancel()
+        self._task = None
+        self._walked = 0
+        if dropped:
+            logger.info("PLANNER: Скасовано %s кроків маршруту.", dropped)
+        return dropped
+
+    def reset(self):
+        self.cancel()
+        self.pose = Pose()
+
+
+_motion_planner: Optional[MotionPlanner] = None
+
+
+def get_motion_planner() -> MotionPlanner:
+    global _motion_planner
+    if _motion_planner is None:
+        _motion_planner = MotionPlanner()
+    return _motion_planner
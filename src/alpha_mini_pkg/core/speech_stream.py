@@ -0,0 +1,156 @@
+import asyncio
+import inspect
+import logging
+from typing import AsyncIterator, Callable, Optional
+
+from alpha_mini_pkg.services.speech_bus import SpeechSubscription, Utterance
+
+logger = logging.getLogger(__name__)
+
+StopCallback = Callable[[str], object]
+
+_stop_tasks: set = set()
+
+
+async def _from_subscription(subscription: SpeechSubscription) -> AsyncIterator[Utterance]:
+    try:
+        while True:
+            utterance = await subscription.get()
+            if utterance is None:
+                return
+            yield utterance
+    finally:
+        subscription.close()
+
+
+async def _filter(source: AsyncIterator[Utterance], predicate: Callable[[Utterance], bool]):
+    async for utterance in source:
+        if predicate(utterance):
+            yield utterance
+
+
+async def _dedupe(source: AsyncIterator[Utterance], window: float):
+    last_text, last_at = None, 0.0
+    async for utterance in source:
+        if utterance.normalized == last_text and utterance.received_at - last_at < window:
+            logger.debug("SPEECH_STREAM: Повтор '%s' пропущено.", utterance.text)
+            continue
+        last_text, last_at = utterance.normalized, utterance.received_at
+        yield utterance
+
+
+async def _debounce(source: AsyncIterator[Utterance], quiet: float):
+    iterator = source.__aiter__()
+    pending: Optional[asyncio.Future] = None
+    latest: Optional[Utterance] = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+            done, _ = await asyncio.wait({pending}, timeout=quiet if latest is not None else None)
+            if not done:
+                yield latest
+                latest = None
+                continue
+
+            future, pending = pending, None
+            try:
+                latest = future.result()
+            except StopAsyncIteration:
+                if latest is not None:
+                    yield latest
+                return
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+class SpeechStream:
+    """
+    Асинхронний потік розпізнаних фраз з обмеженим буфером.
+
+    Фрази надходять із підписки на шину мовлення (її черга обмежена й має
+    політику витіснення), а оператори повертають новий потік::
+
+        async for utterance in open_speech_stream().dedupe(2.0).take_until("stop"):
+            ...
+
+    ``take_until`` спрацьовує в момент доставки фрази, а не коли споживач
+    дійде до неї в черзі: підписка закривається, буфер очищується, а
+    ``on_match`` викликається одразу, навіть якщо тіло циклу ще виконує
+    попередню команду.
+    """
+
+    def __init__(self, source: AsyncIterator[Utterance], subscription: SpeechSubscription,
+                 state: Optional[dict] = None):
+        self._source = source
+        self._subscription = subscription
+        self._state = {"stopped_by": None} if state is None else state
+
+    @property
+    def stopped_by(self) -> Optional[str]:
+        """Фраза, що спрацювала як умова зупинки ``take_until``, або None."""
+        return self._state["stopped_by"]
+
+    @classmethod
+    def from_subscription(cls, subscription: SpeechSubscription) -> "SpeechStream":
+        return cls(_from_subscription(subscription), subscription)
+
+    def __aiter__(self) -> "SpeechStream":
+        return self
+
+    async def __anext__(self) -> Utterance:
+        return await self._source.__anext__()
+
+    def _chain(self, source: AsyncIterator[Utterance]) -> "SpeechStream":
+        return SpeechStream(source, self._subscription, self._state)
+
+    def filter(self, predicate: Callable[[Utterance], bool]) -> "SpeechStream":
+        return self._chain(_filter(self._source, predicate))
+
+    def dedupe(self, window: float) -> "SpeechStream":
+        """Пропускає однакову фразу, повторену протягом ``window`` секунд."""
+        return self._chain(_dedupe(self._source, window))
+
+    def debounce(self, quiet: float) -> "SpeechStream":
+        """Видає лише останню фразу серії, після якої ``quiet`` секунд була тиша."""
+        return self._chain(_debounce(self._source, quiet))
+
+    def take_until(self, phrase: str, on_match: Optional[StopCallback] = None) -> "SpeechStream":
+        key = phrase.strip().lower()
+
+        def tap(utterance: Utterance) -> bool:
+            if key not in utterance.normalized:
+                return False
+            logger.info("SPEECH_STREAM: Умова зупинки '%s' виконана.", key)
+            self._state["stopped_by"] = utterance.normalized
+            self._subscription.clear()
+            self._subscription.close()
+            if on_match is not None:
+                result = on_match(utterance.normalized)
+                if inspect.isawaitable(result):
+                    task = asyncio.ensure_future(result)
+                    _stop_tasks.add(task)
+                    task.add_done_callback(_stop_tasks.discard)
+            return True
+
+        self._subscription.add_tap(tap)
+        return self
+
+    async def aclose(self):
+        self._subscription.close()
+        aclose = getattr(self._source, "aclose", None)
+        if aclose is None:
+            return
+        try:
+            await aclose()
+        except RuntimeError:
+            # Споживач саме чекає на наступну фразу; закрита підписка завершить ітерацію сама.
+            pass
+
+    async def __aenter__(self) -> "SpeechStream":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+        return False
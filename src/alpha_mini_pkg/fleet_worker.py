@@ -0,0 +1,115 @@
+"""
+Робочий процес одного робота у режимі флоту.
+
+SDK тримає одне websocket-з'єднання на процес, тому кожен робот флоту
+обслуговується окремим процесом зі своїм слухачем і обробником команд.
+Керування йде через stdin/stdout рядками JSON:
+
+    -> {"id": 1, "op": "speech", "text": "hello"}
+    <- {"id": 1, "ok": true}
+    <- {"event": "ready", "name": "..."}
+"""
+import argparse
+import asyncio
+import json
+import logging
+import sys
+
+from alpha_mini_pkg.config.runtime import ConfigError, load_config
+from alpha_mini_pkg.services import connection_manager
+from alpha_mini_pkg.startup import start_platform
+from alpha_mini_pkg.utils.helpers import run_event_loop
+from alpha_mini_pkg.utils.log_pipeline import configure_logging
+
+logger = logging.getLogger(__name__)
+
+
+def emit(payload: dict):
+    sys.stdout.write(json.dumps(payload) + "\n")
+    sys.stdout.flush()
+
+
+async def _read_commands(loop: asyncio.AbstractEventLoop) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    return reader
+
+
+async def _execute(request: dict):
+    from alpha_mini_pkg.core.command_handler import get_command_handler
+
+    request_id = request.get("id")
+    try:
+        if request.get("op") == "speech":
+            command, ok = await get_command_handler().handle_speech_command(request["text"])
+            if ok:
+                emit({"id": request_id, "ok": True, "command": command})
+            else:
+                emit({"id": request_id, "ok": False, "command": command, "error": "command not executed"})
+        else:
+            emit({"id": request_id, "ok": False, "error": f"unknown op {request.get('op')!r}"})
+    except Exception as e:
+        logger.error(f"FLEET_WORKER: Помилка виконання запиту {request_id}: {e}")
+        emit({"id": request_id, "ok": False, "error": str(e)})
+
+
+async def worker_main(name: str, address: str, port: int) -> int:
+    startup = await start_platform(address, port, name)
+    if not startup:
+        emit({"event": "failed", "name": name})
+        return 1
+
+    loop = asyncio.get_running_loop()
+    emit({"event": "ready", "name": name, "startup": startup.timer.phases})
+
+    reader = await _read_commands(loop)
+    pending = set()
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                logger.error(f"FLEET_WORKER: Некоректний рядок керування {line[:80]!r}: {e}")
+                continue
+            if not isinstance(request, dict):
+                logger.error(f"FLEET_WORKER: Запит має бути об'єктом JSON, отримано {request!r}")
+                continue
+            if request.get("op") == "shutdown":
+                break
+            task = loop.create_task(_execute(request))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+    finally:
+        for task in pending:
+            task.cancel()
+        await startup.shutdown()
+        await connection_manager.shutdown()
+        emit({"event": "stopped", "name": name})
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Alpha Mini fleet worker")
+    parser.add_argument("--name", required=True)
+    parser.add_argument("--address", required=True)
+    parser.add_argument("--port", type=int, required=True)
+    args = parser.parse_args(argv)
+
+    try:
+        load_config()
+    except ConfigError as e:
+        logger.critical(f"CONFIG: {e}")
+        return 1
+    log_listener = configure_logging()
+    try:
+        return run_event_loop(worker_main(args.name, args.address, args.port))
+    finally:
+        if log_listener is not None:
+            log_listener.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
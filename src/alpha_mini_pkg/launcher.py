@@ -1,42 +1,98 @@
 import asyncio
 import sys 
 import logging
-from alpha_mini_pkg.services import connection_manager 
-from alpha_mini_pkg.config.settings import LOG_LEVEL 
-from listeners import start_listening 
+from alpha_mini_pkg.config import settings
+from alpha_mini_pkg.config.runtime import ConfigError, load_config
+from alpha_mini_pkg.utils.helpers import run_event_loop
+from alpha_mini_pkg.utils.log_pipeline import configure_logging
 
-logging.basicConfig(level=LOG_LEVEL, 
-                    format='[%(levelname)s] %(asctime)s - %(name)s: %(message)s')
 logger = logging.getLogger(__name__)
 
 async def main():
-    connection_manager.initialize_sdk()
-    device = await connection_manager.connect_robot() 
+    # SDK робота, protobuf і websockets завантажуються тут, а не під час імпорту лаунчера.
+    from alpha_mini_pkg.core import get_command_scheduler
+    from alpha_mini_pkg.services import connection_manager
+    from alpha_mini_pkg.services.gateway import start_gateway, stop_gateway
+    from alpha_mini_pkg.startup import start_platform
 
-    if device:
-        loop = asyncio.get_running_loop()
-        listener = start_listening(loop) 
+    startup = await start_platform()
 
+    if startup:
         logger.info("\nПлатформа активована. Скажіть 'start' або 'hello'. Натисніть Ctrl+C, щоб зупинити.")
-        
+
+        if settings.GATEWAY_ENABLED:
+            await start_gateway()
+
         try:
             await asyncio.Future() 
 
         except (asyncio.CancelledError, KeyboardInterrupt):
             logger.info("\nПрограма перервана.")
         finally:
-            listener.stop()
+            await stop_gateway()
+            await startup.shutdown()
+            await get_command_scheduler().shutdown()
             await connection_manager.shutdown()
     else:
         logger.error("Не вдалося підключитися. Робоча логіка не запущена.")
 
+async def fleet_main():
+    from alpha_mini_pkg.services.fleet import RobotFleet
+
+    fleet = RobotFleet.from_config(settings.FLEET_DEVICES)
+    status = await fleet.connect_all()
+
+    if not any(status.values()):
+        logger.error("Жоден робот флоту не підключився. Робоча логіка не запущена.")
+        await fleet.shutdown()
+        return
+
+    logger.info(f"\nФлот активовано: {', '.join(fleet.connected)}. Натисніть Ctrl+C, щоб зупинити.")
+    try:
+        await asyncio.Future()
+    except (asyncio.CancelledError, KeyboardInterrupt):
+        logger.info("\nПрограма перервана.")
+    finally:
+        await fleet.shutdown()
+
+def _set_log_level(changes: dict):
+    logging.getLogger().setLevel(changes["LOG_LEVEL"])
+
+def _run(coro):
+    try:
+        config = load_config()
+    except ConfigError as e:
+        coro.close()
+        logger.critical(f"CONFIG: {e}")
+        sys.exit(1)
+    config.subscribe(_set_log_level, keys=("LOG_LEVEL",))
+    log_listener = configure_logging()
+    try:
+        run_event_loop(coro)
+    finally:
+        if log_listener is not None:
+            log_listener.stop()
+
 def run():
     """
     Синхронна функція, яка є консольною точкою входу.
-    Вона викликає asyncio.run() для безпечного запуску асинхронного коду.
+    Вона запускає головну корутину в циклі подій, стійкому до зупинок з боку SDK.
+    """
+    try:
+        _run(main())
+    except KeyboardInterrupt:
+        logger.info("\nProgram exited via Keyboard Interrupt.")
+        sys.exit(0)
+    except Exception as e:
+        logger.critical(f"Unhandled error during execution: {e}", exc_info=True)
+        sys.exit(1)
+
+def run_fleet():
+    """
+    Консольна точка входу режиму флоту: по одному робочому процесу на робота з FLEET_DEVICES.
     """
     try:
-        asyncio.run(main())
+        _run(fleet_main())
     except KeyboardInterrupt:
         logger.info("\nProgram exited via Keyboard Interrupt.")
         sys.exit(0)
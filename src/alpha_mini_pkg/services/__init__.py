@@ -1,10 +1,17 @@
-from .connection_manager import connect_robot, shutdown, initialize_sdk
-from .api_client import (
-    move_robot, 
-    start_tts, 
-    play_named_action, 
-    create_speech_observer
-)
+from alpha_mini_pkg.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    'connect_robot': '.connection_manager',
+    'shutdown': '.connection_manager',
+    'initialize_sdk': '.connection_manager',
+    'move_robot': '.api_client',
+    'start_tts': '.api_client',
+    'play_named_action': '.api_client',
+    'stop_all_actions': '.api_client',
+    'create_speech_observer': '.api_client',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     'connect_robot',
@@ -13,5 +20,6 @@ __all__ = [
     'move_robot',
     'start_tts',
     'play_named_action',
+    'stop_all_actions',
     'create_speech_observer',
-]
\ No newline at end of file
+]
@@ -0,0 +1,180 @@
+import json
+import logging
+import re
+import threading
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from alpha_mini_pkg.config import settings
+from alpha_mini_pkg.core.command_matcher import PhraseMatcher
+
+logger = logging.getLogger(__name__)
+
+FUZZY_MIN_SCORE: float = 0.45
+
+_SEPARATORS = re.compile(r"[\s_\-/,.!?]+")
+
+
+def normalize_spoken(text: str) -> str:
+    return _SEPARATORS.sub(" ", text.strip().lower()).strip()
+
+
+def _trigrams(text: str) -> set:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class ActionEntry:
+    __slots__ = ("id", "cn_name", "en_name")
+
+    def __init__(self, action_id: str, cn_name: Optional[str] = None, en_name: Optional[str] = None):
+        self.id = action_id
+        self.cn_name = cn_name
+        self.en_name = en_name
+
+    def spoken_names(self) -> Iterable[str]:
+        yield normalize_spoken(self.id)
+        if self.cn_name:
+            yield normalize_spoken(self.cn_name)
+        if self.en_name:
+            yield normalize_spoken(self.en_name)
+            if "/" in self.en_name:
+                for alias in self.en_name.split("/"):
+                    yield normalize_spoken(alias)
+
+    def __repr__(self) -> str:
+        return f"ActionEntry({self.id!r}, en={self.en_name!r}, cn={self.cn_name!r})"
+
+
+class ActionCatalog:
+    """
+    Індекс дій робота з actions.json.
+
+    Тримає словники за ID, за назвою обома мовами та за префіксом родини
+    (``w_stand``, ``012_1``), а також триграмний індекс для нечіткого пошуку
+    за розпізнаним мовленням.
+    """
+
+    __slots__ = ("_by_id", "_by_name", "_by_family", "_trigram_index", "_name_matcher", "loaded")
+
+    def __init__(self, entries: Iterable[ActionEntry] = (), loaded: bool = True):
+        self._by_id: dict[str, ActionEntry] = {}
+        self._by_name: dict[str, ActionEntry] = {}
+        self._by_family: dict[str, tuple] = {}
+        self._trigram_index: dict[str, list] = {}
+        self._name_matcher: PhraseMatcher[ActionEntry] = PhraseMatcher()
+        self.loaded = loaded
+
+        families = defaultdict(list)
+        trigram_index = defaultdict(list)
+
+        for entry in entries:
+            self._by_id[entry.id] = entry
+
+            parts = entry.id.split("_")
+            for i in range(1, len(parts)):
+                families["_".join(parts[:i])].append(entry.id)
+
+            for name in entry.spoken_names():
+                if not name or name in self._by_name:
+                    continue
+                self._by_name[name] = entry
+                if not name.isdigit():
+                    self._name_matcher.add(f" {name} ", entry)
+                for gram in _trigrams(name):
+                    trigram_index[gram].append(name)
+
+        self._by_family = {prefix: tuple(ids) for prefix, ids in families.items()}
+        self._trigram_index = dict(trigram_index)
+        self._name_matcher.search("")
+
+    @classmethod
+    def from_file(cls, path: Optional[str] = None) -> "ActionCatalog":
+        path = path or settings.ACTIONS_FILE
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        entries = [
+            ActionEntry(item["id"], item.get("cnName"), item.get("enName"))
+            for item in data.get("actions", [])
+            if item.get("id")
+        ]
+        logger.info(f"CATALOG: Завантажено {len(entries)} дій з '{path}'.")
+        return cls(entries)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, action_id: str) -> bool:
+        return action_id in self._by_id
+
+    def get(self, action_id: str) -> Optional[ActionEntry]:
+        return self._by_id.get(action_id)
+
+    def by_name(self, name: str) -> Optional[ActionEntry]:
+        return self._by_name.get(normalize_spoken(name))
+
+    def family(self, prefix: str) -> tuple:
+        return self._by_family.get(prefix.rstrip("*").rstrip("_"), ())
+
+    def fuzzy(self, text: str, min_score: float = FUZZY_MIN_SCORE) -> Optional[ActionEntry]:
+        query = normalize_spoken(text)
+        if not query:
+            return None
+
+        query_grams = _trigrams(query)
+        overlap: dict[str, int] = defaultdict(int)
+        for gram in query_grams:
+            for name in self._trigram_index.get(gram, ()):
+                overlap[name] += 1
+
+        best_name = None
+        best_score = 0.0
+        for name, shared in overlap.items():
+            score = 2.0 * shared / (len(query_grams) + len(name) + 1)
+            if score > best_score:
+                best_name, best_score = name, score
+
+        if best_name is None or best_score < min_score:
+            return None
+        logger.debug(f"CATALOG: Нечіткий збіг '{query}' -> '{best_name}' ({best_score:.2f}).")
+        return self._by_name[best_name]
+
+    def resolve(self, spoken: str, fuzzy: bool = True) -> Optional[ActionEntry]:
+        """
+        Перетворює ID або розпізнану фразу на дію каталогу.
+
+        Порядок: точний ID, точна назва, назва всередині фрази (лише цілими
+        словами: "thug" не містить "hug"), нечіткий пошук (якщо ``fuzzy``).
+        """
+        entry = self._by_id.get(spoken.strip())
+        if entry is not None:
+            return entry
+
+        normalized = normalize_spoken(spoken)
+        entry = self._by_name.get(normalized)
+        if entry is not None:
+            return entry
+
+        match = self._name_matcher.search(f" {normalized} ")
+        if match is not None:
+            return match.value
+
+        return self.fuzzy(normalized) if fuzzy else None
+
+
+_catalog: Optional[ActionCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_action_catalog() -> ActionCatalog:
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                try:
+                    _catalog = ActionCatalog.from_file()
+                except (OSError, ValueError) as e:
+                    logger.error(f"CATALOG: Не вдалося завантажити каталог дій: {e}")
+                    _catalog = ActionCatalog(loaded=False)
+    return _catalog
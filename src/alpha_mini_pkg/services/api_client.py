@@ -1,52 +1,167 @@
+import asyncio
 import logging
-from mini.apis.api_action import MoveRobot, MoveRobotDirection, PlayAction
+from typing import Optional
+from mini.apis.api_action import MoveRobot, MoveRobotDirection, PlayAction, StopAllAction
 from mini.apis.api_sound import StartPlayTTS
 from mini.apis.api_observe import ObserveSpeechRecognise
-from mini.apis.base_api import MiniApiResultType
+from mini.apis.base_api import BaseApi, MiniApiResultType
 from mini.dns.dns_browser import WiFiDevice
+from alpha_mini_pkg.config import settings
+from alpha_mini_pkg.services.circuit_breaker import HALF_OPEN, get_circuit_breaker
+from alpha_mini_pkg.services.connection_supervisor import current_supervisor
+from alpha_mini_pkg.utils.helpers import estimate_tts_duration
+from alpha_mini_pkg.utils.journal import get_journal
+from alpha_mini_pkg.utils.telemetry import correlation_id, get_telemetry
 
 logger = logging.getLogger(__name__)
 
 ApiResult = tuple[MiniApiResultType, WiFiDevice | object] 
 
+# Робот не відповів: такі збої розмикають запобіжник.
+_UNRESPONSIVE = ("timeout", "deadline", "transport")
+
+
+async def _attempt(block: BaseApi, api_name: str, deadline: float) -> tuple:
+    """Одна спроба запиту. Повертає (result_type, response, причина збою або None)."""
+    try:
+        with get_telemetry().span("api", api=api_name):
+            result_type, response = await asyncio.wait_for(block.execute(), deadline)
+    except asyncio.TimeoutError:
+        logger.error("API: %s не отримав відповіді за %.1f с.", api_name, deadline)
+        return (MiniApiResultType.Timeout, None, "deadline")
+    except RuntimeError as e:
+        logger.error("API: %s не надіслано: %s", api_name, e)
+        return (None, None, "transport")
+
+    if result_type == MiniApiResultType.Timeout:
+        return (result_type, response, "timeout")
+    if result_type != MiniApiResultType.Success:
+        return (result_type, response, "unsupported")
+    if getattr(response, "isSuccess", True) is False:
+        return (result_type, response, "rejected")
+    return (result_type, response, None)
+
+
+async def _execute(block: BaseApi, api_name: str, deadline: Optional[float] = None,
+                   idempotent: bool = False, bypass_breaker: bool = False, args: tuple = ()) -> ApiResult:
+    """
+    Виконує запит з дедлайном, повторами та запобіжником.
+
+    Повторюються лише запити, які не дійшли до робота (помилка транспорту),
+    а для ідемпотентних запитів — ще й ті, на які робот не відповів.
+    Відмова робота або непідтримувана команда не повторюються.
+    Кожна спроба та її результат потрапляють у журнал сесії разом з ``args``.
+    """
+    telemetry = get_telemetry()
+    journal = get_journal()
+    supervisor = current_supervisor()
+    if supervisor is not None and not await supervisor.wait_connected(settings.COMMAND_RECONNECT_WAIT):
+        logger.error("API: Немає з'єднання з роботом, %s не надіслано.", api_name)
+        telemetry.count("alpha_api_errors_total", api=api_name, reason="disconnected")
+        return (None, None)
+
+    breaker = get_circuit_breaker()
+    if deadline is None:
+        deadline = settings.API_DEADLINES.get(api_name, settings.API_DEADLINE_DEFAULT)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    backoff = settings.API_RETRY_BACKOFF_INITIAL
+    result_type, response = (None, None)
+
+    for attempt in range(1, settings.API_RETRY_ATTEMPTS + 1):
+        if not (bypass_breaker or breaker.allow()):
+            logger.error("API: Робот не відповідає, %s відхилено запобіжником.", api_name)
+            telemetry.count("alpha_api_errors_total", api=api_name, reason="circuit_open")
+            break
+        probe = not bypass_breaker and breaker.state == HALF_OPEN
+
+        call_id = journal.api_call(correlation_id.get(), api_name, args)
+        try:
+            result_type, response, reason = await _attempt(block, api_name, deadline)
+        except asyncio.CancelledError:
+            if probe:
+                breaker.release_probe()
+            raise
+        journal.api_result(call_id, api_name, result_type, response, reason)
+        if reason is None:
+            breaker.record_success()
+            telemetry.acknowledge()
+            break
+
+        telemetry.count("alpha_api_errors_total", api=api_name, reason=reason)
+        if reason in _UNRESPONSIVE:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+        retryable = reason == "transport" or (idempotent and reason in _UNRESPONSIVE)
+        if not retryable or attempt == settings.API_RETRY_ATTEMPTS:
+            break
+
+        logger.warning("API: %s: %s, повтор %s/%s через %.2f с.", api_name, reason, attempt + 1, settings.API_RETRY_ATTEMPTS, backoff)
+        telemetry.count("alpha_api_retries_total", api=api_name)
+        await asyncio.sleep(backoff)
+        backoff = min(backoff * 2, settings.API_RETRY_BACKOFF_MAX)
+
+    telemetry.observe("alpha_api_call_seconds", loop.time() - started, api=api_name)
+    return (result_type, response)
+
 async def move_robot(steps: int, direction: MoveRobotDirection) -> bool:
-    logger.debug(f"API: Виконання руху: {direction.name}, кроків: {steps}")
+    logger.debug("API: Виконання руху: %s, кроків: %s", direction.name, steps)
     
     move_block: MoveRobot = MoveRobot(step=steps, direction=direction)
-    (result_type, response) = await move_block.execute()
+    deadline = settings.API_DEADLINES["MoveRobot"] + steps * settings.API_MOVE_STEP_SECONDS
+    (result_type, response) = await _execute(move_block, "MoveRobot", deadline, args=(direction.name, steps))
 
     if result_type == MiniApiResultType.Success and response.isSuccess:
         logger.debug("API: Рух завершено успішно.")
         return True
     else:
-        logger.error(f"API: Помилка руху: {result_type}, Відповідь: {response}")
+        logger.error("API: Помилка руху: %s, Відповідь: %s", result_type, response)
         return False
 
 
 async def start_tts(text: str) -> bool:
-    logger.debug(f'API: Запуск TTS: "{text[:30]}..."')
+    logger.debug("API: Запуск TTS: \"%s...\"", text[:30])
     
     tts_block: StartPlayTTS = StartPlayTTS(text=text)
-    (result_type, response) = await tts_block.execute()
+    deadline = settings.API_DEADLINES["StartPlayTTS"] + estimate_tts_duration(text)
+    (result_type, response) = await _execute(tts_block, "StartPlayTTS", deadline, args=(text,))
     if result_type == MiniApiResultType.Success and response.isSuccess:
         logger.debug("API: TTS запущено успішно.")
         return True
     else:
-        logger.error(f"API: Помилка запуску TTS: {result_type}, Відповідь: {response}")
+        logger.error("API: Помилка запуску TTS: %s, Відповідь: %s", result_type, response)
         return False
 
 
 async def play_named_action(action_name: str) -> bool:
-    logger.debug(f'API: Запуск дії: "{action_name}"')
+    logger.debug("API: Запуск дії: \"%s\"", action_name)
     
     play_block: PlayAction = PlayAction(action_name=action_name)
-    (result_type, response) = await play_block.execute()
+    (result_type, response) = await _execute(play_block, "PlayAction", args=(action_name,))
+
+    if result_type == MiniApiResultType.Success and response.isSuccess:
+        logger.debug("API: Дія '%s' запущена успішно.", action_name)
+        return True
+    else:
+        logger.error("API: Помилка запуску дії '%s': %s, Відповідь: %s", action_name, result_type, response)
+        return False
+
+
+async def stop_all_actions() -> bool:
+    logger.debug("API: Зупинка всіх дій робота.")
+
+    stop_block: StopAllAction = StopAllAction()
+    # Зупинка ідемпотентна й критична для безпеки, тому повторюється і не блокується запобіжником.
+    (result_type, response) = await _execute(stop_block, "StopAllAction", idempotent=True, bypass_breaker=True)
 
     if result_type == MiniApiResultType.Success and response.isSuccess:
-        logger.debug(f"API: Дія '{action_name}' запущена успішно.")
+        logger.debug("API: Дії зупинено.")
         return True
     else:
-        logger.error(f"API: Помилка запуску дії '{action_name}': {result_type}, Відповідь: {response}")
+        logger.error("API: Помилка зупинки дій: %s, Відповідь: %s", result_type, response)
         return False
 
 
@@ -0,0 +1,119 @@
+import logging
+import time
+from typing import Optional
+
+from alpha_mini_pkg.config import settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_STATE_CODES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitBreaker:
+    """
+    Запобіжник для запитів до робота.
+
+    Після ``failure_threshold`` поспіль запитів, на які робот не відповів
+    (тайм-аут або помилка транспорту), запобіжник розмикається: нові запити
+    одразу завершуються помилкою, не чекаючи свого дедлайну. Через
+    ``reset_timeout`` секунд пропускається один пробний запит; його успіх
+    замикає запобіжник, невдача — знову розмикає. Скасований пробний запит
+    (пріоритетна команда, зупинка планувальника) повертає пробу через
+    ``release_probe``, і наступний запит знову може стати пробним.
+
+    Будь-яка відповідь робота, навіть відмова, вважається успіхом: робот
+    живий, просто не виконав команду.
+
+    Без явних параметрів поріг і час відновлення читаються з config.settings
+    під час кожної перевірки, тож діють і після гарячого перезавантаження.
+    """
+
+    def __init__(self, failure_threshold: Optional[int] = None, reset_timeout: Optional[float] = None):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_total = 0
+        self.rejected_total = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def failure_threshold(self) -> int:
+        return settings.CIRCUIT_FAILURE_THRESHOLD if self._failure_threshold is None else self._failure_threshold
+
+    @property
+    def reset_timeout(self) -> float:
+        return settings.CIRCUIT_RESET_TIMEOUT if self._reset_timeout is None else self._reset_timeout
+
+    def allow(self) -> bool:
+        if self.state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self.state = HALF_OPEN
+            self._probing = False
+            logger.info("CIRCUIT: Пробний запит до робота дозволено.")
+
+        if self.state == CLOSED:
+            return True
+        if self.state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+
+        self.rejected_total += 1
+        return False
+
+    def record_success(self):
+        if self.state != CLOSED:
+            logger.info("CIRCUIT: Робот відповідає, запобіжник замкнено.")
+        self.state = CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def release_probe(self):
+        """Пробний запит скасовано без відповіді: наступний запит знову може бути пробним."""
+        if self.state == HALF_OPEN and self._probing:
+            self._probing = False
+            logger.debug("CIRCUIT: Пробний запит скасовано, проба знову доступна.")
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+            self._open()
+
+    def _open(self):
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+        self._probing = False
+        self.opened_total += 1
+        logger.warning(
+            f"CIRCUIT: Робот не відповідає ({self.failures} збоїв поспіль). "
+            f"Запити відхиляються {self.reset_timeout:.1f} с."
+        )
+
+    def reset(self):
+        if self.state != CLOSED:
+            logger.info("CIRCUIT: Запобіжник скинуто.")
+        self.state = CLOSED
+        self.failures = 0
+        self._probing = False
+
+    @property
+    def metrics(self) -> dict:
+        return {
+            "state": _STATE_CODES[self.state],
+            "opened_total": self.opened_total,
+            "rejected_total": self.rejected_total,
+        }
+
+
+_breaker: Optional[CircuitBreaker] = None
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    global _breaker
+    if _breaker is None:
+        _breaker = CircuitBreaker()
+    return _breaker
@@ -1,46 +1,108 @@
 import asyncio
 import logging
 from mini import mini_sdk as MiniSdk
+from mini.apis.api_sence import GetInfraredDistance
+from mini.apis.api_setup import StartRunProgram
+from mini.apis.base_api import MiniApiResultType
 from mini.dns.dns_browser import WiFiDevice
-from alpha_mini_pkg.config.settings import (
-    ROBOT_IP, 
-    ROBOT_PORT, 
-    ROBOT_TYPE, 
-    LOG_LEVEL, 
-    PROGRAM_MODE_WAIT_TIME
-)
+from alpha_mini_pkg.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Налаштування читаються з модуля settings під час виклику, а не імпорту,
+# тож значення, перезавантажені config.runtime, діють з наступного виклику.
+
 def initialize_sdk():
-    logger.info(f"Налаштування SDK: Тип Робота={ROBOT_TYPE.name}, Рівень логування={logging.getLevelName(LOG_LEVEL)}")
+    logger.info(f"Налаштування SDK: Тип Робота={settings.ROBOT_TYPE.name}, Рівень логування={logging.getLevelName(settings.LOG_LEVEL)}")
     
-    MiniSdk.set_log_level(LOG_LEVEL)
-    MiniSdk.set_robot_type(ROBOT_TYPE)
+    MiniSdk.set_log_level(settings.LOG_LEVEL)
+    MiniSdk.set_robot_type(settings.ROBOT_TYPE)
 
 
-async def connect_robot() -> WiFiDevice | None:
-    device = WiFiDevice(address=ROBOT_IP, port=ROBOT_PORT, name="AlphaMini_Manual") 
-    logger.info(f"Спроба прямого підключення до робота за IP: {ROBOT_IP}:{ROBOT_PORT}")
-    
-    connected: bool = await MiniSdk.connect(device)
+async def connect_robot(address: str | None = None, port: int | None = None, name: str = "AlphaMini_Manual") -> WiFiDevice | None:
+    device = await open_connection(address, port, name)
 
-    if connected:
-        logger.info("Підключення успішне!")
-        
+    if device:
         logger.info("Вхід у режим програмування...")
-        await MiniSdk.enter_program()
-
-        logger.info(f"Очікування {PROGRAM_MODE_WAIT_TIME} с. на готовність робота...")
-        await asyncio.sleep(PROGRAM_MODE_WAIT_TIME) 
+        await enter_program_mode()
         
         logger.info("У режимі програмування. Робот готовий до команд.")
+    return device
+
+
+async def open_connection(address: str | None = None, port: int | None = None, name: str = "AlphaMini_Manual") -> WiFiDevice | None:
+    address = address or settings.ROBOT_IP
+    port = port or settings.ROBOT_PORT
+    device = WiFiDevice(address=address, port=port, name=name) 
+    logger.info(f"Спроба прямого підключення до робота за IP: {address}:{port}")
+    
+    # MiniSdk.connect ігнорує device.port, тому підключаємося через websocket SDK напряму.
+    connected: bool = await MiniSdk.websocket.connect(device.address, device.port)
+
+    if connected:
+        logger.info("Підключення успішне!")
         return device
     else:
-        logger.error(f"Не вдалося підключитися до робота за IP {ROBOT_IP}.")
+        logger.error(f"Не вдалося підключитися до робота за IP {address}.")
         return None
 
 
+async def enter_program_mode(deadline: float | None = None) -> bool:
+    # MiniSdk.enter_program після запиту завжди спить 6 с, тому надсилаємо запит самі
+    # і замість сліпого очікування опитуємо робота до готовності.
+    if deadline is None:
+        deadline = settings.PROGRAM_MODE_WAIT_TIME
+    # Один бюджет на запит і на опитування готовності, а не по deadline на кожне.
+    loop = asyncio.get_running_loop()
+    expires = loop.time() + deadline
+    try:
+        (result_type, response) = await asyncio.wait_for(StartRunProgram().execute(), deadline)
+    except asyncio.TimeoutError:
+        logger.warning("Робот не підтвердив вхід у режим програмування.")
+    else:
+        if result_type != MiniApiResultType.Success or not response.isSuccess:
+            logger.warning(f"Вхід у режим програмування: {result_type}, Відповідь: {response}")
+
+    return await wait_until_ready(max(expires - loop.time(), 0.0))
+
+
+async def probe_ready(timeout: float | None = None) -> bool:
+    if timeout is None:
+        timeout = settings.READINESS_PROBE_TIMEOUT
+    try:
+        (result_type, _) = await asyncio.wait_for(GetInfraredDistance().execute(), timeout)
+    except (asyncio.TimeoutError, RuntimeError):
+        return False
+    return result_type == MiniApiResultType.Success
+
+
+async def wait_until_ready(deadline: float | None = None,
+                           initial_delay: float | None = None,
+                           max_delay: float | None = None) -> bool:
+    deadline = settings.PROGRAM_MODE_WAIT_TIME if deadline is None else deadline
+    initial_delay = settings.READINESS_POLL_INITIAL if initial_delay is None else initial_delay
+    max_delay = settings.READINESS_POLL_MAX if max_delay is None else max_delay
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    delay = initial_delay
+    attempt = 0
+
+    while True:
+        attempt += 1
+        remaining = deadline - (loop.time() - started)
+        if await probe_ready(min(settings.READINESS_PROBE_TIMEOUT, max(remaining, 0.05))):
+            logger.info(f"Робот готовий через {loop.time() - started:.2f} с (спроба {attempt}).")
+            return True
+
+        remaining = deadline - (loop.time() - started)
+        if remaining <= 0:
+            logger.warning(f"Робот не підтвердив готовність за {deadline} с. Продовжуємо.")
+            return False
+
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
+
+
 async def shutdown():
     logger.info("Вихід із режиму програмування...")
     try:
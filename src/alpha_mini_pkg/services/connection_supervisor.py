@@ -0,0 +1,178 @@
+import asyncio
+import enum
+import logging
+import random
+from typing import Awaitable, Callable, Optional, Union
+
+from mini import mini_sdk as MiniSdk
+from alpha_mini_pkg.config import settings
+from alpha_mini_pkg.services import connection_manager
+
+logger = logging.getLogger(__name__)
+
+ReconnectHook = Callable[[], Union[None, Awaitable[None]]]
+
+
+class ConnectionState(enum.Enum):
+    CONNECTED = "connected"
+    RECONNECTING = "reconnecting"
+    STOPPED = "stopped"
+
+
+class ConnectionSupervisor:
+    """
+    Стежить за з'єднанням з роботом і відновлює його після обриву.
+
+    Кожні HEARTBEAT_INTERVAL секунд перевіряється стан websocket SDK, а кожен
+    HEARTBEAT_PROBE_EVERY-й такт робот ще й опитується легким запитом. Після
+    обриву супервізор перепідключається з експоненційною затримкою та
+    джитером, знову входить у режим програмування й викликає зареєстровані
+    хуки (наприклад, повторну підписку на ObserveSpeechRecognise).
+    """
+
+    def __init__(self, address: str | None = None, port: int | None = None, name: str = "AlphaMini_Manual"):
+        self.address = address or settings.ROBOT_IP
+        self.port = port or settings.ROBOT_PORT
+        self.name = name
+        self.state = ConnectionState.CONNECTED
+        self._connected = asyncio.Event()
+        self._connected.set()
+        self._hooks: list = []
+        self._task: Optional[asyncio.Task] = None
+        self.metrics: dict = {
+            "disconnects": 0,
+            "heartbeat_failures": 0,
+            "reconnect_attempts": 0,
+            "reconnects": 0,
+            "last_reconnect_seconds": 0.0,
+            "max_reconnect_seconds": 0.0,
+            "failed_fast_commands": 0,
+        }
+
+    @property
+    def is_connected(self) -> bool:
+        return self.state == ConnectionState.CONNECTED
+
+    def add_reconnect_hook(self, hook: ReconnectHook):
+        if hook not in self._hooks:
+            self._hooks.append(hook)
+
+    def remove_reconnect_hook(self, hook: ReconnectHook):
+        if hook in self._hooks:
+            self._hooks.remove(hook)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self.state = ConnectionState.CONNECTED
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(f"SUPERVISOR: Моніторинг з'єднання з {self.address}:{self.port} запущено.")
+
+    async def stop(self):
+        self.state = ConnectionState.STOPPED
+        self._connected.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def wait_connected(self, timeout: float) -> bool:
+        if self.is_connected:
+            return True
+        if self.state == ConnectionState.STOPPED or timeout <= 0:
+            self.metrics["failed_fast_commands"] += 1
+            return False
+        try:
+            await asyncio.wait_for(self._connected.wait(), timeout)
+        except asyncio.TimeoutError:
+            self.metrics["failed_fast_commands"] += 1
+            return False
+        return self.is_connected
+
+    async def _run(self):
+        tick = 0
+        failures = 0
+        while True:
+            await asyncio.sleep(settings.HEARTBEAT_INTERVAL)
+            tick += 1
+
+            if not MiniSdk.websocket.alive:
+                logger.warning("SUPERVISOR: Websocket закрито.")
+                await self._reconnect()
+                failures = 0
+                continue
+
+            if tick % settings.HEARTBEAT_PROBE_EVERY:
+                continue
+
+            if await connection_manager.probe_ready():
+                failures = 0
+                continue
+
+            failures += 1
+            self.metrics["heartbeat_failures"] += 1
+            logger.warning(f"SUPERVISOR: Робот не відповів на heartbeat ({failures}/{settings.HEARTBEAT_MAX_FAILURES}).")
+            if failures >= settings.HEARTBEAT_MAX_FAILURES:
+                await self._reconnect()
+                failures = 0
+
+    async def _reconnect(self):
+        loop = asyncio.get_running_loop()
+        self.state = ConnectionState.RECONNECTING
+        self._connected.clear()
+        self.metrics["disconnects"] += 1
+        started = loop.time()
+        delay = settings.RECONNECT_BACKOFF_INITIAL
+
+        while True:
+            self.metrics["reconnect_attempts"] += 1
+            try:
+                device = await connection_manager.open_connection(self.address, self.port, self.name)
+                if device and await connection_manager.enter_program_mode():
+                    break
+                if device:
+                    logger.warning("SUPERVISOR: Робот не увійшов у режим програмування після перепідключення.")
+            except Exception as e:
+                # Будь-яка помилка SDK, websockets чи protobuf — лише невдала спроба:
+                # супервізор не повинен завершитись у стані RECONNECTING.
+                logger.warning(f"SUPERVISOR: Помилка перепідключення: {type(e).__name__}: {e}")
+
+            pause = random.uniform(delay / 2, delay)
+            logger.info(f"SUPERVISOR: Наступна спроба через {pause:.2f} с.")
+            await asyncio.sleep(pause)
+            delay = min(delay * 2, settings.RECONNECT_BACKOFF_MAX)
+
+        await self._run_hooks()
+
+        elapsed = loop.time() - started
+        self.metrics["reconnects"] += 1
+        self.metrics["last_reconnect_seconds"] = elapsed
+        self.metrics["max_reconnect_seconds"] = max(self.metrics["max_reconnect_seconds"], elapsed)
+        self.state = ConnectionState.CONNECTED
+        self._connected.set()
+        logger.info(f"SUPERVISOR: З'єднання відновлено за {elapsed:.2f} с.")
+
+    async def _run_hooks(self):
+        for hook in list(self._hooks):
+            try:
+                result = hook()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.error(f"SUPERVISOR: Помилка хука перепідключення {hook}: {e}")
+
+
+_supervisor: Optional[ConnectionSupervisor] = None
+
+
+def start_supervisor(address: str | None = None, port: int | None = None, name: str = "AlphaMini_Manual") -> ConnectionSupervisor:
+    global _supervisor
+    _supervisor = ConnectionSupervisor(address, port, name)
+    _supervisor.start()
+    return _supervisor
+
+
+def current_supervisor() -> Optional[ConnectionSupervisor]:
+    return _supervisor
@@ -0,0 +1,182 @@
+import asyncio
+import itertools
+import json
+import logging
+import os
+import sys
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+READY_TIMEOUT: float = 60.0
+REQUEST_TIMEOUT: float = 120.0
+
+
+def _worker_env(profile: Optional[str] = None) -> dict:
+    import alpha_mini_pkg
+    from alpha_mini_pkg.config.runtime import PROFILE_ENV
+
+    src_root = os.path.dirname(os.path.dirname(os.path.abspath(alpha_mini_pkg.__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_root, env.get("PYTHONPATH")]))
+    if profile:
+        env[PROFILE_ENV] = profile
+    return env
+
+
+class FleetRobot:
+    """
+    Один робот флоту, який обслуговує окремий процес alpha_mini_pkg.fleet_worker.
+    ``profile`` обирає розділ ``[profiles.<ім'я>]`` файлу конфігурації для цього процесу.
+    """
+
+    def __init__(self, name: str, address: str, port: int = 8800, profile: Optional[str] = None):
+        self.name = name
+        self.address = address
+        self.port = port
+        self.profile = profile
+        self.connected = False
+        self.startup_phases: dict[str, float] = {}
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._ready: Optional[asyncio.Future] = None
+        self._responses: dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+
+    async def start(self, timeout: float = READY_TIMEOUT) -> bool:
+        loop = asyncio.get_running_loop()
+        self._ready = loop.create_future()
+        self._process = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "alpha_mini_pkg.fleet_worker",
+            "--name", self.name, "--address", self.address, "--port", str(self.port),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            env=_worker_env(self.profile),
+        )
+        self._reader_task = loop.create_task(self._read_events())
+
+        try:
+            self.connected = await asyncio.wait_for(asyncio.shield(self._ready), timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"FLEET: '{self.name}' не підключився за {timeout} с.")
+            self.connected = False
+
+        if not self.connected:
+            await self.stop()
+        return self.connected
+
+    async def send_speech(self, text: str, timeout: float = REQUEST_TIMEOUT) -> bool:
+        if not self.connected or self._process is None:
+            logger.warning(f"FLEET: '{self.name}' не підключений, команду '{text}' пропущено.")
+            return False
+
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._responses[request_id] = future
+        self._write({"id": request_id, "op": "speech", "text": text})
+
+        try:
+            reply = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"FLEET: '{self.name}' не відповів на '{text}' за {timeout} с.")
+            return False
+        finally:
+            self._responses.pop(request_id, None)
+
+        if not reply.get("ok"):
+            logger.warning(f"FLEET: '{self.name}' повернув помилку: {reply.get('error')}")
+        return bool(reply.get("ok"))
+
+    async def stop(self):
+        process = self._process
+        if process is None:
+            return
+
+        if process.returncode is None:
+            try:
+                self._write({"op": "shutdown"})
+                process.stdin.close()
+                await asyncio.wait_for(process.wait(), 10)
+            except (asyncio.TimeoutError, BrokenPipeError, ConnectionResetError):
+                process.kill()
+                await process.wait()
+
+        if self._reader_task is not None:
+            await self._reader_task
+        self._process = None
+        self.connected = False
+
+    def _write(self, payload: dict):
+        self._process.stdin.write((json.dumps(payload) + "\n").encode("utf-8"))
+
+    async def _read_events(self):
+        stdout = self._process.stdout
+        while True:
+            line = await stdout.readline()
+            if not line:
+                break
+            try:
+                event = json.loads(line)
+            except ValueError:
+                logger.debug(f"FLEET[{self.name}]: {line.decode(errors='replace').rstrip()}")
+                continue
+
+            if "id" in event:
+                future = self._responses.get(event["id"])
+                if future is not None and not future.done():
+                    future.set_result(event)
+            elif event.get("event") in ("ready", "failed"):
+                self.startup_phases = event.get("startup", {})
+                if not self._ready.done():
+                    self._ready.set_result(event["event"] == "ready")
+
+        self.connected = False
+        if self._ready is not None and not self._ready.done():
+            self._ready.set_result(False)
+        for future in self._responses.values():
+            if not future.done():
+                future.set_result({"ok": False, "error": "worker exited"})
+
+
+class RobotFleet:
+    """
+    Флот роботів Alpha Mini: паралельне підключення, широкомовна та адресна
+    передача голосових команд.
+    """
+
+    def __init__(self, robots: Iterable[FleetRobot]):
+        self._robots: dict[str, FleetRobot] = {robot.name: robot for robot in robots}
+
+    @classmethod
+    def from_config(cls, devices: Iterable[dict]) -> "RobotFleet":
+        return cls(FleetRobot(d["name"], d["address"], d.get("port", 8800), d.get("profile")) for d in devices)
+
+    @property
+    def names(self) -> list:
+        return list(self._robots)
+
+    @property
+    def connected(self) -> list:
+        return [name for name, robot in self._robots.items() if robot.connected]
+
+    async def connect_all(self, timeout: float = READY_TIMEOUT) -> dict:
+        logger.info(f"FLEET: Паралельне підключення {len(self._robots)} роботів...")
+        results = await asyncio.gather(*(robot.start(timeout) for robot in self._robots.values()))
+        status = dict(zip(self._robots, results))
+        logger.info(f"FLEET: Підключено {sum(results)}/{len(results)}.")
+        return status
+
+    async def dispatch(self, name: str, text: str) -> bool:
+        robot = self._robots.get(name)
+        if robot is None:
+            raise KeyError(f"Unknown robot '{name}'")
+        return await robot.send_speech(text)
+
+    async def broadcast(self, text: str) -> dict:
+        names = self.connected
+        results = await asyncio.gather(*(self._robots[name].send_speech(text) for name in names))
+        return dict(zip(names, results))
+
+    async def shutdown(self):
+        await asyncio.gather(*(robot.stop() for robot in self._robots.values()))
+        logger.info("FLEET: Усі роботи відключені.")
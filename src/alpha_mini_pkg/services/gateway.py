@@ -0,0 +1,336 @@
+"""
+Локальний шлюз керування платформою через websocket.
+
+Кожне повідомлення — JSON-об'єкт запиту або JSON-масив запитів (пакет
+кадрів). Відповідь має той самий ``id``:
+
+    -> {"id": 1, "op": "command", "text": "hello"}
+    <- {"id": 1, "ok": true, "result": {"text": "hello", "command": "hello", "routed": "handler"}}
+    -> {"id": 2, "op": "batch", "commands": ["walk 2 steps forward", "hello"], "parallel": false}
+    <- {"id": 2, "ok": true, "results": [...]}
+    -> {"id": 3, "op": "status"}
+    -> {"id": 4, "op": "subscribe", "topics": ["status", "command"]}
+
+Відповідь надсилається, коли команда завершилась: на "start" — лише після
+виходу з динамічного режиму, тож про його початок клієнт дізнається з
+події ``status``.
+
+Події без ``id`` надходять за темами: ``status`` (стан з'єднання, динамічний
+режим, черги планувальника, положення робота), ``command`` (початок і кінець
+команд усіх клієнтів) та ``speech`` (фрази, почуті роботом).
+"""
+import asyncio
+import collections
+import itertools
+import json
+import logging
+import urllib.parse
+from typing import Optional
+
+import websockets
+
+from alpha_mini_pkg.config import settings
+from alpha_mini_pkg.core.command_handler import get_command_handler
+from alpha_mini_pkg.core.command_scheduler import Channel, get_command_scheduler
+from alpha_mini_pkg.core.motion_planner import get_motion_planner
+from alpha_mini_pkg.services.connection_supervisor import current_supervisor
+from alpha_mini_pkg.services.speech_bus import DROP_OLDEST, get_speech_bus
+from alpha_mini_pkg.utils.telemetry import get_telemetry
+
+logger = logging.getLogger(__name__)
+
+TOPICS = frozenset({"status", "command", "speech"})
+
+
+class GatewayError(ValueError):
+    """Запит клієнта неможливо виконати; текст помилки повертається клієнту."""
+
+
+class GatewayClient:
+    """
+    Підключений клієнт із власною чергою вихідних повідомлень.
+
+    Відповіді на запити ставляться в чергу завжди, а події — лише поки в
+    черзі менше ``queue_size`` повідомлень: повільний клієнт втрачає події,
+    але не гальмує інших клієнтів і платформу.
+    """
+
+    def __init__(self, client_id: int, websocket, queue_size: int):
+        self.id = client_id
+        self.websocket = websocket
+        self.topics = set(TOPICS)
+        self.inflight = 0
+        self.dropped = 0
+        self.closed = False
+        self._queue_size = queue_size
+        self._outbox: collections.deque = collections.deque()
+        self._ready = asyncio.Event()
+
+    def send(self, payload: dict, event: bool = False) -> bool:
+        if self.closed:
+            return False
+        if event and len(self._outbox) >= self._queue_size:
+            self.dropped += 1
+            return False
+        self._outbox.append(json.dumps(payload, ensure_ascii=False))
+        self._ready.set()
+        return True
+
+    async def write_loop(self):
+        while True:
+            while not self._outbox:
+                self._ready.clear()
+                await self._ready.wait()
+            await self.websocket.send(self._outbox.popleft())
+
+
+class ControlGateway:
+    """
+    Websocket-шлюз, через який локальні програми (кіоски, планувальники)
+    керують платформою без власного з'єднання з роботом.
+
+    Команди проходять через той самий реєстр CommandHandler, що й голосові,
+    а далі — через планувальник команд і єдине з'єднання connection_manager.
+    Поки активний динамічний режим, команда публікується на шину мовлення,
+    як почута фраза, і її отримує динамічний алгоритм.
+    """
+
+    def __init__(self, host: Optional[str] = None, port: Optional[int] = None, token: Optional[str] = None):
+        self.host = host or settings.GATEWAY_HOST
+        self.port = settings.GATEWAY_PORT if port is None else port
+        self.token = token or settings.GATEWAY_TOKEN
+        self.clients: dict = {}
+        self.metrics: dict = {
+            "connections": 0,
+            "rejected": 0,
+            "commands": 0,
+            "batches": 0,
+            "errors": 0,
+            "events_dropped": 0,
+        }
+        self._ids = itertools.count(1)
+        self._server = None
+        self._tasks: set = set()
+        self._background: list = []
+        self._speech = None
+        self._last_status: Optional[dict] = None
+
+    @property
+    def events_dropped(self) -> int:
+        return self.metrics["events_dropped"] + sum(client.dropped for client in self.clients.values())
+
+    def collect(self) -> dict:
+        values = {f"alpha_gateway_{name}": value for name, value in self.metrics.items()}
+        values["alpha_gateway_events_dropped"] = self.events_dropped
+        values["alpha_gateway_clients"] = len(self.clients)
+        values["alpha_gateway_inflight"] = sum(client.inflight for client in self.clients.values())
+        return values
+
+    async def start(self) -> "ControlGateway":
+        loop = asyncio.get_running_loop()
+        self._server = await websockets.serve(self._serve, self.host, self.port)
+        if self.port == 0:
+            self.port = self._server.sockets[0].getsockname()[1]
+
+        self._speech = get_speech_bus().subscribe("gateway", priority=-10, overflow=DROP_OLDEST)
+        self._background = [
+            loop.create_task(self._forward_speech()),
+            loop.create_task(self._watch_status()),
+        ]
+        logger.info("GATEWAY: Шлюз керування слухає на ws://%s:%s", self.host, self.port)
+        return self
+
+    async def stop(self):
+        if self._speech is not None:
+            self._speech.close()
+            self._speech = None
+        for task in self._background + list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._background, *self._tasks, return_exceptions=True)
+        self._background = []
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        logger.info("GATEWAY: Шлюз керування зупинено.")
+
+    def status(self) -> dict:
+        supervisor = current_supervisor()
+        scheduler = get_command_scheduler()
+        pose = get_motion_planner().pose
+        return {
+            "connection": supervisor.state.value if supervisor is not None else "unknown",
+            "dynamic_mode": get_command_handler().is_dynamic_mode_active,
+            "pending": {channel.value: scheduler.pending(channel) for channel in Channel},
+            "pose": {"x": round(pose.x, 1), "y": round(pose.y, 1), "heading": round(pose.heading)},
+            "clients": len(self.clients),
+        }
+
+    def broadcast(self, topic: str, payload: dict):
+        for client in list(self.clients.values()):
+            if topic in client.topics:
+                client.send(payload, event=True)
+
+    async def _forward_speech(self):
+        while True:
+            utterance = await self._speech.get()
+            if utterance is None:
+                return
+            self.broadcast("speech", {"event": "speech", "text": utterance.text})
+
+    async def _watch_status(self):
+        while True:
+            await asyncio.sleep(settings.GATEWAY_STATUS_INTERVAL)
+            if not self.clients:
+                continue
+            status = self.status()
+            if status != self._last_status:
+                self._last_status = status
+                self.broadcast("status", {"event": "status", **status})
+
+    def _authorized(self, path: str) -> bool:
+        if not self.token:
+            return True
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(path).query)
+        return query.get("token", [None])[0] == self.token
+
+    async def _serve(self, websocket):
+        if not self._authorized(websocket.path):
+            self.metrics["rejected"] += 1
+            await websocket.close(1008, "unauthorized")
+            return
+        if len(self.clients) >= settings.GATEWAY_MAX_CLIENTS:
+            self.metrics["rejected"] += 1
+            await websocket.close(1013, "too many clients")
+            return
+
+        client = GatewayClient(next(self._ids), websocket, settings.GATEWAY_CLIENT_QUEUE)
+        self.clients[client.id] = client
+        self.metrics["connections"] += 1
+        writer = asyncio.get_running_loop().create_task(client.write_loop())
+        logger.info("GATEWAY: Клієнт #%s підключився (%s).", client.id, websocket.remote_address)
+        client.send({"event": "status", **self.status()})
+        try:
+            async for frame in websocket:
+                self._on_frame(client, frame)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            client.closed = True
+            del self.clients[client.id]
+            self.metrics["events_dropped"] += client.dropped
+            writer.cancel()
+            logger.info("GATEWAY: Клієнт #%s відключився.", client.id)
+
+    def _on_frame(self, client: GatewayClient, frame):
+        try:
+            requests = json.loads(frame)
+        except ValueError as e:
+            self.metrics["errors"] += 1
+            client.send({"ok": False, "error": f"invalid JSON: {e}"})
+            return
+        for request in requests if isinstance(requests, list) else [requests]:
+            self._on_request(client, request)
+
+    def _on_request(self, client: GatewayClient, request):
+        request_id = request.get("id") if isinstance(request, dict) else None
+        try:
+            if not isinstance(request, dict):
+                raise GatewayError("request must be a JSON object")
+            op = request.get("op")
+            if op == "status":
+                client.send({"id": request_id, "ok": True, "status": self.status()})
+            elif op == "subscribe":
+                topics = set(request.get("topics", TOPICS))
+                if not topics <= TOPICS:
+                    raise GatewayError(f"unknown topics: {sorted(topics - TOPICS)}")
+                client.topics = topics
+                client.send({"id": request_id, "ok": True, "topics": sorted(topics)})
+            elif op in ("command", "batch"):
+                self._submit(client, request_id, self._commands(request))
+            else:
+                raise GatewayError(f"unknown op {op!r}")
+        except GatewayError as e:
+            self.metrics["errors"] += 1
+            client.send({"id": request_id, "ok": False, "error": str(e)})
+
+    def _commands(self, request: dict) -> tuple:
+        if request["op"] == "command":
+            texts, parallel = [request.get("text")], False
+        else:
+            texts, parallel = request.get("commands"), bool(request.get("parallel", False))
+            if not isinstance(texts, list) or not texts:
+                raise GatewayError("batch needs a non-empty 'commands' list")
+            if len(texts) > settings.GATEWAY_MAX_BATCH:
+                raise GatewayError(f"batch is limited to {settings.GATEWAY_MAX_BATCH} commands")
+        if not all(isinstance(text, str) and text.strip() for text in texts):
+            raise GatewayError("every command must be a non-empty string")
+        return texts, parallel
+
+    def _submit(self, client: GatewayClient, request_id, commands: tuple):
+        if client.inflight >= settings.GATEWAY_MAX_INFLIGHT:
+            raise GatewayError("too many commands in flight")
+        client.inflight += 1
+        task = asyncio.get_running_loop().create_task(self._run(client, request_id, *commands))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, client: GatewayClient, request_id, texts: list, parallel: bool):
+        try:
+            if parallel:
+                results = await asyncio.gather(*(self._command(client, request_id, text) for text in texts))
+            else:
+                results = [await self._command(client, request_id, text) for text in texts]
+        finally:
+            client.inflight -= 1
+
+        if len(texts) > 1 or parallel:
+            self.metrics["batches"] += 1
+            client.send({"id": request_id, "ok": all(r["ok"] for r in results), "results": results})
+        else:
+            client.send({"id": request_id, "ok": results[0]["ok"], "result": results[0]})
+
+    async def _command(self, client: GatewayClient, request_id, text: str) -> dict:
+        self.metrics["commands"] += 1
+        event = {"event": "command", "client": client.id, "id": request_id, "text": text}
+        self.broadcast("command", {**event, "state": "started"})
+
+        task = get_telemetry().spawn(asyncio.get_running_loop(), self._execute(text), "gateway", text)
+        try:
+            result = await task
+        except Exception as e:
+            logger.error("GATEWAY: Помилка команди '%s' від клієнта #%s: %s", text, client.id, e)
+            result = {"text": text, "ok": False, "error": str(e)}
+
+        self.broadcast("command", {**event, "state": "finished", "ok": result["ok"]})
+        return result
+
+    async def _execute(self, text: str) -> dict:
+        handler = get_command_handler()
+        if handler.is_dynamic_mode_active:
+            get_speech_bus().publish(text)
+            return {"text": text, "ok": True, "routed": "dynamic"}
+        command, ok = await handler.handle_speech_command(text)
+        return {"text": text, "ok": ok, "command": command, "routed": "handler"}
+
+
+_gateway: Optional[ControlGateway] = None
+
+
+def get_gateway() -> Optional[ControlGateway]:
+    return _gateway
+
+
+async def start_gateway(host: Optional[str] = None, port: Optional[int] = None) -> ControlGateway:
+    global _gateway
+    if _gateway is None:
+        _gateway = await ControlGateway(host, port).start()
+        get_telemetry().register_collector(_gateway.collect)
+    return _gateway
+
+
+async def stop_gateway():
+    global _gateway
+    if _gateway is not None:
+        await _gateway.stop()
+        _gateway = None
@@ -0,0 +1,238 @@
+import asyncio
+import collections
+import itertools
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from mini.apis.api_observe import SpeechRecogniseResponse
+from alpha_mini_pkg.services import api_client
+from alpha_mini_pkg.utils.journal import get_journal
+from alpha_mini_pkg.utils.telemetry import get_telemetry
+
+logger = logging.getLogger(__name__)
+
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+
+DEFAULT_QUEUE_SIZE: int = 32
+
+UtteranceFilter = Callable[["Utterance"], bool]
+
+
+class Utterance:
+    __slots__ = ("text", "normalized", "received_at")
+
+    def __init__(self, text: str, received_at: Optional[float] = None):
+        self.text = text
+        self.normalized = text.strip().lower()
+        self.received_at = time.perf_counter() if received_at is None else received_at
+
+    def __repr__(self) -> str:
+        return f"Utterance({self.text!r})"
+
+
+class SpeechSubscription:
+    """
+    Підписка на шину мовлення з власною обмеженою чергою.
+
+    Коли черга заповнена, політика ``DROP_OLDEST`` викидає найстарішу фразу,
+    а ``DROP_NEWEST`` — нову; кількість втрачених фраз рахується в ``dropped``.
+    Після ``close()`` метод ``get()`` повертає None.
+    """
+
+    def __init__(self, bus: "SpeechBus", name: str, priority: int, accept: Optional[UtteranceFilter],
+                 maxsize: int, exclusive: bool, overflow: str, seq: int):
+        if overflow not in (DROP_OLDEST, DROP_NEWEST):
+            raise ValueError(f"Unknown overflow policy '{overflow}'")
+        self.name = name
+        self.priority = priority
+        self.exclusive = exclusive
+        self.overflow = overflow
+        self.maxsize = maxsize
+        self.dropped = 0
+        self.closed = False
+        self._bus = bus
+        self._accept = accept
+        self._seq = seq
+        self._buffer: collections.deque = collections.deque()
+        self._ready = asyncio.Event()
+        self._taps: list = []
+
+    @property
+    def rank(self) -> tuple:
+        return (-self.priority, self._seq)
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def accepts(self, utterance: Utterance) -> bool:
+        return self._accept is None or self._accept(utterance)
+
+    def add_tap(self, tap: Callable[[Utterance], bool]):
+        """
+        Додає перехоплювач, який бачить фразу в момент доставки, ще до черги.
+        Якщо перехоплювач повертає True, фраза вважається спожитою.
+        """
+        self._taps.append(tap)
+
+    def clear(self) -> int:
+        cleared = len(self._buffer)
+        self._buffer.clear()
+        if not self.closed:
+            self._ready.clear()
+        return cleared
+
+    def offer(self, utterance: Utterance) -> bool:
+        if self.closed:
+            return False
+        for tap in self._taps:
+            if tap(utterance):
+                return True
+        if len(self._buffer) >= self.maxsize:
+            self.dropped += 1
+            get_telemetry().count("alpha_speech_dropped_total", subscriber=self.name)
+            if self.overflow == DROP_NEWEST:
+                logger.debug("SPEECH_BUS[%s]: Черга повна, '%s' відкинуто.", self.name, utterance.text)
+                return False
+            dropped = self._buffer.popleft()
+            logger.debug("SPEECH_BUS[%s]: Черга повна, відкинуто найстаріше '%s'.", self.name, dropped.text)
+        self._buffer.append(utterance)
+        self._ready.set()
+        return True
+
+    def get_nowait(self) -> Optional[Utterance]:
+        if not self._buffer:
+            return None
+        utterance = self._buffer.popleft()
+        if not self._buffer and not self.closed:
+            self._ready.clear()
+        return utterance
+
+    async def get(self) -> Optional[Utterance]:
+        while not self._buffer:
+            if self.closed:
+                return None
+            await self._ready.wait()
+        return self.get_nowait()
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self._ready.set()
+            self._bus._unsubscribe(self)
+
+    def __enter__(self) -> "SpeechSubscription":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class SpeechBus:
+    """
+    Одна довготривала підписка ObserveSpeechRecognise, що роздає розпізнані
+    фрази всім внутрішнім підписникам.
+
+    Звичайні підписники отримують кожну фразу, яку пропускає їхній фільтр,
+    у порядку пріоритету. Поки відкрита ексклюзивна підписка (наприклад,
+    динамічний режим), фразу, прийняту її фільтром, отримує лише вона — без
+    нової підписки на боці робота. Фрази, які ексклюзивний фільтр відхилив,
+    ідуть далі звичайним підписникам.
+    """
+
+    def __init__(self):
+        self._observer = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._subscriptions: list = []
+        self._seq = itertools.count()
+        self.published = 0
+
+    @property
+    def active(self) -> bool:
+        return self._observer is not None
+
+    def start(self):
+        if self._observer is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._observer = api_client.create_speech_observer()
+        self._observer.set_handler(self._on_response)
+        self._observer.start()
+        logger.info("SPEECH_BUS: Підписку на розпізнавання мови відкрито.")
+
+    def reattach(self):
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.start()
+            logger.info("SPEECH_BUS: Підписку на розпізнавання мови відновлено.")
+
+    def stop(self):
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+            logger.info("SPEECH_BUS: Підписку на розпізнавання мови закрито.")
+
+    def subscribe(self, name: str, *, priority: int = 0, accept: Optional[UtteranceFilter] = None,
+                  maxsize: int = DEFAULT_QUEUE_SIZE, exclusive: bool = False,
+                  overflow: str = DROP_OLDEST) -> SpeechSubscription:
+        subscription = SpeechSubscription(self, name, priority, accept, maxsize, exclusive, overflow, next(self._seq))
+        self._subscriptions.append(subscription)
+        self._subscriptions.sort(key=lambda s: s.rank)
+        logger.debug("SPEECH_BUS: Підписник '%s' (пріоритет %s, ексклюзивний=%s).", name, priority, exclusive)
+        return subscription
+
+    def capture(self, name: str, *, priority: int = 10, **kwargs) -> SpeechSubscription:
+        """Ексклюзивна підписка, яку зручно використовувати як контекстний менеджер."""
+        return self.subscribe(name, priority=priority, exclusive=True, **kwargs)
+
+    def _unsubscribe(self, subscription: SpeechSubscription):
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+            logger.debug("SPEECH_BUS: Підписник '%s' відписався.", subscription.name)
+
+    def _on_response(self, msg: SpeechRecogniseResponse):
+        get_journal().speech(msg.text, msg.isSuccess, msg.resultCode)
+        if not (msg.isSuccess and msg.text):
+            logger.warning("SPEECH_BUS: Розпізнавання не вдалося. Код: %s", msg.resultCode)
+            get_telemetry().count("alpha_recognition_failures_total")
+            return
+
+        logger.info("SPEECH_BUS: SDK розпізнано голос: '%s'", msg.text)
+        self.publish(msg.text)
+
+    def publish(self, text: str):
+        utterance = Utterance(text)
+        if self._loop is not None and threading.get_ident() != self._loop_thread:
+            self._loop.call_soon_threadsafe(self._deliver, utterance)
+        else:
+            self._deliver(utterance)
+
+    def _deliver(self, utterance: Utterance) -> int:
+        self.published += 1
+        for subscription in self._subscriptions:
+            if subscription.exclusive and subscription.accepts(utterance):
+                subscription.offer(utterance)
+                return 1
+
+        delivered = 0
+        for subscription in self._subscriptions:
+            if not subscription.exclusive and subscription.accepts(utterance):
+                delivered += subscription.offer(utterance)
+        if not delivered:
+            logger.debug("SPEECH_BUS: Фразу '%s' ніхто не прийняв.", utterance.text)
+        return delivered
+
+
+_speech_bus: Optional[SpeechBus] = None
+
+
+def get_speech_bus() -> SpeechBus:
+    global _speech_bus
+    if _speech_bus is None:
+        _speech_bus = SpeechBus()
+    return _speech_bus
@@ -0,0 +1,154 @@
+import json
+import logging
+import os
+from collections import OrderedDict
+from typing import Optional
+
+from alpha_mini_pkg.config import settings
+from alpha_mini_pkg.utils.telemetry import get_telemetry
+
+logger = logging.getLogger(__name__)
+
+
+class PhraseEntry:
+    __slots__ = ("text", "count", "duration")
+
+    def __init__(self, text: str, count: int = 0, duration: Optional[float] = None):
+        self.text = text
+        self.count = count
+        self.duration = duration
+
+    def __repr__(self) -> str:
+        return f"PhraseEntry({self.text!r}, count={self.count}, duration={self.duration})"
+
+
+def _key(text: str) -> str:
+    return " ".join(text.split()).lower()
+
+
+class TtsPhraseCache:
+    """
+    LRU-кеш фраз, які робот промовляє повторно.
+
+    Для кожної фрази рахується, скільки разів її сказано, і запам'ятовується
+    тривалість першого відтворення, яке робот підтвердив саме завершенням
+    мовлення (див. TtsCompletionTracker.is_completion_ack). Миттєве
+    підтвердження тривалості не дає, тож на таких прошивках фраза лишається
+    без неї, а трекер чекає за своєю моделлю. Коли фраз більше ніж
+    ``capacity``, витісняється та, яку найдовше не промовляли
+    (alpha_tts_cache_total{result="evicted"}).
+
+    Статистика зберігається у файлі для кожного робота окремо, а ``warm()``
+    під час запуску підтягує найчастіші фрази разом із їхньою тривалістю.
+    """
+
+    def __init__(self, capacity: Optional[int] = None, robot_id: Optional[str] = None,
+                 cache_file: Optional[str] = None):
+        self.capacity = capacity or settings.TTS_PHRASE_CACHE_SIZE
+        self.robot_id = robot_id or settings.ROBOT_IP
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache_file = cache_file or settings.TTS_PHRASE_CACHE_FILE
+        self._entries: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, text: str) -> bool:
+        return _key(text) in self._entries
+
+    def get(self, text: str) -> Optional[PhraseEntry]:
+        return self._entries.get(_key(text))
+
+    def touch(self, text: str) -> PhraseEntry:
+        """Реєструє ще одне промовляння фрази й повертає її запис."""
+        key = _key(text)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            get_telemetry().count("alpha_tts_cache_total", result="miss")
+            entry = self._insert(key, PhraseEntry(text))
+        else:
+            self.hits += 1
+            get_telemetry().count("alpha_tts_cache_total", result="hit")
+            self._entries.move_to_end(key)
+
+        entry.count += 1
+        return entry
+
+    def duration(self, text: str) -> Optional[float]:
+        entry = self._entries.get(_key(text))
+        return None if entry is None else entry.duration
+
+    def record_duration(self, text: str, seconds: float) -> bool:
+        """Запам'ятовує тривалість фрази, якщо її ще не виміряно."""
+        entry = self._entries.get(_key(text))
+        if entry is None or entry.duration is not None:
+            return False
+        entry.duration = seconds
+        logger.debug("TTS_CACHE: Тривалість '%s' виміряно: %.2f с.", text[:30], seconds)
+        return True
+
+    def frequent(self, limit: Optional[int] = None) -> list:
+        entries = sorted(self._entries.values(), key=lambda e: e.count, reverse=True)
+        return entries if limit is None else entries[:limit]
+
+    def _insert(self, key: str, entry: PhraseEntry) -> PhraseEntry:
+        self._entries[key] = entry
+        while len(self._entries) > self.capacity:
+            _, evicted = self._entries.popitem(last=False)
+            self.evictions += 1
+            get_telemetry().count("alpha_tts_cache_total", result="evicted")
+            logger.debug("TTS_CACHE: Фразу '%s' витіснено з кешу.", evicted.text[:30])
+        return entry
+
+    def warm(self, limit: Optional[int] = None) -> int:
+        """
+        Завантажує ``limit`` найчастіших фраз зі збереженої статистики.
+        Найчастіші фрази потрапляють у кінець LRU-черги, тобто витісняються останніми.
+        """
+        limit = settings.TTS_WARMUP_PHRASES if limit is None else limit
+        stored = self._read().get(self.robot_id, [])
+        try:
+            # Тривалість — необов'язкове третє поле: фрази без виміру зберігаються без неї.
+            entries = [PhraseEntry(str(item[0]), int(item[1]), None if len(item) < 3 or item[2] is None else float(item[2]))
+                       for item in stored]
+        except (TypeError, ValueError, IndexError) as e:
+            logger.warning("TTS_CACHE: Пошкоджена статистика фраз: %s", e)
+            return 0
+
+        entries.sort(key=lambda e: e.count)
+        warmed = 0
+        for entry in entries[-limit:] if limit > 0 else []:
+            key = _key(entry.text)
+            if key not in self._entries:
+                self._insert(key, entry)
+                warmed += 1
+
+        if warmed:
+            logger.info("TTS_CACHE: Прогріто %s частих фраз для %s.", warmed, self.robot_id)
+        return warmed
+
+    def _read(self) -> dict:
+        if not self._cache_file or not os.path.exists(self._cache_file):
+            return {}
+        try:
+            with open(self._cache_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("TTS_CACHE: Не вдалося прочитати статистику фраз: %s", e)
+            return {}
+
+    def save(self):
+        if not self._cache_file:
+            return
+        try:
+            data = self._read()
+            data[self.robot_id] = [[e.text, e.count, e.duration] for e in self.frequent()]
+
+            os.makedirs(os.path.dirname(self._cache_file), exist_ok=True)
+            with open(self._cache_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+        except (OSError, ValueError) as e:
+            logger.warning("TTS_CACHE: Не вдалося зберегти статистику фраз: %s", e)
@@ -0,0 +1,198 @@
+import asyncio
+import json
+import logging
+import os
+from collections import deque
+from typing import Optional
+
+from alpha_mini_pkg.config import settings
+from alpha_mini_pkg.services import api_client
+from alpha_mini_pkg.services.tts_cache import TtsPhraseCache
+from alpha_mini_pkg.utils.helpers import estimate_tts_duration
+
+logger = logging.getLogger(__name__)
+
+HISTORY_SIZE: int = 50
+MIN_CALIBRATION_SAMPLES: int = 3
+IMMEDIATE_ACK_SECONDS: float = 0.35
+# Швидше за це робот фразу не промовить: підтвердження, що прийшло раніше,
+# означає повільну мережу, а не кінець мовлення.
+MAX_SPEECH_CHARS_PER_SECOND: float = 20.0
+SAVE_EVERY: int = 5
+
+
+class TtsDurationModel:
+    """
+    Адаптивна модель тривалості TTS: ``base_time + len(text) / chars_per_second``.
+
+    Поки вимірів менше ніж MIN_CALIBRATION_SAMPLES, використовуються параметри
+    estimate_tts_duration; далі обидва коефіцієнти підбираються методом
+    найменших квадратів за останніми HISTORY_SIZE вимірами.
+    """
+
+    def __init__(self, chars_per_second: float = 6.67, base_time: float = 2.0):
+        self.chars_per_second = chars_per_second
+        self.base_time = base_time
+        self._history: deque = deque(maxlen=HISTORY_SIZE)
+
+    @property
+    def samples(self) -> list:
+        return list(self._history)
+
+    def predict(self, text: str) -> float:
+        return estimate_tts_duration(text, self.chars_per_second, self.base_time)
+
+    def observe(self, text: str, seconds: float):
+        self._history.append((len(text), seconds))
+        self._fit()
+
+    def load(self, samples: list):
+        self._history.extend((int(chars), float(seconds)) for chars, seconds in samples)
+        self._fit()
+
+    def _fit(self):
+        n = len(self._history)
+        if n < MIN_CALIBRATION_SAMPLES:
+            return
+
+        mean_x = sum(x for x, _ in self._history) / n
+        mean_y = sum(y for _, y in self._history) / n
+        var_x = sum((x - mean_x) ** 2 for x, _ in self._history)
+        if var_x == 0:
+            self.base_time = max(0.0, mean_y - mean_x / self.chars_per_second)
+            return
+
+        slope = sum((x - mean_x) * (y - mean_y) for x, y in self._history) / var_x
+        if slope <= 0:
+            return
+
+        self.chars_per_second = 1.0 / slope
+        self.base_time = max(0.0, mean_y - slope * mean_x)
+        logger.debug(
+            "TTS: Модель відкалібровано: %.2f симв./с, база %.2f с (%s вимірів).", self.chars_per_second, self.base_time, n
+        )
+
+
+class TtsCompletionTracker:
+    """
+    Відстежує завершення мовлення робота.
+
+    StartPlayTTS виконується з очікуванням відповіді. Прошивки, що
+    підтверджують команду після завершення мовлення, дають справжній сигнал
+    кінця фрази: таке підтвердження завершує очікування, а виміряний час
+    калібрує модель для цього робота. Підтвердження вважається сигналом
+    завершення, лише якщо воно прийшло не раніше IMMEDIATE_ACK_SECONDS і не
+    раніше, ніж фразу взагалі можна промовити (див. is_completion_ack).
+
+    Якщо підтвердження миттєве або його затримала мережа, трекер дочікує
+    залишок тривалості фрази: виміряної раніше (кеш фраз), а для ще не
+    виміряної — оцінки моделі. SDK не має ні запиту стану, ні спостерігача
+    завершення TTS, тож на прошивках із миттєвим підтвердженням ні модель,
+    ні кеш фраз не калібруються, і лишається оцінка estimate_tts_duration
+    (або калібрування, збережене раніше для цього робота).
+    """
+
+    def __init__(self, robot_id: Optional[str] = None, calibration_file: Optional[str] = None,
+                 phrases: Optional[TtsPhraseCache] = None):
+        robot_id = robot_id or settings.ROBOT_IP
+        self.robot_id = robot_id
+        self.model = TtsDurationModel()
+        self.phrases = phrases if phrases is not None else TtsPhraseCache(robot_id=robot_id)
+        self._calibration_file = calibration_file or settings.TTS_CALIBRATION_FILE
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._unsaved = 0
+        self._load()
+
+    @property
+    def is_speaking(self) -> bool:
+        return not self._idle.is_set()
+
+    async def wait_until_idle(self):
+        await self._idle.wait()
+
+    async def speak(self, text: str) -> bool:
+        loop = asyncio.get_running_loop()
+        self._idle.clear()
+        self.phrases.touch(text)
+        try:
+            started = loop.time()
+            success = await api_client.start_tts(text=text)
+            if not success:
+                return False
+
+            elapsed = loop.time() - started
+            predicted = self.expected_duration(text)
+
+            if self.is_completion_ack(text, elapsed, predicted):
+                logger.debug("TTS: Робот підтвердив завершення через %.2f с (модель: %.2f с).", elapsed, predicted)
+                self.record(text, elapsed)
+                if self._unsaved >= SAVE_EVERY:
+                    await loop.run_in_executor(None, self.save)
+                return True
+
+            remaining = predicted - elapsed
+            logger.debug("TTS: Очікування завершення: ще %.2f с.", remaining)
+            await asyncio.sleep(max(0.0, remaining))
+            return True
+        finally:
+            self._idle.set()
+
+    @staticmethod
+    def is_completion_ack(text: str, elapsed: float, predicted: float) -> bool:
+        """
+        Чи могло підтвердження через ``elapsed`` секунд означати кінець мовлення:
+        не раніше, ніж фразу можна промовити, і не раніше половини оцінки моделі.
+        """
+        shortest = min(len(text) / MAX_SPEECH_CHARS_PER_SECOND, predicted / 2)
+        return elapsed >= max(IMMEDIATE_ACK_SECONDS, shortest)
+
+    def expected_duration(self, text: str) -> float:
+        """Скільки триватиме фраза: виміряна тривалість з кешу фраз або оцінка моделі."""
+        duration = self.phrases.duration(text)
+        return self.model.predict(text) if duration is None else duration
+
+    def record(self, text: str, seconds: float):
+        self.model.observe(text, seconds)
+        self.phrases.record_duration(text, seconds)
+        self._unsaved += 1
+
+    def _load(self):
+        if not self._calibration_file or not os.path.exists(self._calibration_file):
+            return
+        try:
+            with open(self._calibration_file, "r", encoding="utf-8") as f:
+                samples = json.load(f).get(self.robot_id, [])
+            self.model.load(samples)
+            logger.info("TTS: Завантажено %s вимірів калібрування для %s.", len(samples), self.robot_id)
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning("TTS: Не вдалося прочитати калібрування: %s", e)
+
+    def save(self):
+        """Записує калібрування й кеш фраз; блокує потік, тож із циклу подій — через executor."""
+        self.phrases.save()
+        if not self._calibration_file:
+            return
+        try:
+            data = {}
+            if os.path.exists(self._calibration_file):
+                with open(self._calibration_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            data[self.robot_id] = self.model.samples
+
+            os.makedirs(os.path.dirname(self._calibration_file), exist_ok=True)
+            with open(self._calibration_file, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            self._unsaved = 0
+        except (OSError, ValueError) as e:
+            logger.warning("TTS: Не вдалося зберегти калібрування: %s", e)
+
+
+_tracker: Optional[TtsCompletionTracker] = None
+
+
+def get_tts_tracker() -> TtsCompletionTracker:
+    global _tracker
+    if _tracker is None:
+        _tracker = TtsCompletionTracker()
+    return _tracker
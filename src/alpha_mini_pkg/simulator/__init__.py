@@ -0,0 +1,15 @@
+from alpha_mini_pkg.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    'FakeAlphaMini': '.fake_robot',
+    'JournalReplayer': '.replay',
+    'start_fake_fleet': '.fake_robot',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = [
+    'FakeAlphaMini',
+    'JournalReplayer',
+    'start_fake_fleet',
+]
@@ -0,0 +1,62 @@
+"""
+Імітований Alpha Mini на localhost для запуску launcher без фізичного робота.
+
+    python -m alpha_mini_pkg.simulator --port 8800 --latency 0.05 --failure-rate 0.1
+
+Кожен рядок, введений у stdin, надсилається підписаним клієнтам як
+розпізнана фраза.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+
+from alpha_mini_pkg.simulator.fake_robot import FakeAlphaMini
+
+
+async def serve(robot: FakeAlphaMini):
+    await robot.start()
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            text = line.decode("utf-8").strip()
+            if text:
+                delivered = await robot.recognise(text)
+                logging.info(f"SIMULATOR: '{text}' доставлено {delivered} клієнтам.")
+    finally:
+        await robot.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fake Alpha Mini robot")
+    parser.add_argument("--name", default="FakeMini")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--step-time", type=float, default=0.0)
+    parser.add_argument("--boot-time", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(asctime)s - %(name)s: %(message)s')
+    robot = FakeAlphaMini(
+        name=args.name, host=args.host, port=args.port, latency=args.latency,
+        boot_time=args.boot_time, jitter=args.jitter, step_time=args.step_time,
+        failure_rate=args.failure_rate, drop_rate=args.drop_rate, seed=args.seed,
+    )
+    try:
+        asyncio.run(serve(robot))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+import asyncio
+import logging
+import random
+from typing import Optional
+
+import websockets
+from mini.apis.cmdid import _PCProgramCmdId
+from mini.channels import msg_utils
+from mini.pb2.codemao_controltts_pb2 import ControlTTSRequest, ControlTTSResponse
+from mini.pb2.codemao_getinfrareddistance_pb2 import GetInfraredDistanceRequest, GetInfraredDistanceResponse
+from mini.pb2.codemao_moverobot_pb2 import MoveRobotRequest, MoveRobotResponse
+from mini.pb2.codemao_playaction_pb2 import PlayActionRequest, PlayActionResponse
+from mini.pb2.codemao_speechrecognise_pb2 import SpeechRecogniseResponse
+from mini.pb2.codemao_stopaction_pb2 import StopActionRequest, StopActionResponse
+from mini.pb2.pccodemao_disconnection_pb2 import DisconnectionRequest, DisconnectionResponse
+from mini.pb2.pccodemao_getappversion_pb2 import GetAppVersionRequest, GetAppVersionResponse
+from mini.pb2.pccodemao_message_pb2 import Message
+
+logger = logging.getLogger(__name__)
+
+_CMD = _PCProgramCmdId
+
+# cmd -> (клас запиту, фабрика успішної відповіді)
+_HANDLED_COMMANDS = {
+    _CMD.MOVE_ROBOT_REQUEST.value: (MoveRobotRequest, lambda: MoveRobotResponse(isSuccess=True)),
+    _CMD.PLAY_ACTION_REQUEST.value: (PlayActionRequest, lambda: PlayActionResponse(isSuccess=True)),
+    _CMD.STOP_ACTION_REQUEST.value: (StopActionRequest, lambda: StopActionResponse(isSuccess=True)),
+    _CMD.PLAY_TTS_REQUEST.value: (ControlTTSRequest, lambda: ControlTTSResponse(isSuccess=True)),
+    _CMD.GET_ROBOT_VERSION_REQUEST.value: (GetAppVersionRequest, lambda: GetAppVersionResponse(isSuccess=True, version="sim")),
+    _CMD.DISCONNECTION_REQUEST.value: (DisconnectionRequest, DisconnectionResponse),
+    _CMD.GET_INFRARED_DISTANCE_REQUEST.value: (GetInfraredDistanceRequest, lambda: GetInfraredDistanceResponse(distance=300)),
+}
+
+# Команди, на які поширюються імітовані збої; рукостискання та heartbeat лишаються надійними.
+_FAULTY_COMMANDS = frozenset({
+    _CMD.MOVE_ROBOT_REQUEST.value,
+    _CMD.PLAY_ACTION_REQUEST.value,
+    _CMD.STOP_ACTION_REQUEST.value,
+    _CMD.PLAY_TTS_REQUEST.value,
+})
+
+_EVENT_ID = "0"
+
+
+class FakeAlphaMini:
+    """
+    Імітація робота Alpha Mini на локальному websocket-сервері.
+
+    Розмовляє тим самим протоколом, що й SDK (base64 protobuf ``Message`` із
+    суфіксом ``&``), відповідає успіхом на рух, дії, TTS і вхід/вихід з режиму
+    програмування та розсилає події розпізнавання мови підписаним клієнтам.
+    Протягом ``boot_time`` секунд після входу в режим програмування робот
+    мовчки ігнорує інші запити, як справжній під час стартової анімації.
+
+    Для навантажувального тестування затримку відповіді можна задати окремо
+    для кожної команди (``latencies``), додати рівномірний ``jitter`` і час
+    на кожен крок руху (``step_time``). ``failure_rate`` — частка відповідей
+    з ``isSuccess=False``, ``drop_rate`` — частка запитів без відповіді
+    (SDK отримає тайм-аут). Збої стосуються лише руху, дій і TTS.
+    """
+
+    def __init__(self, name: str = "FakeMini", host: str = "127.0.0.1", port: int = 8800,
+                 latency: float = 0.0, boot_time: float = 0.0, latencies: Optional[dict] = None,
+                 jitter: float = 0.0, step_time: float = 0.0, failure_rate: float = 0.0,
+                 drop_rate: float = 0.0, seed: Optional[int] = None):
+        self.name = name
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.boot_time = boot_time
+        self.latencies: dict = {cmd.value: value for cmd, value in (latencies or {}).items()}
+        self.jitter = jitter
+        self.step_time = step_time
+        self.failure_rate = failure_rate
+        self.drop_rate = drop_rate
+        self._random = random.Random(seed)
+        self.faults = {"failed": 0, "dropped": 0}
+        self._ready_at = 0.0
+        self.received: list = []
+        self._server = None
+        self._clients: set = set()
+        self._speech_subscribers: set = set()
+
+    @property
+    def address(self) -> str:
+        return f"{self.host}:{self.port}"
+
+    async def start(self) -> "FakeAlphaMini":
+        self._server = await websockets.serve(self._serve, self.host, self.port)
+        if self.port == 0:
+            self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"SIMULATOR: '{self.name}' слухає на ws://{self.address}")
+        return self
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self._clients.clear()
+        self._speech_subscribers.clear()
+
+    async def disconnect_clients(self):
+        for client in list(self._clients):
+            await client.close()
+
+    async def recognise(self, text: str, success: bool = True) -> int:
+        response = SpeechRecogniseResponse(isSuccess=success, text=text)
+        frame = self._encode(_CMD.SPEECH_RECOGNISE.value, _EVENT_ID, response)
+        delivered = 0
+        for client in list(self._speech_subscribers):
+            try:
+                await client.send(frame)
+                delivered += 1
+            except websockets.ConnectionClosed:
+                self._speech_subscribers.discard(client)
+        return delivered
+
+    def commands(self, cmd: _PCProgramCmdId) -> list:
+        return [request for command, request in self.received if command == cmd.value]
+
+    async def _serve(self, websocket, path: Optional[str] = None):
+        self._clients.add(websocket)
+        try:
+            async for frame in websocket:
+                message = msg_utils.parse_msg(msg_utils.base64_decode(frame))
+                await self._on_message(websocket, message)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            self._clients.discard(websocket)
+            self._speech_subscribers.discard(websocket)
+
+    async def _on_message(self, websocket, message: Message):
+        cmd = message.header.command
+
+        if cmd == _CMD.SPEECH_RECOGNISE.value:
+            self._speech_subscribers.add(websocket)
+            self.received.append((cmd, None))
+            return
+        if cmd == _CMD.STOP_SPEECH_RECOGNISE_REQUEST.value:
+            self._speech_subscribers.discard(websocket)
+            self.received.append((cmd, None))
+            return
+
+        handled = _HANDLED_COMMANDS.get(cmd)
+        if handled is None:
+            logger.warning(f"SIMULATOR: '{self.name}' не підтримує cmd={cmd}.")
+            await self._reply_unsupported(websocket, message)
+            return
+
+        loop = asyncio.get_running_loop()
+        if cmd == _CMD.GET_ROBOT_VERSION_REQUEST.value:
+            self._ready_at = loop.time() + self.boot_time
+        elif loop.time() < self._ready_at:
+            logger.debug(f"SIMULATOR: '{self.name}' ще не готовий, cmd={cmd} проігноровано.")
+            return
+
+        request_class, make_response = handled
+        request = request_class()
+        request.ParseFromString(message.bodyData)
+        self.received.append((cmd, request))
+
+        response = make_response()
+        if cmd in _FAULTY_COMMANDS:
+            roll = self._random.random()
+            if roll < self.drop_rate:
+                self.faults["dropped"] += 1
+                return
+            if roll < self.drop_rate + self.failure_rate:
+                self.faults["failed"] += 1
+                response.isSuccess = False
+
+        loop.create_task(self._reply(websocket, cmd, message.header.id, response, self._delay(cmd, request)))
+
+    def _delay(self, cmd: int, request) -> float:
+        delay = self.latencies.get(cmd, self.latency)
+        if cmd == _CMD.MOVE_ROBOT_REQUEST.value:
+            delay += self.step_time * request.step
+        if self.jitter > 0:
+            delay += self._random.uniform(0, self.jitter)
+        return delay
+
+    async def _reply(self, websocket, cmd: int, message_id: str, response, delay: float = 0.0):
+        if delay > 0:
+            await asyncio.sleep(delay)
+        try:
+            await websocket.send(self._encode(cmd, message_id, response))
+        except websockets.ConnectionClosed:
+            pass
+
+    async def _reply_unsupported(self, websocket, message: Message):
+        reply = Message()
+        reply.header.CopyFrom(message.header)
+        reply.header.target = -1
+        await websocket.send(msg_utils.base64_encode(reply.SerializeToString()))
+
+    @staticmethod
+    def _encode(cmd: int, message_id: str, response) -> str:
+        message = msg_utils.build_response_msg(cmd, message_id, response)
+        return msg_utils.base64_encode(message.SerializeToString())
+
+
+async def start_fake_fleet(count: int, host: str = "127.0.0.1", base_port: int = 0, **kwargs) -> list:
+    """
+    Запускає ``count`` імітованих роботів. При ``base_port=0`` порти обирає ОС.
+    """
+    robots = [
+        FakeAlphaMini(name=f"FakeMini_{i}", host=host, port=base_port + i if base_port else 0, **kwargs)
+        for i in range(count)
+    ]
+    await asyncio.gather(*(robot.start() for robot in robots))
+    return robots
@@ -0,0 +1,270 @@
+"""
+Відтворення журналу сесії без робота.
+
+    python -m alpha_mini_pkg.simulator.replay ~/.alpha_mini/journal --speed 10
+
+Розпізнані фрази з журналу подаються на шину мовлення з тими самими
+інтервалами (поділеними на ``--speed``), тож слухач, обробник команд і
+алгоритми працюють як під час запису. Запити до робота не надсилаються:
+кожна спроба запиту отримує записаний результат після записаної затримки.
+Відтворення пише власний журнал і наприкінці порівнює його із записаним:
+послідовність рішень диспетчера, послідовність запитів і затримку від
+рішення до першого запиту.
+
+Прискорюються лише записані інтервали (паузи між фразами й час відповіді
+робота); власні таймери платформи, як-от паузи алгоритму, йдуть у реальному часі.
+"""
+import argparse
+import asyncio
+import collections
+import logging
+import os
+import sys
+import tempfile
+import types
+from typing import Optional
+
+from mini.apis.base_api import MiniApiResultType
+
+from alpha_mini_pkg.services import api_client, tts_tracker
+from alpha_mini_pkg.services.circuit_breaker import get_circuit_breaker
+from alpha_mini_pkg.services.speech_bus import get_speech_bus
+from alpha_mini_pkg.services.tts_cache import TtsPhraseCache
+from alpha_mini_pkg.utils.journal import API_CALL, API_RESULT, DISPATCH, SPEECH, get_journal, read_journal
+
+logger = logging.getLogger(__name__)
+
+DRAIN_TIMEOUT: float = 30.0
+
+
+class RecordedAttempt:
+    __slots__ = ("api", "args", "result", "success", "reason", "latency")
+
+    def __init__(self, api: str, args: str, result: str, success: bool, reason: str, latency: float):
+        self.api = api
+        self.args = args
+        self.result = result
+        self.success = success
+        self.reason = reason
+        self.latency = latency
+
+    def outcome(self) -> tuple:
+        """Результат у формі ``api_client._attempt``: (result_type, response, причина збою)."""
+        result_type = MiniApiResultType.__members__.get(self.result)
+        response = types.SimpleNamespace(isSuccess=self.success) if result_type == MiniApiResultType.Success else None
+        return (result_type, response, self.reason or None)
+
+
+def recorded_attempts(records: list) -> list:
+    """Пари API_CALL/API_RESULT з журналу в порядку запитів."""
+    calls, attempts = {}, []
+    for record in records:
+        if record.kind == API_CALL:
+            calls[record.call_id] = record
+        elif record.kind == API_RESULT and record.call_id in calls:
+            call = calls.pop(record.call_id)
+            attempts.append(RecordedAttempt(call.api, call.args, record.result, record.success == "1",
+                                            record.reason, record.ts - call.ts))
+    return attempts
+
+
+def dispatch_sequence(records: list) -> list:
+    return [(record.text, record.decision) for record in records if record.kind == DISPATCH]
+
+
+def api_sequence(records: list) -> list:
+    return [(record.api, record.args) for record in records if record.kind == API_CALL]
+
+
+def command_latencies(records: list) -> list:
+    """Для кожного рішення диспетчера — час до першого запиту до робота з тим самим correlation_id."""
+    dispatched, latencies = {}, []
+    for record in records:
+        if record.kind == DISPATCH and record.correlation_id:
+            dispatched.setdefault(record.correlation_id, record.ts)
+        elif record.kind == API_CALL and record.correlation_id in dispatched:
+            latencies.append(record.ts - dispatched.pop(record.correlation_id))
+    return latencies
+
+
+def _first_difference(recorded: list, replayed: list) -> Optional[int]:
+    for index, (expected, actual) in enumerate(zip(recorded, replayed)):
+        if expected != actual:
+            return index
+    return None if len(recorded) == len(replayed) else min(len(recorded), len(replayed))
+
+
+def _quantiles(values: list) -> str:
+    if not values:
+        return "—"
+    ordered = sorted(values)
+    p50 = ordered[len(ordered) // 2]
+    return f"p50 {p50 * 1e3:.1f} мс, макс {ordered[-1] * 1e3:.1f} мс ({len(ordered)})"
+
+
+class ReplayReport:
+    def __init__(self, recorded: list, replayed: list, unexpected: int, unused: int, speed: float):
+        self.recorded = recorded
+        self.replayed = replayed
+        self.unexpected = unexpected
+        self.unused = unused
+        self.speed = speed
+        self.dispatch_divergence = _first_difference(dispatch_sequence(recorded), dispatch_sequence(replayed))
+        self.api_divergence = _first_difference(api_sequence(recorded), api_sequence(replayed))
+
+    @property
+    def deterministic(self) -> bool:
+        return (self.dispatch_divergence is None and self.api_divergence is None
+                and not self.unexpected and not self.unused)
+
+    def _divergence(self, title: str, index: Optional[int], sequence) -> list:
+        if index is None:
+            return [f"{title}: збігаються"]
+        recorded, replayed = sequence(self.recorded), sequence(self.replayed)
+        expected = recorded[index] if index < len(recorded) else "—"
+        actual = replayed[index] if index < len(replayed) else "—"
+        return [f"{title}: розбіжність на #{index}: записано {expected}, відтворено {actual}"]
+
+    def summary(self) -> str:
+        lines = [
+            f"фраз: {sum(r.kind == SPEECH for r in self.recorded)}, "
+            f"запитів: записано {len(api_sequence(self.recorded))}, відтворено {len(api_sequence(self.replayed))}",
+        ]
+        lines += self._divergence("рішення диспетчера", self.dispatch_divergence, dispatch_sequence)
+        lines += self._divergence("запити до робота", self.api_divergence, api_sequence)
+        if self.unexpected or self.unused:
+            lines.append(f"незаписаних запитів: {self.unexpected}, невикористаних записів: {self.unused}")
+        lines.append(f"рішення -> перший запит, записано: {_quantiles(command_latencies(self.recorded))}")
+        lines.append(f"рішення -> перший запит, відтворено (x{self.speed:g}): "
+                     f"{_quantiles(command_latencies(self.replayed))}")
+        return "\n".join(lines)
+
+
+class _ReplayObserver:
+    """Замість ObserveSpeechRecognise: фрази з журналу передаються обробнику шини напряму."""
+
+    def __init__(self):
+        self.handler = None
+
+    def set_handler(self, handler):
+        self.handler = handler
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class JournalReplayer:
+    """
+    Відтворює сесію з журналу проти підміненого api_client.
+
+    ``api_client._attempt`` замінюється на версію, що для кожного типу запиту
+    повертає наступний записаний результат, тож повтори, запобіжник і журнал
+    працюють як зазвичай. Трекер TTS підміняється тимчасовим, щоб виміри
+    прискореного відтворення не потрапили в калібрування робота.
+    """
+
+    def __init__(self, path: str, speed: float = 1.0, output: Optional[str] = None,
+                 drain_timeout: float = DRAIN_TIMEOUT):
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.records = list(read_journal(path))
+        self.speed = speed
+        self.output = output
+        self.drain_timeout = drain_timeout
+        self.unexpected = 0
+        self._pending: dict = collections.defaultdict(collections.deque)
+        for attempt in recorded_attempts(self.records):
+            self._pending[attempt.api].append(attempt)
+
+    async def _attempt(self, block, api_name: str, deadline: float) -> tuple:
+        pending = self._pending.get(api_name)
+        if not pending:
+            self.unexpected += 1
+            logger.warning("REPLAY: Запиту %s немає в журналі, відповідаю успіхом.", api_name)
+            return (MiniApiResultType.Success, types.SimpleNamespace(isSuccess=True), None)
+        attempt = pending.popleft()
+        await asyncio.sleep(attempt.latency / self.speed)
+        return attempt.outcome()
+
+    async def _drain(self, listener):
+        if listener._tasks:
+            _, pending = await asyncio.wait(set(listener._tasks), timeout=self.drain_timeout)
+            for task in pending:
+                logger.warning("REPLAY: Обробка не завершилася за %.0f с, скасовую.", self.drain_timeout)
+                task.cancel()
+
+    async def run(self) -> ReplayReport:
+        from listeners import SpeechCommandListener
+
+        loop = asyncio.get_running_loop()
+        output = self.output or tempfile.mkdtemp(prefix="alpha_replay_")
+        observer = _ReplayObserver()
+        journal = get_journal()
+        saved = (api_client._attempt, api_client.create_speech_observer,
+                 tts_tracker._tracker, tts_tracker.IMMEDIATE_ACK_SECONDS, tts_tracker.MAX_SPEECH_CHARS_PER_SECOND)
+
+        api_client._attempt = self._attempt
+        api_client.create_speech_observer = lambda: observer
+        tts_tracker._tracker = tts_tracker.TtsCompletionTracker(
+            robot_id="replay", calibration_file=os.path.join(output, "tts_calibration.json"),
+            phrases=TtsPhraseCache(robot_id="replay", cache_file=os.path.join(output, "tts_phrases.json")),
+        )
+        tts_tracker.IMMEDIATE_ACK_SECONDS /= self.speed
+        tts_tracker.MAX_SPEECH_CHARS_PER_SECOND *= self.speed
+        get_circuit_breaker().reset()
+        journal.enable(output, prefix="replay")
+
+        listener = SpeechCommandListener(loop)
+        listener.start()
+        speech = [record for record in self.records if record.kind == SPEECH]
+        origin = speech[0].ts if speech else 0.0
+        started = loop.time()
+        logger.info("REPLAY: %s фраз, швидкість x%g, журнал відтворення: '%s'.", len(speech), self.speed, output)
+        try:
+            for record in speech:
+                delay = started + (record.ts - origin) / self.speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                observer.handler(types.SimpleNamespace(
+                    text=record.text, isSuccess=record.success == "1", resultCode=int(record.result_code or 0),
+                ))
+                await asyncio.sleep(0)
+            await self._drain(listener)
+        finally:
+            listener.stop()
+            get_speech_bus().stop()
+            journal.close()
+            (api_client._attempt, api_client.create_speech_observer,
+             tts_tracker._tracker, tts_tracker.IMMEDIATE_ACK_SECONDS, tts_tracker.MAX_SPEECH_CHARS_PER_SECOND) = saved
+
+        unused = sum(len(pending) for pending in self._pending.values())
+        return ReplayReport(self.records, list(read_journal(output)), self.unexpected, unused, self.speed)
+
+
+async def replay(path: str, speed: float = 1.0, output: Optional[str] = None) -> ReplayReport:
+    from alpha_mini_pkg.core import get_command_scheduler
+
+    try:
+        return await JournalReplayer(path, speed, output).run()
+    finally:
+        await get_command_scheduler().shutdown()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Replay an Alpha Mini session journal")
+    parser.add_argument("journal", help="сегмент журналу або каталог (найновіша сесія)")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--output", help="каталог для журналу відтворення")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format='[%(levelname)s] %(asctime)s - %(name)s: %(message)s')
+    report = asyncio.run(replay(args.journal, args.speed, args.output))
+    print(report.summary())
+    return 0 if report.deterministic else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
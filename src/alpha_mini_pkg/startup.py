@@ -0,0 +1,175 @@
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from alpha_mini_pkg.config import settings
+from alpha_mini_pkg.config.runtime import get_config
+from alpha_mini_pkg.services import connection_manager
+from alpha_mini_pkg.services.circuit_breaker import get_circuit_breaker
+from alpha_mini_pkg.services.connection_supervisor import ConnectionSupervisor, start_supervisor
+from alpha_mini_pkg.services.speech_bus import get_speech_bus
+from alpha_mini_pkg.utils.diagnostics import get_diagnostics
+from alpha_mini_pkg.utils.journal import get_journal
+from alpha_mini_pkg.utils.telemetry import get_telemetry
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    def __init__(self):
+        self._started = time.perf_counter()
+        self.phases: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - started
+
+    @property
+    def total(self) -> float:
+        return time.perf_counter() - self._started
+
+    def report(self) -> str:
+        parts = [f"{name} {seconds:.2f} с" for name, seconds in self.phases.items()]
+        return " | ".join(parts + [f"всього {self.total:.2f} с"])
+
+
+class StartupResult:
+    def __init__(self, device, listener, supervisor, timer: StartupTimer,
+                 telemetry_server: Optional[asyncio.AbstractServer] = None):
+        self.device = device
+        self.listener = listener
+        self.supervisor = supervisor
+        self.timer = timer
+        self.telemetry_server = telemetry_server
+
+    async def shutdown(self):
+        await get_config().stop_watching()
+        get_diagnostics().stop()
+        get_journal().close()
+        await self.supervisor.stop()
+        self.listener.stop()
+        get_speech_bus().stop()
+
+        from alpha_mini_pkg.services.tts_tracker import get_tts_tracker
+        await asyncio.get_running_loop().run_in_executor(None, get_tts_tracker().save)
+        if self.telemetry_server is not None:
+            self.telemetry_server.close()
+            await self.telemetry_server.wait_closed()
+        get_telemetry().disable()
+
+
+def _follow_robot_address(supervisor: ConnectionSupervisor):
+    """Нова адреса робота з конфігурації діє з наступного перепідключення."""
+    supervisor.address = settings.ROBOT_IP
+    supervisor.port = settings.ROBOT_PORT
+
+
+async def start_telemetry(supervisor: ConnectionSupervisor) -> Optional[asyncio.AbstractServer]:
+    """
+    Вмикає телеметрію гарячого шляху згідно з налаштуваннями та, якщо задано
+    порт, відкриває локальний ендпоінт Prometheus.
+    """
+    from alpha_mini_pkg.core.command_scheduler import Channel, get_command_scheduler
+    from alpha_mini_pkg.core.motion_planner import get_motion_planner
+
+    telemetry = get_telemetry()
+    telemetry.enable(settings.TELEMETRY_JSONL_FILE)
+    telemetry.register_collector(
+        lambda: {f"alpha_supervisor_{name}": value for name, value in supervisor.metrics.items()}
+    )
+    telemetry.register_collector(
+        lambda: {f"alpha_scheduler_pending_{channel.value}": get_command_scheduler().pending(channel)
+                 for channel in Channel}
+    )
+    telemetry.register_collector(
+        lambda: {f"alpha_circuit_{name}": value for name, value in get_circuit_breaker().metrics.items()}
+    )
+    telemetry.register_collector(
+        lambda: {f"alpha_motion_{name}": value for name, value in get_motion_planner().metrics.items()}
+    )
+    if get_diagnostics().running:
+        telemetry.register_collector(get_diagnostics().metrics)
+
+    if settings.TELEMETRY_PROMETHEUS_PORT is None:
+        return None
+    try:
+        return await telemetry.serve_prometheus(settings.TELEMETRY_PROMETHEUS_HOST, settings.TELEMETRY_PROMETHEUS_PORT)
+    except OSError as e:
+        logger.error(f"STARTUP: Не вдалося відкрити ендпоінт метрик: {e}")
+        return None
+
+
+async def start_platform(address: str | None = None, port: int | None = None,
+                         name: str = "AlphaMini_Manual") -> Optional[StartupResult]:
+    """
+    Запускає платформу: рукостискання з роботом і вхід у режим програмування
+    виконуються паралельно з підготовкою слухача, каталогу дій та обробників.
+    Слухач стартує лише після підтвердженої готовності робота.
+    """
+    from listeners import SpeechCommandListener
+
+    loop = asyncio.get_running_loop()
+    timer = StartupTimer()
+
+    with timer.phase("sdk_init"):
+        connection_manager.initialize_sdk()
+    if settings.JOURNAL_DIR:
+        get_journal().enable(settings.JOURNAL_DIR, prefix=name)
+
+    async def connect():
+        with timer.phase("connect"):
+            device = await connection_manager.open_connection(address, port, name)
+        if device:
+            with timer.phase("program_mode"):
+                await connection_manager.enter_program_mode()
+        return device
+
+    async def load_catalog():
+        from alpha_mini_pkg.services.action_catalog import get_action_catalog
+
+        with timer.phase("catalog"):
+            await loop.run_in_executor(None, get_action_catalog)
+
+    async def build_listener():
+        from alpha_mini_pkg.services.tts_tracker import get_tts_tracker
+
+        with timer.phase("handlers"):
+            get_tts_tracker().phrases.warm()
+            return SpeechCommandListener(loop)
+
+    device, _, listener = await asyncio.gather(
+        connect(),
+        load_catalog(),
+        build_listener(),
+    )
+
+    if not device:
+        logger.info(f"STARTUP: {timer.report()}")
+        return None
+
+    with timer.phase("listen"):
+        speech_bus = get_speech_bus()
+        speech_bus.start()
+        listener.start()
+        supervisor = start_supervisor(address, port, name)
+        supervisor.add_reconnect_hook(speech_bus.reattach)
+        supervisor.add_reconnect_hook(get_circuit_breaker().reset)
+        if address is None and port is None:
+            get_config().subscribe(lambda changes: _follow_robot_address(supervisor), keys=("ROBOT_IP", "ROBOT_PORT"))
+        get_config().start_watching()
+        if settings.DIAG_ENABLED:
+            get_diagnostics().start(name)
+
+    telemetry_server = None
+    if settings.TELEMETRY_ENABLED:
+        with timer.phase("telemetry"):
+            telemetry_server = await start_telemetry(supervisor)
+
+    logger.info(f"STARTUP: {timer.report()}")
+    return StartupResult(device, listener, supervisor, timer, telemetry_server)
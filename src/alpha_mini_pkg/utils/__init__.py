@@ -2,10 +2,16 @@
 
 # Ми не імпортуємо connect_robot або shutdown тут, 
 # оскільки вони знаходяться в services, а не в utils.
-# Цей файл можна залишити порожнім, або імпортувати загальні функції з helpers.
+# Загальні функції з helpers завантажуються під час першого звернення.
 
-from .helpers import safe_delay
+from alpha_mini_pkg.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    'safe_delay': '.helpers',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     'safe_delay',
-]
\ No newline at end of file
+]
@@ -0,0 +1,339 @@
+"""
+Діагностика циклу подій.
+
+Уся платформа працює в одному циклі asyncio, тож будь-який блокувальний
+виклик в обробнику команди чи алгоритмі зупиняє розпізнавання мовлення для
+всіх. ``LoopDiagnostics`` постійно вимірює затримку циклу, рахує задачі й
+друкує стек коду, що блокує цикл. Профілювальник вибірок вмикається й
+вимикається без перезапуску сесії:
+
+    python -m alpha_mini_pkg.utils.diagnostics profile <pid> --seconds 30
+    python -m alpha_mini_pkg.utils.diagnostics report <pid>
+
+Перша команда надсилає процесу SIGUSR2 (увімкнути), а через 30 с — ще раз
+(вимкнути й записати профіль), друга — SIGUSR1 (записати звіт у лог).
+Профіль — згорнуті стеки ("a;b;c 42" на рядок) для flamegraph.pl чи speedscope.
+"""
+import argparse
+import asyncio
+import collections
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+import traceback
+import weakref
+from typing import Optional
+
+from alpha_mini_pkg.config import settings
+from alpha_mini_pkg.utils.telemetry import get_telemetry
+
+logger = logging.getLogger(__name__)
+
+PROFILE_EXTENSION = ".folded"
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__") or os.path.basename(code.co_filename)
+    return f"{module}:{code.co_name}"
+
+
+def collapse_stack(frame) -> str:
+    """Стек кадру від кореня до листа у форматі згорнутих стеків: ``модуль:функція;...``."""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+def _coroutine_name(task: asyncio.Task) -> str:
+    coro = task.get_coro()
+    return getattr(coro, "__qualname__", None) or type(coro).__name__
+
+
+class SamplingProfiler:
+    """
+    Профілювальник вибірок одного потоку.
+
+    Фоновий потік кожні ``interval`` секунд знімає стек цільового потоку
+    через ``sys._current_frames()`` і рахує однакові стеки. Цільовий потік
+    не інструментується, тож профілювання майже не сповільнює цикл подій.
+    """
+
+    def __init__(self, thread_id: int, interval: Optional[float] = None):
+        self.thread_id = thread_id
+        self.interval = interval or settings.DIAG_PROFILE_INTERVAL
+        self.samples: collections.Counter = collections.Counter()
+        self.started_at = 0.0
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> "SamplingProfiler":
+        self.started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._sample, name="alpha-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples[collapse_stack(frame)] += 1
+            del frame
+
+    def stop(self) -> "SamplingProfiler":
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            self.duration = time.monotonic() - self.started_at
+        return self
+
+    def write(self, path: str) -> int:
+        """Записує згорнуті стеки у файл; повертає кількість вибірок."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+        return sum(self.samples.values())
+
+
+class LoopDiagnostics:
+    """
+    Постійна діагностика циклу подій.
+
+    Задача циклу кожні ``DIAG_LAG_INTERVAL`` секунд засинає й вимірює, на
+    скільки пізніше запланованого прокинулась: це затримка циклу. Сторожовий
+    потік стежить за цими пробудженнями; якщо їх немає довше, ніж
+    ``DIAG_SLOW_CALLBACK``, він знімає стек потоку циклу й пише його в лог —
+    видно саме той виклик, що блокує цикл.
+
+    Слухачі реєструють свої набори задач (``watch_tasks``) і відпускають їх
+    під час зупинки (``release_tasks``); задача, що лишилася незавершеною
+    через ``DIAG_TASK_LEAK_SECONDS`` після зупинки власника, вважається втраченою.
+    """
+
+    def __init__(self):
+        self.name = "session"
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self.stalls = 0
+        self.recent_stalls: collections.deque = collections.deque(maxlen=8)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread = 0
+        self._heartbeat = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop_watchdog = threading.Event()
+        self._signals: list = []
+        self._watched: list = []
+        self._released: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._profiler: Optional[SamplingProfiler] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    @property
+    def profiling(self) -> bool:
+        return self._profiler is not None
+
+    def start(self, name: str = "session"):
+        """Запускає вимірювання в поточному циклі подій; викликається з потоку циклу."""
+        if self.running:
+            return
+        self.name = name
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._task = self._loop.create_task(self._measure())
+        self._stop_watchdog.clear()
+        self._watchdog = threading.Thread(target=self._watch, name="alpha-loop-watchdog", daemon=True)
+        self._watchdog.start()
+        self._install_signals()
+        logger.info("DIAG: Діагностика циклу подій активна (pid %s).", os.getpid())
+
+    def stop(self):
+        if self._profiler is not None:
+            self.toggle_profiler()
+        for signum in self._signals:
+            self._loop.remove_signal_handler(signum)
+        self._signals = []
+        if self._watchdog is not None:
+            self._stop_watchdog.set()
+            self._watchdog.join()
+            self._watchdog = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+            logger.info("DIAG: %s", self.describe())
+
+    def _install_signals(self):
+        for name, callback in (("SIGUSR1", self.log_report), ("SIGUSR2", self.toggle_profiler)):
+            signum = getattr(signal, name, None)
+            if signum is None:
+                continue
+            try:
+                self._loop.add_signal_handler(signum, callback)
+            except (NotImplementedError, RuntimeError, ValueError) as e:
+                logger.debug("DIAG: Обробник %s не встановлено: %s", name, e)
+                continue
+            self._signals.append(signum)
+
+    async def _measure(self):
+        loop = asyncio.get_running_loop()
+        telemetry = get_telemetry()
+        while True:
+            expected = loop.time() + settings.DIAG_LAG_INTERVAL
+            await asyncio.sleep(settings.DIAG_LAG_INTERVAL)
+            self.lag = max(0.0, loop.time() - expected)
+            self._heartbeat = time.monotonic()
+            self.max_lag = max(self.max_lag, self.lag)
+            telemetry.observe("alpha_loop_lag_seconds", self.lag)
+            if self.lag > settings.DIAG_SLOW_CALLBACK:
+                telemetry.count("alpha_loop_stalls_total")
+                logger.warning("DIAG: Цикл подій відповів із затримкою %.0f мс.", self.lag * 1e3)
+
+    def _watch(self):
+        reported = None
+        while not self._stop_watchdog.wait(settings.DIAG_SLOW_CALLBACK / 2):
+            heartbeat = self._heartbeat
+            overdue = time.monotonic() - heartbeat - settings.DIAG_LAG_INTERVAL
+            if overdue <= settings.DIAG_SLOW_CALLBACK or reported == heartbeat:
+                continue
+            reported = heartbeat
+            frame = sys._current_frames().get(self._loop_thread)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+            del frame
+            self.stalls += 1
+            self.recent_stalls.append(stack)
+            logger.warning("DIAG: Цикл подій заблоковано понад %.0f мс, стек потоку циклу:\n%s",
+                           overdue * 1e3, stack)
+
+    def watch_tasks(self, owner: str, tasks: set):
+        """Реєструє набір задач, які власник створює й прибирає сам (наприклад, ``listener._tasks``)."""
+        self._watched.append((owner, tasks))
+
+    def release_tasks(self, tasks: set):
+        """Власник зупинився: його ще не завершені задачі відтепер перевіряються на втрату."""
+        now = time.monotonic()
+        for index, (owner, watched) in enumerate(self._watched):
+            if watched is tasks:
+                del self._watched[index]
+                for task in watched:
+                    if not task.done():
+                        self._released[task] = (owner, now)
+                return
+
+    def leaked_tasks(self) -> list:
+        now = time.monotonic()
+        return [
+            (owner, task) for task, (owner, released) in list(self._released.items())
+            if not task.done() and now - released > settings.DIAG_TASK_LEAK_SECONDS
+        ]
+
+    def tasks(self) -> dict:
+        """Кількість задач: усіх незавершених у циклі, зареєстрованих за власниками та втрачених."""
+        pending = asyncio.all_tasks(self._loop) if self._loop is not None and not self._loop.is_closed() else set()
+        tracked: dict = collections.Counter()
+        for owner, watched in self._watched:
+            tracked[owner] += len(watched)
+        return {"pending": len(pending), "tracked": dict(tracked), "leaked": len(self.leaked_tasks())}
+
+    def metrics(self) -> dict:
+        tasks = self.tasks()
+        values = {
+            "alpha_loop_lag_last_seconds": round(self.lag, 6),
+            "alpha_loop_lag_max_seconds": round(self.max_lag, 6),
+            "alpha_loop_blocked_total": self.stalls,
+            "alpha_tasks_pending": tasks["pending"],
+            "alpha_tasks_leaked": tasks["leaked"],
+            "alpha_profiler_running": int(self.profiling),
+        }
+        for owner, count in tasks["tracked"].items():
+            values[f"alpha_tasks_tracked_{owner}"] = count
+        return values
+
+    def describe(self) -> str:
+        tasks = self.tasks()
+        tracked = ", ".join(f"{owner}={count}" for owner, count in tasks["tracked"].items()) or "—"
+        return (f"затримка циклу {self.lag * 1e3:.1f} мс (макс {self.max_lag * 1e3:.1f} мс), "
+                f"блокувань {self.stalls}, задач {tasks['pending']}, слухачів: {tracked}, "
+                f"втрачено {tasks['leaked']}")
+
+    def log_report(self):
+        lines = [self.describe()]
+        if self._loop is not None:
+            names = collections.Counter(_coroutine_name(task) for task in asyncio.all_tasks(self._loop))
+            lines += [f"  {count:>4} × {name}" for name, count in names.most_common(10)]
+        for owner, task in self.leaked_tasks():
+            lines.append(f"  втрачено ({owner}): {task.get_name()} {_coroutine_name(task)}")
+        if self.recent_stalls:
+            lines.append("  останнє блокування:\n" + self.recent_stalls[-1])
+        logger.warning("DIAG: Звіт:\n%s", "\n".join(lines))
+
+    def toggle_profiler(self) -> Optional[str]:
+        """Запускає профілювальник або зупиняє його й записує профіль; повертає шлях до профілю."""
+        if self._profiler is None:
+            self._profiler = SamplingProfiler(self._loop_thread or threading.get_ident()).start()
+            logger.warning("DIAG: Профілювальник запущено (інтервал %.1f мс).", self._profiler.interval * 1e3)
+            return None
+
+        profiler, self._profiler = self._profiler.stop(), None
+        name = f"{self.name}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}{PROFILE_EXTENSION}"
+        path = os.path.join(settings.DIAG_PROFILE_DIR, name)
+        try:
+            samples = profiler.write(path)
+        except OSError as e:
+            logger.error("DIAG: Не вдалося записати профіль '%s': %s", path, e)
+            return None
+        logger.warning("DIAG: Профіль за %.1f с (%s вибірок) записано у '%s'.", profiler.duration, samples, path)
+        return path
+
+
+_diagnostics = LoopDiagnostics()
+
+
+def get_diagnostics() -> LoopDiagnostics:
+    return _diagnostics
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Control diagnostics of a running Alpha Mini platform")
+    commands = parser.add_subparsers(dest="command", required=True)
+    profile = commands.add_parser("profile", help="увімкнути або вимкнути профілювальник (SIGUSR2)")
+    profile.add_argument("pid", type=int)
+    profile.add_argument("--seconds", type=float, help="вимкнути й записати профіль через стільки секунд")
+    report = commands.add_parser("report", help="записати звіт діагностики в лог процесу (SIGUSR1)")
+    report.add_argument("pid", type=int)
+    args = parser.parse_args(argv)
+
+    if not hasattr(signal, "SIGUSR2"):
+        print("signals are not supported on this platform")
+        return 1
+    try:
+        if args.command == "report":
+            os.kill(args.pid, signal.SIGUSR1)
+            return 0
+        os.kill(args.pid, signal.SIGUSR2)
+        if args.seconds:
+            time.sleep(args.seconds)
+            os.kill(args.pid, signal.SIGUSR2)
+            print("profile written, see the platform log for its path")
+    except ProcessLookupError:
+        print(f"no process {args.pid}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -38,4 +38,36 @@ def estimate_tts_duration(text: str, chars_per_second: float = 6.67, base_time:
         return base_time
     
     estimated_time = (text_length / chars_per_second) + base_time
-    return estimated_time
\ No newline at end of file
+    return estimated_time
+
+def run_event_loop(coro):
+    """
+    Аналог asyncio.run(), стійкий до зупинки циклу подій з боку SDK.
+
+    Після ConnectionClosedOK websocket-клієнт SDK викликає loop.stop() через 3 с,
+    що обірвало б asyncio.run() саме тоді, коли супервізор відновлює з'єднання.
+    Тут цикл просто запускається знову, доки головна задача не завершиться.
+
+    :param coro: Головна корутина програми.
+    :return: Результат корутини.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    task = loop.create_task(coro)
+    try:
+        while not task.done():
+            try:
+                loop.run_until_complete(task)
+            except RuntimeError:
+                if task.done():
+                    raise
+                logger.warning("Цикл подій зупинено SDK після закриття з'єднання. Продовжуємо роботу.")
+        return task.result()
+    except KeyboardInterrupt:
+        task.cancel()
+        loop.run_until_complete(asyncio.gather(task, return_exceptions=True))
+        raise
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        asyncio.set_event_loop(None)
+        loop.close()
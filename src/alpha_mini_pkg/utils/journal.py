@@ -0,0 +1,255 @@
+import itertools
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"AMJ1"
+VERSION = 1
+EXTENSION = ".amj"
+
+# Заголовок сегмента: магічні байти, версія, час початку сесії (epoch).
+_FILE_HEADER = struct.Struct("<4sHd")
+# Заголовок запису: довжина даних, тип, секунди від початку сесії.
+_RECORD = struct.Struct("<IBd")
+_SEPARATOR = "\x1f"
+
+# Тип 0 не записується: нульові байти після останнього запису позначають кінець сегмента.
+SPEECH = 1
+DISPATCH = 2
+API_CALL = 3
+API_RESULT = 4
+
+FIELDS = {
+    SPEECH: ("text", "success", "result_code"),
+    DISPATCH: ("correlation_id", "text", "decision"),
+    API_CALL: ("call_id", "correlation_id", "api", "args"),
+    API_RESULT: ("call_id", "api", "result", "success", "reason"),
+}
+KIND_NAMES = {SPEECH: "speech", DISPATCH: "dispatch", API_CALL: "api_call", API_RESULT: "api_result"}
+
+
+class JournalRecord:
+    __slots__ = ("kind", "ts", "fields")
+
+    def __init__(self, kind: int, ts: float, fields: tuple):
+        self.kind = kind
+        self.ts = ts
+        self.fields = fields
+
+    @property
+    def name(self) -> str:
+        return KIND_NAMES.get(self.kind, str(self.kind))
+
+    def __getattr__(self, field: str):
+        names = FIELDS.get(self.kind, ())
+        if field in names:
+            index = names.index(field)
+            return self.fields[index] if index < len(self.fields) else ""
+        raise AttributeError(field)
+
+    def as_dict(self) -> dict:
+        entry = {"kind": self.name, "ts": round(self.ts, 6)}
+        entry.update(zip(FIELDS.get(self.kind, ()), self.fields))
+        return entry
+
+    def __repr__(self) -> str:
+        return f"JournalRecord({self.name}, {self.ts:.6f}, {self.fields})"
+
+
+def _flag(value) -> str:
+    return "1" if value else "0"
+
+
+class SessionJournal:
+    """
+    Журнал сесії у форматі "лише дописування".
+
+    Записує кожну розпізнану фразу, рішення диспетчера команд і кожну спробу
+    запиту до робота з результатом. Записи пишуться у відображений у пам'ять
+    (mmap) сегмент фіксованого розміру: запис — це ``struct.pack_into`` і
+    копіювання кількох десятків байтів, без системних викликів і без
+    форматування рядків. Дані потрапляють у кеш сторінок ОС одразу, тож
+    переживають аварійне завершення процесу.
+
+    Заповнений сегмент обрізається до фактичної довжини й закривається;
+    у каталозі лишається не більше ``max_segments`` найновіших сегментів.
+    Вимкнений журнал коштує одну перевірку прапорця.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.directory: Optional[str] = None
+        self.segment_bytes = 0
+        self.max_segments = 0
+        self.records = 0
+        self.rotations = 0
+        self._session = ""
+        self._index = 0
+        self._origin = 0.0
+        self._started_at = 0.0
+        self._path: Optional[str] = None
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._offset = 0
+        self._lock = threading.Lock()
+        self._call_ids = itertools.count(1)
+
+    @property
+    def path(self) -> Optional[str]:
+        return self._path
+
+    @property
+    def session(self) -> str:
+        """Ім'я сесії — префікс усіх її сегментів."""
+        return self._session
+
+    def enable(self, directory: str, segment_bytes: Optional[int] = None, max_segments: Optional[int] = None,
+               prefix: str = "session"):
+        from alpha_mini_pkg.config import settings
+
+        if self.enabled:
+            return
+        self.directory = directory
+        self.segment_bytes = segment_bytes or settings.JOURNAL_SEGMENT_BYTES
+        self.max_segments = max_segments or settings.JOURNAL_MAX_SEGMENTS
+        self._session = f"{prefix}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        self._index = 0
+        self._origin = time.perf_counter()
+        self._started_at = time.time()
+        os.makedirs(directory, exist_ok=True)
+        self._open_segment(self.segment_bytes)
+        self.enabled = True
+        logger.info("JOURNAL: Журнал сесії пишеться у '%s'.", directory)
+
+    def close(self):
+        with self._lock:
+            self.enabled = False
+            self._close_segment()
+
+    def _open_segment(self, size: int):
+        self._index += 1
+        self._path = os.path.join(self.directory, f"{self._session}-{self._index:04d}{EXTENSION}")
+        self._file = open(self._path, "w+b")
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+        _FILE_HEADER.pack_into(self._map, 0, MAGIC, VERSION, self._started_at)
+        self._offset = _FILE_HEADER.size
+
+    def _close_segment(self):
+        if self._map is None:
+            return
+        self._map.flush()
+        self._map.close()
+        self._map = None
+        self._file.truncate(self._offset)
+        self._file.close()
+        self._file = None
+
+    def _rotate(self, needed: int):
+        self._close_segment()
+        self.rotations += 1
+        self._open_segment(max(self.segment_bytes, _FILE_HEADER.size + needed))
+        self._prune()
+
+    def _prune(self):
+        # Лише сегменти цієї сесії: у спільному JOURNAL_DIR пишуть і інші процеси флоту.
+        segments = journal_segments(self.directory, self._session)
+        for name in segments[:max(0, len(segments) - self.max_segments)]:
+            try:
+                os.remove(name)
+            except OSError as e:
+                logger.warning("JOURNAL: Не вдалося видалити сегмент '%s': %s", name, e)
+
+    def _write(self, kind: int, fields: tuple):
+        payload = _SEPARATOR.join(fields).encode("utf-8")
+        size = _RECORD.size + len(payload)
+        with self._lock:
+            if self._map is None:
+                return
+            if self._offset + size > len(self._map):
+                self._rotate(size)
+            _RECORD.pack_into(self._map, self._offset, len(payload), kind, time.perf_counter() - self._origin)
+            start = self._offset + _RECORD.size
+            self._map[start:start + len(payload)] = payload
+            self._offset = start + len(payload)
+            self.records += 1
+
+    def speech(self, text: str, success: bool, result_code=0):
+        if self.enabled:
+            self._write(SPEECH, (text or "", _flag(success), str(result_code)))
+
+    def dispatch(self, correlation: Optional[str], text: str, decision: str):
+        if self.enabled:
+            self._write(DISPATCH, (correlation or "", text, decision))
+
+    def api_call(self, correlation: Optional[str], api: str, args: tuple = ()) -> int:
+        """Записує спробу запиту до робота; повертає її номер для ``api_result``."""
+        if not self.enabled:
+            return 0
+        call_id = next(self._call_ids)
+        self._write(API_CALL, (str(call_id), correlation or "", api, " ".join(map(str, args))))
+        return call_id
+
+    def api_result(self, call_id: int, api: str, result_type, response, reason: Optional[str]):
+        if self.enabled and call_id:
+            success = getattr(response, "isSuccess", False)
+            result = getattr(result_type, "name", "None")
+            self._write(API_RESULT, (str(call_id), api, result, _flag(success), reason or ""))
+
+
+def journal_segments(path: str, session: Optional[str] = None) -> list:
+    """
+    Сегменти журналу за шляхом: сам файл або всі сегменти сесії ``session``
+    (типово — найновішої) в каталозі, у порядку запису. Інші сесії в тому
+    самому каталозі не потрапляють у результат.
+    """
+    if not os.path.isdir(path):
+        return [path]
+    names = sorted(name for name in os.listdir(path) if name.endswith(EXTENSION))
+    if not names:
+        return []
+    if session is None:
+        latest = max(names, key=lambda name: os.path.getmtime(os.path.join(path, name)))
+        session = latest.rsplit("-", 1)[0]
+    return [os.path.join(path, name) for name in names if name.rsplit("-", 1)[0] == session]
+
+
+def read_segment(path: str) -> Iterator[JournalRecord]:
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < _FILE_HEADER.size:
+        return
+    magic, version, _ = _FILE_HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path}: not a session journal (magic={magic!r}, version={version})")
+
+    offset = _FILE_HEADER.size
+    while offset + _RECORD.size <= len(data):
+        length, kind, ts = _RECORD.unpack_from(data, offset)
+        if kind == 0:
+            break
+        start = offset + _RECORD.size
+        if start + length > len(data):
+            logger.warning("JOURNAL: Обрізаний запис наприкінці '%s'.", path)
+            break
+        yield JournalRecord(kind, ts, tuple(data[start:start + length].decode("utf-8").split(_SEPARATOR)))
+        offset = start + length
+
+
+def read_journal(path: str, session: Optional[str] = None) -> Iterator[JournalRecord]:
+    """Усі записи сесії з файлу сегмента або каталогу журналу."""
+    for segment in journal_segments(path, session):
+        yield from read_segment(segment)
+
+
+_journal = SessionJournal()
+
+
+def get_journal() -> SessionJournal:
+    return _journal
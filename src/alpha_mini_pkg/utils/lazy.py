@@ -0,0 +1,31 @@
+import importlib
+import sys
+
+
+def lazy_exports(package: str, exports: dict) -> tuple:
+    """
+    Повертає ``__getattr__`` і ``__dir__`` (PEP 562) для пакета, який
+    імпортує свої публічні імена лише під час першого звернення.
+
+    ``exports`` відображає ім'я на модуль, з якого його взяти: відносний
+    (".api_client") або абсолютний ("mini.apis.api_action")::
+
+        __getattr__, __dir__ = lazy_exports(__name__, {"move_robot": ".api_client"})
+
+    Завантажене значення кешується в просторі імен пакета, тож наступні
+    звернення не викликають ``__getattr__``.
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str):
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,125 @@
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+from typing import Iterable, Optional
+
+from alpha_mini_pkg.config import settings
+from alpha_mini_pkg.utils.telemetry import correlation_id
+
+TEXT_FORMAT = '[%(levelname)s] %(asctime)s - %(name)s: %(message)s'
+
+# Атрибути, які є в кожному LogRecord; решта потрапила туди через ``extra=``.
+_STANDARD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+class CorrelationFilter(logging.Filter):
+    """Додає до запису ідентифікатор запиту з контексту задачі, що його створила."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.correlation_id = correlation_id.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Пропускає лише кожен N-й DEBUG-запис балакучих логерів (``N = 1 / rate``).
+    Записи рівня INFO і вище та записи інших логерів проходять завжди.
+    """
+
+    def __init__(self, rate: float, loggers: Iterable[str]):
+        super().__init__()
+        self.every = max(1, round(1 / rate)) if rate > 0 else 0
+        self.prefixes = tuple(loggers)
+        self.suppressed = 0
+        self._seen: dict = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or not record.name.startswith(self.prefixes):
+            return True
+        if self.every == 0:
+            self.suppressed += 1
+            return False
+
+        seen = self._seen.get(record.name, 0)
+        self._seen[record.name] = seen + 1
+        if seen % self.every == 0:
+            return True
+        self.suppressed += 1
+        return False
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Кладе запис у чергу як є. На відміну від стандартного QueueHandler,
+    повідомлення не форматується в потоці циклу подій: ``msg % args`` та
+    серіалізація виконуються у фоновому потоці запису.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """Один запис — один рядок JSON з рівнем, логером, повідомленням і correlation_id."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        cid = getattr(record, "correlation_id", None)
+        if cid is not None:
+            entry["correlation_id"] = cid
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_ATTRS and key != "correlation_id":
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def configure_logging(level: Optional[int] = None, structured: Optional[bool] = None,
+                      path: Optional[str] = None, sample_rate: Optional[float] = None,
+                      sampled_loggers: Optional[Iterable[str]] = None
+                      ) -> Optional[logging.handlers.QueueListener]:
+    """
+    Налаштовує журнал платформи.
+
+    У звичайному режимі це ``logging.basicConfig`` з текстовим форматом. У
+    структурованому режимі кореневий логер отримує лише DeferredQueueHandler,
+    а фоновий QueueListener пише записи як JSON-рядки у ``path`` (або stderr).
+    Повертає запущений QueueListener, який треба зупинити під час завершення,
+    щоб дописати чергу. Параметри, яких не передано, беруться з config.settings.
+    """
+    level = settings.LOG_LEVEL if level is None else level
+    structured = settings.LOG_STRUCTURED if structured is None else structured
+    path = settings.LOG_FILE if path is None else path
+    sample_rate = settings.LOG_DEBUG_SAMPLE_RATE if sample_rate is None else sample_rate
+    sampled_loggers = settings.LOG_SAMPLED_LOGGERS if sampled_loggers is None else sampled_loggers
+
+    if not structured:
+        logging.basicConfig(level=level, format=TEXT_FORMAT)
+        return None
+
+    target = logging.FileHandler(path, encoding="utf-8") if path else logging.StreamHandler(sys.stderr)
+    target.setFormatter(JsonFormatter())
+
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    handler = DeferredQueueHandler(records)
+    handler.addFilter(CorrelationFilter())
+    if sample_rate < 1:
+        handler.addFilter(SamplingFilter(sample_rate, sampled_loggers))
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(level)
+
+    listener = logging.handlers.QueueListener(records, target, respect_handler_level=True)
+    listener.start()
+    return listener
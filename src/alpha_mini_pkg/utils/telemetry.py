@@ -0,0 +1,341 @@
+import asyncio
+import contextvars
+import itertools
+import json
+import logging
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_trace_ids = itertools.count(1)
+current_trace: contextvars.ContextVar = contextvars.ContextVar("alpha_mini_trace", default=None)
+# Ідентифікатор запиту для журналу ("command-42"); задається і з вимкненою телеметрією.
+correlation_id: contextvars.ContextVar = contextvars.ContextVar("alpha_mini_correlation", default=None)
+
+
+def _correlation(source: str, trace: Optional["Trace"]) -> str:
+    return f"{source}-{trace.id if trace is not None else next(_trace_ids)}"
+
+
+class Trace:
+    """Трасування однієї розпізнаної фрази від слухача до відповіді робота."""
+
+    __slots__ = ("id", "source", "text", "started", "finished", "acknowledged", "dropped", "failed")
+
+    def __init__(self, source: str = "command", text: str = "", started: Optional[float] = None):
+        self.id = next(_trace_ids)
+        self.source = source
+        self.text = text
+        self.started = time.perf_counter() if started is None else started
+        self.finished: Optional[float] = None
+        self.acknowledged = False
+        self.dropped = 0
+        self.failed = False
+
+    @property
+    def duration(self) -> Optional[float]:
+        return None if self.finished is None else self.finished - self.started
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("_telemetry", "stage", "labels", "started")
+
+    def __init__(self, telemetry: "Telemetry", stage: str, labels: dict):
+        self._telemetry = telemetry
+        self.stage = stage
+        self.labels = labels
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self.started
+        self._telemetry._finish_span(self, duration, exc_type is not None)
+        return False
+
+
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(key: tuple, extra: str = "") -> str:
+    parts = [f'{name}="{value}"' for name, value in key]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Telemetry:
+    """
+    Реєстр метрик і спанів гарячого шляху.
+
+    Вимкнена телеметрія повертає спільний порожній спан і нічого не рахує,
+    тож виклики в гарячому шляху коштують одну перевірку прапорця.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._histograms: dict = {}
+        self._counters: dict = {}
+        self._collectors: list = []
+        self._trace_listeners: list = []
+        self._jsonl = None
+
+    def enable(self, jsonl_path: Optional[str] = None):
+        self.enabled = True
+        if jsonl_path and self._jsonl is None:
+            self._jsonl = open(jsonl_path, "a", encoding="utf-8", buffering=1)
+            logger.info(f"TELEMETRY: Спани записуються у '{jsonl_path}'.")
+
+    def disable(self):
+        self.enabled = False
+        if self._jsonl is not None:
+            self._jsonl.close()
+            self._jsonl = None
+
+    def register_collector(self, collector: Callable[[], dict]):
+        self._collectors.append(collector)
+
+    def add_trace_listener(self, listener: Callable[[Trace], None]):
+        self._trace_listeners.append(listener)
+
+    def remove_trace_listener(self, listener: Callable[[Trace], None]):
+        if listener in self._trace_listeners:
+            self._trace_listeners.remove(listener)
+
+    def span(self, stage: str, **labels):
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, stage, labels)
+
+    def observe(self, name: str, value: float, **labels):
+        if not self.enabled:
+            return
+        key = (name, _label_key(labels))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = Histogram()
+        histogram.observe(value)
+
+    def count(self, name: str, amount: int = 1, **labels):
+        if not self.enabled:
+            return
+        key = (name, _label_key(labels))
+        self._counters[key] = self._counters.get(key, 0) + amount
+
+    def start_trace(self, source: str = "command", text: str = "",
+                    started: Optional[float] = None) -> Optional[Trace]:
+        if not self.enabled:
+            return None
+        return Trace(source, text, started)
+
+    def spawn(self, loop: asyncio.AbstractEventLoop, coro, source: str, text: str,
+              started: Optional[float] = None) -> asyncio.Task:
+        """Запускає обробку фрази як задачу з власним трасуванням."""
+        trace = self.start_trace(source, text, started)
+        token = current_trace.set(trace)
+        correlation_token = correlation_id.set(_correlation(source, trace))
+        try:
+            task = loop.create_task(coro)
+        finally:
+            correlation_id.reset(correlation_token)
+            current_trace.reset(token)
+        self.track(task, trace)
+        return task
+
+    def track(self, task: asyncio.Task, trace: Optional[Trace]):
+        """Завершує трасування ``trace``, коли завершиться задача, що обробляє фразу."""
+        if trace is not None:
+            task.add_done_callback(
+                lambda t: self._finish_trace(trace, t.cancelled() or t.exception() is not None)
+            )
+
+    @contextmanager
+    def traced(self, source: str, text: str, started: Optional[float] = None):
+        """Трасує обробку фрази, що виконується в поточній задачі."""
+        trace = self.start_trace(source, text, started)
+        correlation_token = correlation_id.set(_correlation(source, trace))
+        if trace is None:
+            try:
+                yield None
+            finally:
+                correlation_id.reset(correlation_token)
+            return
+        token = current_trace.set(trace)
+        failed = True
+        try:
+            yield trace
+            failed = False
+        finally:
+            current_trace.reset(token)
+            correlation_id.reset(correlation_token)
+            self._finish_trace(trace, failed)
+
+    def _finish_trace(self, trace: Trace, failed: bool):
+        trace.finished = time.perf_counter()
+        trace.failed = failed
+        self.observe("alpha_utterance_seconds", trace.finished - trace.started, source=trace.source)
+        if trace.dropped:
+            self.count("alpha_utterances_dropped_total", source=trace.source)
+        for listener in self._trace_listeners:
+            listener(trace)
+
+    def drop(self, channel: str):
+        """
+        Рахує команду, яку планувальник скасував до або під час виконання.
+        Викликається в контексті того, хто чекав на команду, тож скасування
+        зараховується трасуванню фрази, яка її породила.
+        """
+        if not self.enabled:
+            return
+        self.count("alpha_commands_dropped_total", channel=channel)
+        trace = current_trace.get()
+        if trace is not None:
+            trace.dropped += 1
+
+    def mark(self, stage: str):
+        """Фіксує, скільки часу минуло від розпізнавання фрази до етапу ``stage``."""
+        trace = current_trace.get()
+        if trace is None or not self.enabled:
+            return
+        self.observe("alpha_stage_seconds", time.perf_counter() - trace.started, stage=stage)
+
+    def acknowledge(self):
+        trace = current_trace.get()
+        if trace is None or trace.acknowledged or not self.enabled:
+            return
+        trace.acknowledged = True
+        self.observe("alpha_speech_to_ack_seconds", time.perf_counter() - trace.started)
+
+    def _finish_span(self, span: _Span, duration: float, failed: bool):
+        self.observe("alpha_stage_seconds", duration, stage=span.stage, **span.labels)
+        if failed:
+            self.count("alpha_stage_errors_total", stage=span.stage, **span.labels)
+
+        if self._jsonl is not None:
+            trace = current_trace.get()
+            record = {
+                "trace": trace.id if trace else None,
+                "stage": span.stage,
+                "labels": span.labels,
+                "start": span.started,
+                "duration": duration,
+                "error": failed,
+            }
+            self._jsonl.write(json.dumps(record) + "\n")
+
+    def snapshot(self) -> dict:
+        histograms = {}
+        for (name, key), h in self._histograms.items():
+            histograms.setdefault(name, []).append({
+                "labels": dict(key), "count": h.count, "sum": h.sum,
+                "p50": h.quantile(0.5), "p99": h.quantile(0.99),
+            })
+        counters = {}
+        for (name, key), value in self._counters.items():
+            counters.setdefault(name, []).append({"labels": dict(key), "value": value})
+        gauges = {}
+        for collector in self._collectors:
+            gauges.update(collector())
+        return {"histograms": histograms, "counters": counters, "gauges": gauges}
+
+    def render_prometheus(self) -> str:
+        lines = []
+        for name in sorted({name for name, _ in self._histograms}):
+            lines.append(f"# TYPE {name} histogram")
+            for (metric, key), h in self._histograms.items():
+                if metric != name:
+                    continue
+                cumulative = 0
+                for bound, count in zip(h.buckets + ("+Inf",), h.counts):
+                    cumulative += count
+                    le = 'le="%s"' % bound
+                    lines.append(f"{name}_bucket{_format_labels(key, le)} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(key)} {h.sum}")
+                lines.append(f"{name}_count{_format_labels(key)} {h.count}")
+
+        for name in sorted({name for name, _ in self._counters}):
+            lines.append(f"# TYPE {name} counter")
+            for (metric, key), value in self._counters.items():
+                if metric == name:
+                    lines.append(f"{name}{_format_labels(key)} {value}")
+
+        for collector in self._collectors:
+            for name, value in collector().items():
+                lines.append(f"# TYPE {name} gauge")
+                lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+    async def serve_prometheus(self, host: str = "127.0.0.1", port: int = 9108) -> asyncio.AbstractServer:
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+            try:
+                await reader.readuntil(b"\r\n\r\n")
+                body = self.render_prometheus().encode("utf-8")
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\n"
+                    b"Content-Type: text/plain; version=0.0.4\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode("ascii")
+                    + body
+                )
+                await writer.drain()
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                pass
+            finally:
+                writer.close()
+
+        server = await asyncio.start_server(handle, host, port)
+        logger.info(f"TELEMETRY: Метрики Prometheus доступні на http://{host}:{port}/metrics")
+        return server
+
+
+_telemetry = Telemetry()
+
+
+def get_telemetry() -> Telemetry:
+    return _telemetry
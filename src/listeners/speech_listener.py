@@ -1,42 +1,60 @@
 import asyncio
 import logging
-from mini.apis.api_observe import ObserveSpeechRecognise, SpeechRecogniseResponse
-from alpha_mini_pkg.core import robot_command_handler
-from alpha_mini_pkg.core.actions_wrapper import get_speech_listener_observer 
+from typing import Optional
+from alpha_mini_pkg.core.command_handler import get_command_handler
+from alpha_mini_pkg.services.speech_bus import SpeechSubscription, Utterance, get_speech_bus
+from alpha_mini_pkg.utils.diagnostics import get_diagnostics
+from alpha_mini_pkg.utils.telemetry import get_telemetry
 
 logger = logging.getLogger(__name__)
 
 class SpeechCommandListener:
     def __init__(self, main_loop: asyncio.AbstractEventLoop):
-        self._observer: ObserveSpeechRecognise = get_speech_listener_observer()
+        self._bus = get_speech_bus()
         self._loop = main_loop
+        self._subscription: Optional[SpeechSubscription] = None
+        self._consumer: Optional[asyncio.Task] = None
+        self._tasks: set = set()
         logger.info("LISTENER: Ініціалізовано SpeechCommandListener.")
 
-    def _handle_speech_sdk_response(self, msg: SpeechRecogniseResponse):
-        if msg.isSuccess and msg.text:
-            recognized_text = msg.text
-            logger.info(f"LISTENER: SDK розпізнано голос: '{recognized_text}'")
+    def _dispatch(self, utterance: Utterance):
+        logger.info("LISTENER: Отримано фразу: '%s'", utterance.text)
+        task = get_telemetry().spawn(
+            self._loop,
+            get_command_handler().handle_speech_command(utterance.text),
+            "command", utterance.text, utterance.received_at,
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
-            self._loop.create_task(
-                robot_command_handler.handle_speech_command(recognized_text)
-            )
-            
-        else:
-            logger.warning(f"LISTENER: Розпізнавання не вдалося. Код: {msg.resultCode}")
+    async def _consume(self, subscription: SpeechSubscription):
+        while True:
+            utterance = await subscription.get()
+            if utterance is None:
+                return
+            self._dispatch(utterance)
 
     def start(self):
         logger.info("LISTENER: Починаю прослуховування голосових команд...")
-        
-        self._observer.set_handler(self._handle_speech_sdk_response)
-        self._observer.start()
-        
+
+        self._bus.start()
+        self._subscription = self._bus.subscribe("commands")
+        self._consumer = self._loop.create_task(self._consume(self._subscription))
+        get_diagnostics().watch_tasks("listener", self._tasks)
+
         logger.info("Прослуховування активне. Готово до розпізнавання.")
 
+    def reattach(self):
+        self._bus.reattach()
+
     def stop(self):
-        self._observer.stop()
+        if self._subscription is not None:
+            self._subscription.close()
+            self._subscription = None
+            get_diagnostics().release_tasks(self._tasks)
         logger.info("Прослуховування голосових команд зупинено.")
 
 def start_listening(main_loop: asyncio.AbstractEventLoop) -> SpeechCommandListener:
     listener = SpeechCommandListener(main_loop)
     listener.start()
-    return listener
\ No newline at end of file
+    return listener
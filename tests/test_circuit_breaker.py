@@ -0,0 +1,70 @@
+"""
+Тести запобіжника запитів до робота, зокрема скасованого пробного запиту.
+
+Запуск: python -m pytest tests  (або python -m unittest discover tests)
+"""
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from alpha_mini_pkg.services import api_client, circuit_breaker  # noqa: E402
+from alpha_mini_pkg.services.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker  # noqa: E402
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def test_opens_after_threshold_and_allows_one_probe(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.0)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CLOSED)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, OPEN)
+
+        self.assertTrue(breaker.allow())
+        self.assertEqual(breaker.state, HALF_OPEN)
+        self.assertFalse(breaker.allow())
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, CLOSED)
+        self.assertTrue(breaker.allow())
+
+    def test_release_probe_lets_next_request_probe(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+        breaker.record_failure()
+        self.assertTrue(breaker.allow())
+        breaker.release_probe()
+        self.assertEqual(breaker.state, HALF_OPEN)
+        self.assertTrue(breaker.allow())
+
+
+class CancelledProbeTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self._saved = (circuit_breaker._breaker, api_client._attempt)
+        circuit_breaker._breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+
+        async def hang(block, api_name, deadline):
+            await asyncio.sleep(10)
+
+        api_client._attempt = hang
+
+    async def asyncTearDown(self):
+        circuit_breaker._breaker, api_client._attempt = self._saved
+
+    async def test_cancelled_probe_does_not_wedge_breaker(self):
+        breaker = circuit_breaker._breaker
+        breaker.record_failure()
+
+        probe = asyncio.ensure_future(api_client._execute(object(), "MoveRobot", 1.0))
+        await asyncio.sleep(0.01)
+        self.assertEqual(breaker.state, HALF_OPEN)
+        probe.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await probe
+
+        self.assertTrue(breaker.allow())
+
+
+if __name__ == "__main__":
+    unittest.main()
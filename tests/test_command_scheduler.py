@@ -0,0 +1,107 @@
+"""
+Тести планувальника команд: витіснення, об'єднання дублікатів, пріоритети
+і контекст подавача.
+
+Запуск: python -m pytest tests  (або python -m unittest discover tests)
+"""
+import asyncio
+import contextvars
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from alpha_mini_pkg.core.command_scheduler import (  # noqa: E402
+    PRIORITY_HIGH, Channel, CommandScheduler,
+)
+
+_caller = contextvars.ContextVar("caller", default=None)
+
+
+class CommandSchedulerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.scheduler = CommandScheduler(max_pending=3)
+        self.calls = []
+
+    async def asyncTearDown(self):
+        await self.scheduler.shutdown()
+
+    def command(self, name: str, delay: float = 0.0, result=True):
+        async def run():
+            self.calls.append(name)
+            await asyncio.sleep(delay)
+            return result
+        return run
+
+    def submit(self, name: str, delay: float = 0.0, **kwargs) -> asyncio.Task:
+        return asyncio.ensure_future(
+            self.scheduler.submit(Channel.MOTION, self.command(name, delay), label=name, **kwargs)
+        )
+
+    def worker(self, channel: Channel = Channel.MOTION) -> asyncio.Task:
+        return self.scheduler._channels()[channel]._worker
+
+    async def test_preempt_drops_pending_and_interrupts_current(self):
+        running = self.submit("walk 1", delay=1.0)
+        queued = self.submit("walk 2")
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(self.scheduler.preempt(Channel.MOTION), 2)
+        self.assertEqual(await asyncio.gather(running, queued), [False, False])
+        self.assertEqual(self.calls, ["walk 1"])
+
+        self.assertTrue(await self.submit("walk 3"))
+        self.assertEqual(self.calls, ["walk 1", "walk 3"])
+
+    async def test_worker_survives_cancelled_queue(self):
+        running = self.submit("walk 1", delay=0.05)
+        queued = self.submit("walk 2")
+        await asyncio.sleep(0.01)
+
+        self.scheduler._channels()[Channel.MOTION].cancel_pending(reason="stop")
+        self.assertFalse(await queued)
+        self.assertTrue(await running)
+        await asyncio.sleep(0.01)
+
+        worker = self.worker()
+        self.assertFalse(worker.done(), "воркер каналу не повинен завершуватись на порожній черзі")
+        self.assertEqual(self.scheduler.pending(Channel.MOTION), 0)
+
+    async def test_stop_coalesces_and_walks_do_not(self):
+        blocker = self.submit("walk 0", delay=0.05)
+        await asyncio.sleep(0.01)
+        stops = [self.submit("stop", key="stop") for _ in range(3)]
+        walks = [self.submit("walk 2") for _ in range(2)]
+
+        self.assertEqual(await asyncio.gather(blocker, *stops, *walks), [True] * 6)
+        self.assertEqual(self.calls, ["walk 0", "stop", "walk 2", "walk 2"])
+
+    async def test_high_priority_runs_first_and_overflow_drops_lowest(self):
+        blocker = self.submit("walk 0", delay=0.05)
+        await asyncio.sleep(0.01)
+        normal = [self.submit(f"walk {i}") for i in range(1, 4)]
+        await asyncio.sleep(0)
+        urgent = self.submit("stop", priority=PRIORITY_HIGH)
+
+        results = await asyncio.gather(blocker, *normal, urgent)
+        self.assertEqual(results, [True, True, True, False, True])
+        self.assertEqual(self.calls, ["walk 0", "stop", "walk 1", "walk 2"])
+
+    async def test_command_runs_in_submitter_context(self):
+        seen = []
+
+        async def record():
+            seen.append(_caller.get())
+            return True
+
+        async def submit_as(name: str):
+            _caller.set(name)
+            return await self.scheduler.submit(Channel.SPEECH, record, label=name)
+
+        await asyncio.gather(submit_as("first"), submit_as("second"))
+        self.assertEqual(seen, ["first", "second"])
+
+
+if __name__ == "__main__":
+    unittest.main()